@@ -1,9 +1,66 @@
 import json
+import os
+import sys
 import xml.etree.ElementTree as ET
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "KuroTools")) # Папка KuroTools (для lib)
+from lib.xliff_reader import iter_trans_units # Потоковое чтение XLIFF
+
+PATHS_SUFFIX = ".paths.json" # Карта {ID: [пути в JSON]}, которую сохраняет Parser.py
+JSON_INDENT = None           # None - компактный JSON (быстрая запись); 4 - с отступами, как раньше
+
+def load_path_map(json_filepath):
+    """Карта путей ID, сохраненная при извлечении, или None, если ее нет."""
+    paths_filepath = os.path.splitext(json_filepath)[0] + PATHS_SUFFIX
+    if not os.path.exists(paths_filepath):
+        return None
+    try:
+        with open(paths_filepath, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError) as e:
+        print(f"Предупреждение: Не удалось прочитать карту путей '{paths_filepath}', будет полный обход JSON: {e}")
+        return None
+
+def replace_by_paths(data, path_map, translation_map):
+    """
+    Подставляет переводы только по сохраненным путям (без обхода всего документа).
+    Возвращает (заменено, не найдено): путь не найден, если JSON изменился после извлечения.
+    """
+    replaced = 0
+    missing = 0
+    for text_id, paths in path_map.items():
+        text = translation_map.get(text_id)
+        if text is None:
+            continue
+        for path in paths:
+            try:
+                parent = data
+                for step in path[:-1]:
+                    parent = parent[step]
+                if parent[path[-1]] != text_id:
+                    missing += 1
+                    continue
+            except (KeyError, IndexError, TypeError):
+                missing += 1
+                continue
+            parent[path[-1]] = text
+            replaced += 1
+    return replaced, missing
+
+def write_json(json_filepath, data):
+    # json.dumps без отступов работает на C-кодировщике, json.dump в файл - нет
+    if JSON_INDENT is None:
+        text = json.dumps(data, ensure_ascii=False, separators=(',', ':'))
+    else:
+        text = json.dumps(data, ensure_ascii=False, indent=JSON_INDENT)
+    with open(json_filepath, 'w', encoding='utf-8') as f:
+        f.write(text)
 
 def replace_ids_with_translations(json_filepath, xliff_filepath):
     """
     Заменяет идентификаторы в JSON на текст из XLIFF.
+    Один ID может стоять в нескольких местах JSON (одинаковые тексты при извлечении сводятся в одну строку),
+    перевод подставляется во все вхождения. Если есть карта путей от Parser.py, посещаются только эти места,
+    иначе (или если карта устарела) JSON обходится целиком.
 
     Args:
         json_filepath: Путь к JSON файлу.
@@ -20,59 +77,57 @@ def replace_ids_with_translations(json_filepath, xliff_filepath):
         print(f"Ошибка при чтении JSON файла: {e}")
         return False
 
+    # Создаем словарь соответствия ID и переведенного текста (XLIFF читается потоково)
+    translation_map = {}
     try:
-        # Загрузка XLIFF файла
-        tree = ET.parse(xliff_filepath)
-        root = tree.getroot()
+        for unit in iter_trans_units(xliff_filepath):
+            # Если target пустой, берем текст из source
+            text = unit.target or unit.source
+            if text:
+                # Заменяем \\n на \n для корректного переноса строк
+                translation_map[unit.id] = text.replace("\\n", "\n")
     except (FileNotFoundError, ET.ParseError) as e:
         print(f"Ошибка при чтении XLIFF файла: {e}")
         return False
 
-    # Определяем namespace
-    namespaces = {'xliff': 'urn:oasis:names:tc:xliff:document:1.2'}
-
-    # Создаем словарь соответствия ID и переведенного текста
-    translation_map = {}
-    for trans_unit in root.findall(".//xliff:trans-unit", namespaces):
-        id = trans_unit.get("id")
-        source_element = trans_unit.find("xliff:source", namespaces)
-        target_element = trans_unit.find("xliff:target", namespaces)
-
-        # Если target пустой, берем текст из source
-        if target_element is not None and target_element.text:
-            # Заменяем \\n на \n для корректного переноса строк
-            translation_map[id] = target_element.text.replace("\\n", "\n")
-        elif source_element is not None and source_element.text:
-            # Заменяем \\n на \n для корректного переноса строк
-            translation_map[id] = source_element.text.replace("\\n", "\n")
+    replaced_count = 0
 
     def recursive_replace(obj):
         """Рекурсивно заменяет ID на переводы."""
+        nonlocal replaced_count
         if isinstance(obj, dict):
             for key, value in obj.items():
                 if isinstance(value, str) and value in translation_map:
                     obj[key] = translation_map[value]
+                    replaced_count += 1
                 elif isinstance(value, (dict, list)):
                     recursive_replace(value)
         elif isinstance(obj, list):
             for i, item in enumerate(obj):
                 if isinstance(item, str) and item in translation_map:
                     obj[i] = translation_map[item]
+                    replaced_count += 1
                 elif isinstance(item, (dict, list)):
                     recursive_replace(item)
 
     # Заменяем ID на текст
-    recursive_replace(data)
+    path_map = load_path_map(json_filepath)
+    if path_map is not None:
+        replaced_count, missing_count = replace_by_paths(data, path_map, translation_map)
+        if missing_count:
+            print(f"Предупреждение: Карта путей устарела (не найдено вхождений: {missing_count}), выполняется полный обход JSON.")
+            path_map = None
+    if path_map is None:
+        recursive_replace(data)
 
     # Записываем измененный JSON
     try:
-        with open(json_filepath, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=4, ensure_ascii=False)
+        write_json(json_filepath, data)
     except IOError as e:
         print(f"Ошибка при записи измененного JSON: {e}")
         return False
 
-    print("Замена ID на переводы завершена.")
+    print(f"Замена ID на переводы завершена. Строк в XLIFF: {len(translation_map)}, заменено вхождений: {replaced_count}.")
     return True
 
 # Пример использования
@@ -0,0 +1,363 @@
+import os
+import sys
+import glob
+import json
+import struct
+import argparse
+from decimal import Decimal
+from concurrent.futures import ProcessPoolExecutor
+
+# Чтение и запись .tbl Trails of Cold Steel 2 (text/dat_us) без tbled-v1.0.exe: JSON получается того же вида,
+# что и в "TBL JSON/JSON RU" ({"version", "headers", "entries": [{"header", "values"}]}, все значения - строки).
+#
+#    data = decode_tbl(open("t_item.tbl", "rb").read())
+#    tbl_bytes = encode_tbl(data)
+#
+# Формат (little-endian): u16 кол-во записей, u32 кол-во заголовков, заголовки (имя\0 + u32 кол-во записей),
+# затем записи (имя заголовка\0 + u16 длина + данные). Данные записи разбираются по схеме из SCHEMAS;
+# записи с неизвестным заголовком сохраняются как есть: {"data": hex}.
+
+# --- Конфигурация ---
+MAX_WORKERS = None # Процессов для пакетной обработки файлов (None = по числу ядер, 1 = без пула)
+JSON_INDENT = 4    # Как в JSON от tbled
+JSON_VERSION = "v2"
+# --------------------
+
+INT_FORMATS = {
+    "u8": struct.Struct("<B"), "s8": struct.Struct("<b"),
+    "u16": struct.Struct("<H"), "s16": struct.Struct("<h"),
+    "u32": struct.Struct("<I"), "s32": struct.Struct("<i"),
+}
+FLOAT = struct.Struct("<f")
+U16 = INT_FORMATS["u16"]
+U32 = INT_FORMATS["u32"]
+
+def effects(count):
+    # effects[1] id, effects[1] data[1..3], effects[2] id, ...
+    fields = []
+    for i in range(1, count + 1):
+        fields.append((f"effects[{i}] id", "u8"))
+        fields.extend((f"effects[{i}] data[{j}]", "u32") for j in range(1, 4))
+    return fields
+
+def fields_of(names, kind):
+    return [(name, kind) for name in names]
+
+# Схемы записей: (имя поля, тип). Типы: u8/s8/u16/s16/u32/s32, f32, str (UTF-8 до \0), ("hex", длина в байтах).
+# Порядок полей совпадает с порядком ключей в JSON от tbled.
+ITEM_STATS = ["str", "def", "ats", "adf", "acc", "eva", "spd", "mov", "hp", "ep"]
+STATUS_EFFICACY = ["earth", "water", "fire", "wind", "time", "space", "mirage", "psn", "seal", "mute", "blnd", "slp", "burn",
+                   "frz", "petr", "fnt", "conf", "dblw", "nmr", "dlay", "vnsh", "s_dwn"]
+STATUS_SEPITH = ["earth_sepith_growth", "water_sepith_growth", "fire_sepith_growth", "wind_sepith_growth", "time_sepith_growth",
+                 "space_sepith_growth", "mirage_sepith_growth", "sepith_mass_growth"]
+COOK_SKILLS = ["rean", "alisa", "elliot", "laura", "machias", "emma", "jusis", "fie", "gaius", "millium", "crow", "sara",
+               "angelica", "elise", "sharon", "claire", "toval", "towa", "alfin"]
+JUMP_STRINGS = [("unknown_string_1", "str"), ("unknown_string_2", "str")]
+
+SCHEMAS = {
+    "ActiveVoiceTableData": [("unknown_short_1", "u16"), ("unknown_short_2", "u16"), ("unknown_short_3", "u16"), ("portrait", "str"),
+                             ("id", "u16"), ("character", "s16"), ("text", "str"), ("unknown_float_1", "f32"), ("unknown_float_2", "f32"),
+                             ("unknown_data", ("hex", 10))],
+    "dlc": [("id", "u16"), ("unknown_data_1", ("hex", 10)), ("name", "str"), ("description", "str"), ("unknown_data_2", ("hex", 80))],
+    "hkitugi_lst": [("unknown_short", "u16"), ("unknown_data", ("hex", 2)), ("cost", "u16"), ("text", "str"), ("description", "str")],
+    "item": [("id", "u16"), ("character_restriction", "u16"), ("flags", "str"),
+             *fields_of(["type", "element", "target_type", "range", "area"], "u8"), *effects(2),
+             *fields_of(ITEM_STATS, "u16"), ("price", "u32"), ("carry_limit", "u8"), ("sort_id", "u16"), ("unknown_short", "s16"),
+             ("name", "str"), ("description", "str"), ("unknown_data_2", ("hex", 8))],
+    "item_q": [("id", "u16"), ("character_restriction", "u16"), ("flags", "str"),
+               *fields_of(["type", "element", "target_type", "rarity", "area"], "u8"), *effects(2),
+               *[(name, "s16" if name in ("def", "adf") else "u16") for name in ITEM_STATS],
+               ("price", "u32"), ("carry_limit", "u8"), ("sort_id", "u16"), ("unknown_short", "s16"),
+               ("name", "str"), ("description", "str"),
+               *fields_of(["prio_balanced", "prio_physical", "prio_magical", "prio_speed"], "u16"),
+               *fields_of([f"arts[{i}]" for i in range(1, 7)], "s16")],
+    "condition": [("id", "u16"), *effects(5)],
+    "ItemHelpData": [("effect", "u16"), ("text", "str"), ("unknown_data", ("hex", 9))],
+    "CompHelpData": [("type", "u16"), ("text", "str"), ("value", "u16")],
+    "MapJumpData": [("unknown_data_1", ("hex", 4)), ("name", "str"), ("unknown_data_2", ("hex", 4)), *JUMP_STRINGS,
+                    ("unknown_data_3", ("hex", 30))],
+    "CourageousJumpData": [("unknown_data_1", ("hex", 2)), ("name", "str"), ("unknown_data_2", ("hex", 8)), *JUMP_STRINGS,
+                           ("unknown_data_3", ("hex", 25))],
+    "magic": [("id", "u16"), ("character_restriction", "u16"), ("flags", "str"),
+              *fields_of(["category", "type", "element", "target_type", "target_range", "target_size"], "u8"), *effects(2),
+              ("cast_delay", "u8"), ("recovery_delay", "u8"), ("cost", "u16"), ("unknown_byte_1", "u8"), ("level_learn", "s8"),
+              ("sort_id", "u16"), ("animation", "str"), ("name", "str"), ("description", "str")],
+    "QSChapter": [("section_id", "s16"), ("section_name", "str"), ("unknown_short", "u16")],
+    "QSTitle": [("unknown_short", "u16"), ("unknown_byte", "u8"), ("title", "str"), ("persons", "str"), ("story_section", "u16"),
+                ("base_ap", "u8"), ("unknown_data", ("hex", 8))],
+    "QSText": [("id", "u16"), ("unknown_byte_1", "u8"), ("text", "str"), ("unknown_byte_2", "u8")],
+    "status": [("script", "str"), ("texture", "str"), ("model", "str"),
+               *fields_of(["model_scale", "camera_height", "hitbox_size", "unknown_float_1", "unknown_float_2", "unknown_float_3",
+                           "unknown_float_4"], "f32"),
+               ("unknown_short_1", "u16"), ("unknown_short_2", "u16"), ("is_female", "u8"), ("level", "u8"),
+               ("hp_base", "u32"), ("hp_growth", "f32"), *fields_of(["ep", "ep_start", "cp", "cp_start"], "u16"),
+               *[field for stat in ["str", "def", "ats", "adf", "dex", "agl", "spd", "mov", "exp"]
+                 for field in ((f"{stat}_base", "u16"), (f"{stat}_growth", "f32"))],
+               *fields_of([f"{name}_efficacy" for name in STATUS_EFFICACY], "u8"),
+               *fields_of(["slash_efficacy", "thrust_efficacy", "pierce_efficacy", "strike_efficacy"], "u16"),
+               *fields_of(STATUS_SEPITH, "f32"),
+               ("drop_id_1", "u16"), ("drop_chance_1", "u8"), ("drop_id_2", "u16"), ("drop_chance_2", "u8"),
+               ("stat_variation_min", "f32"), ("stat_variation_max", "f32"), ("flags", "str"), ("name", "str"), ("description", "str")],
+    "char_revise": [("char", "str"), *fields_of(["hp", "str", "def", "ats", "adf", "spd"], "u16")],
+    "NameTableData": [("character", "s16"), ("name", "str"), ("model", "str"), *fields_of([f"unknown_string_{i}" for i in range(1, 6)], "str"),
+                      ("unknown_data_1", ("hex", 17))],
+    "NaviTextData": [("id", "u16"), ("text", "str"), ("unknown_data_2", ("hex", 4))],
+    "QSChar": [("character", "u16"), ("section_id", "u16"), ("entries", "u16"),
+               *fields_of(["name_short", "name_long", "affiliation_short", "affiliation_long", "note_1_title", "note_1",
+                           "note_2_title", "note_2", "note_3_title", "note_3"], "str")],
+    "QSCook": [("regular_name", "str"), ("recipe_id", "u16"),
+               *[field for i in range(1, 9) for field in ((f"ingredients[{i}] item_id", "u16"), (f"ingredients[{i}] amount", "u16"))],
+               *[field for dish in ["superb", "regular", "peculiar", "unique"]
+                 for field in ((f"{dish} item_id", "u16"), (f"{dish} description_1", "str"), (f"{dish} description_2", "str"))],
+               *fields_of([f"skill_{name}" for name in COOK_SKILLS], "u8"), ("unknown_data_2", ("hex", 29))],
+    "QSCoolVoice": [("data", ("hex", 12))],
+    "QSFish": [("id", "u16"), ("is_valid", "u8"), ("name", "str"), ("fish_id", "u16"), ("rarity", "u16"),
+               *fields_of(["unknown_float_1", "unknown_float_2", "unknown_float_3"], "f32"), ("cp", "u32"),
+               *fields_of([f"availability[{i}]" for i in range(1, 5)], "u8"),
+               *fields_of(["weight_rod_1", "weight_rod_2", "weight_rod_3"], "u32"),
+               *fields_of(["chance_small", "chance_medium", "chance_large"], "u16"), ("base_points", "u32"), ("first_catch_points", "u32"),
+               *[field for size in ["small", "medium", "large"]
+                 for field in ((size, "u32"), (f"{size}_min_size", "f32"), (f"{size}_max_size", "f32"),
+                               (f"{size}_item_id", "u16"), (f"{size}_item_amount", "u16"))],
+               ("unknown_data_1", ("hex", 4)), ("description", "str"),
+               *[field for i in range(2, 9) for field in ((f"unknown_data_{i}", ("hex", 2)), (f"unknown_float_{i + 2}", "f32"))],
+               ("unknown_data_9", ("hex", 20))],
+    "QSHelp": [("unknown_short_1", "u16"), ("unknown_short_2", "u16"), ("text", "str")],
+    "QSMons": [("enemy", "str"), ("section_id", "u16"), ("enemy_id", "u16"), ("is_extra", "u16")],
+    "PlaceTableData": [("unknown_data_1", ("hex", 4)), *JUMP_STRINGS, ("unknown_data_2", ("hex", 4))],
+    "QSRank": [("id", "u16"), ("text", "str"), *fields_of(["unknown_int1", "unknown_int2", "unknown_int3"], "u16")],
+    "TextTableData": [("id", "u16"), ("text", "str")],
+}
+RAW_FIELD = "data" # Поле записи с неизвестным заголовком
+
+def format_float(raw):
+    """Кратчайшая запись float32, которая читается обратно в те же 4 байта, без экспоненты ('0.1', '10', '0')."""
+    value, = FLOAT.unpack(raw)
+    for precision in range(1, 10):
+        text = f"{value:.{precision}g}"
+        try:
+            if FLOAT.pack(float(text)) == raw:
+                break
+        except OverflowError:
+            continue
+    return format(Decimal(text), "f")
+
+def decode_values(schema, payload):
+    values = {}
+    pos = 0
+    for name, kind in schema:
+        if kind == "str":
+            end = payload.index(b"\0", pos)
+            values[name] = payload[pos:end].decode("utf-8")
+            pos = end + 1
+        elif kind == "f32":
+            values[name] = format_float(payload[pos:pos + 4])
+            pos += 4
+        elif isinstance(kind, tuple):
+            size = kind[1]
+            if pos + size > len(payload):
+                raise ValueError(f"поле '{name}' выходит за конец записи")
+            values[name] = payload[pos:pos + size].hex()
+            pos += size
+        else:
+            fmt = INT_FORMATS[kind]
+            values[name] = str(fmt.unpack_from(payload, pos)[0])
+            pos += fmt.size
+    if pos != len(payload):
+        raise ValueError(f"после разбора осталось {len(payload) - pos} байт")
+    return values
+
+def encode_values(schema, values):
+    parts = []
+    for name, kind in schema:
+        value = values[name]
+        if kind == "str":
+            parts.append(value.encode("utf-8") + b"\0")
+        elif kind == "f32":
+            parts.append(FLOAT.pack(float(value)))
+        elif isinstance(kind, tuple):
+            data = bytes.fromhex(value)
+            if len(data) != kind[1]:
+                raise ValueError(f"поле '{name}': ожидается {kind[1]} байт, получено {len(data)}")
+            parts.append(data)
+        else:
+            parts.append(INT_FORMATS[kind].pack(int(value)))
+    return b"".join(parts)
+
+def read_name(data, pos):
+    end = data.index(b"\0", pos)
+    return data[pos:end].decode("utf-8"), end + 1
+
+def decode_tbl(data):
+    """Байты .tbl -> словарь в формате JSON от tbled. Ошибки разбора - ValueError с номером записи."""
+    entry_count, = U16.unpack_from(data, 0)
+    header_count, = U32.unpack_from(data, 2)
+    pos = 6
+    headers = []
+    for _ in range(header_count):
+        name, pos = read_name(data, pos)
+        pos += U32.size # Кол-во записей заголовка, при записи считается заново
+        headers.append(name)
+
+    entries = []
+    for idx in range(entry_count):
+        try:
+            header, pos = read_name(data, pos)
+            length, = U16.unpack_from(data, pos)
+            pos += U16.size
+            payload = data[pos:pos + length]
+            if len(payload) != length:
+                raise ValueError("запись обрезана")
+            pos += length
+            schema = SCHEMAS.get(header)
+            values = decode_values(schema, payload) if schema is not None else {RAW_FIELD: payload.hex()}
+        except (ValueError, struct.error, UnicodeDecodeError) as e:
+            raise ValueError(f"запись {idx}: {e}") from e
+        entries.append({"header": header, "values": values})
+    return {"version": JSON_VERSION, "headers": headers, "entries": entries}
+
+def encode_tbl(data):
+    """Словарь в формате JSON от tbled -> байты .tbl. Ошибки - ValueError с номером записи."""
+    entries = data["entries"]
+    if len(entries) > 0xFFFF:
+        raise ValueError(f"слишком много записей: {len(entries)}")
+    counts = dict.fromkeys(data["headers"], 0)
+    body = []
+    for idx, entry in enumerate(entries):
+        header = entry["header"]
+        values = entry["values"]
+        try:
+            schema = SCHEMAS.get(header)
+            payload = encode_values(schema, values) if schema is not None else bytes.fromhex(values[RAW_FIELD])
+            if len(payload) > 0xFFFF:
+                raise ValueError(f"запись длиннее {0xFFFF} байт")
+        except (KeyError, ValueError, TypeError, struct.error) as e:
+            raise ValueError(f"запись {idx} ({header}): {type(e).__name__}: {e}") from e
+        counts[header] = counts.get(header, 0) + 1
+        body.append(header.encode("utf-8") + b"\0" + U16.pack(len(payload)) + payload)
+
+    parts = [U16.pack(len(entries)), U32.pack(len(counts))]
+    parts.extend(name.encode("utf-8") + b"\0" + U32.pack(count) for name, count in counts.items())
+    parts.extend(body)
+    return b"".join(parts)
+
+def dump_json(data):
+    # Тот же текст, что пишет tbled: отступ 4, кириллица как есть, без перевода строки в конце
+    return json.dumps(data, indent=JSON_INDENT, ensure_ascii=False)
+
+def convert_file(task):
+    """
+    Задача пула: (режим 'decode'/'encode', входной файл, выходной файл).
+    Возвращает (входной файл, выходной файл, ошибка или None); ошибки не выбрасываются, чтобы не останавливать остальные файлы.
+    """
+    mode, input_path, output_path = task
+    try:
+        if mode == "decode":
+            with open(input_path, "rb") as f:
+                text = dump_json(decode_tbl(f.read()))
+            with open(output_path, "w", encoding="utf-8", newline="") as f:
+                f.write(text)
+        else:
+            with open(input_path, "r", encoding="utf-8") as f:
+                tbl_bytes = encode_tbl(json.load(f))
+            with open(output_path, "wb") as f:
+                f.write(tbl_bytes)
+        return input_path, output_path, None
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        return input_path, output_path, f"{type(e).__name__}: {e}"
+
+def verify_file(task):
+    """
+    Задача пула: (файл .tbl, папка с эталонными JSON или None). Проверяет, что .tbl -> JSON -> .tbl дает те же байты,
+    а при наличии эталона - что JSON совпадает с ним по тексту и что эталон собирается в тот же .tbl.
+    Возвращает (файл, [расхождения], ошибка или None).
+    """
+    tbl_path, json_dir = task
+    problems = []
+    try:
+        with open(tbl_path, "rb") as f:
+            original = f.read()
+        data = decode_tbl(original)
+        if encode_tbl(data) != original:
+            problems.append("повторная сборка отличается от исходного .tbl")
+        if json_dir:
+            json_path = os.path.join(json_dir, os.path.splitext(os.path.basename(tbl_path))[0] + ".json")
+            if not os.path.exists(json_path):
+                problems.append(f"нет эталона {json_path}")
+            else:
+                with open(json_path, "r", encoding="utf-8") as f:
+                    reference_text = f.read()
+                if dump_json(data) != reference_text:
+                    problems.append("JSON отличается от эталона")
+                if encode_tbl(json.loads(reference_text)) != original:
+                    problems.append("эталонный JSON собирается в другой .tbl")
+        return tbl_path, problems, None
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        return tbl_path, problems, f"{type(e).__name__}: {e}"
+
+def run_tasks(func, tasks, max_workers=MAX_WORKERS):
+    """Выполняет задачи параллельно; результаты выдаются в порядке tasks."""
+    if max_workers == 1 or len(tasks) < 2:
+        for task in tasks:
+            yield func(task)
+        return
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        yield from executor.map(func, tasks)
+
+def collect_files(paths, extension):
+    """Файлы из списка путей; для папок берутся все файлы с расширением extension."""
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            files.extend(sorted(glob.glob(os.path.join(path, "*" + extension))))
+        else:
+            files.append(path)
+    return files
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Чтение и запись .tbl Trails of Cold Steel 2 (замена tbled-v1.0.exe).")
+    parser.add_argument("-j", "--jobs", type=int, default=MAX_WORKERS, help="Число процессов (по умолчанию по числу ядер, 1 = без пула).")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    decode_parser = subparsers.add_parser("decode", help=".tbl -> .json")
+    decode_parser.add_argument("paths", nargs="+", help="Файлы .tbl или папки с ними.")
+    decode_parser.add_argument("-o", "--output", default=None, help="Папка для JSON. По умолчанию рядом с .tbl.")
+
+    encode_parser = subparsers.add_parser("encode", help=".json -> .tbl")
+    encode_parser.add_argument("paths", nargs="+", help="Файлы .json или папки с ними.")
+    encode_parser.add_argument("-o", "--output", default=None, help="Папка для .tbl. По умолчанию рядом с JSON.")
+
+    verify_parser = subparsers.add_parser("verify", help="Проверить, что .tbl собирается обратно байт в байт.")
+    verify_parser.add_argument("paths", nargs="+", help="Файлы .tbl или папки с ними.")
+    verify_parser.add_argument("--json", default=None, help="Папка с эталонными JSON (например, 'TBL JSON/JSON RU').")
+
+    args = parser.parse_args()
+
+    failed = 0
+    if args.command == "verify":
+        tbl_files = collect_files(args.paths, ".tbl")
+        for tbl_path, problems, error in run_tasks(verify_file, [(path, args.json) for path in tbl_files], args.jobs):
+            if error:
+                print(f"ОШИБКА {tbl_path}: {error}")
+            for problem in problems:
+                print(f"РАСХОЖДЕНИЕ {tbl_path}: {problem}")
+            if error or problems:
+                failed += 1
+        print(f"Проверено файлов: {len(tbl_files)}, с ошибками: {failed}")
+    else:
+        extension, output_extension = (".tbl", ".json") if args.command == "decode" else (".json", ".tbl")
+        if args.output:
+            os.makedirs(args.output, exist_ok=True)
+        tasks = []
+        for input_path in collect_files(args.paths, extension):
+            output_dir = args.output or os.path.dirname(input_path)
+            output_name = os.path.splitext(os.path.basename(input_path))[0] + output_extension
+            tasks.append((args.command, input_path, os.path.join(output_dir, output_name)))
+        for input_path, output_path, error in run_tasks(convert_file, tasks, args.jobs):
+            if error:
+                print(f"ОШИБКА {input_path}: {error}")
+                failed += 1
+            else:
+                print(f"{input_path} -> {output_path}")
+        print(f"Готово: {len(tasks) - failed} из {len(tasks)}")
+    sys.exit(1 if failed else 0)
@@ -5,45 +5,32 @@ import os
 import sys
 import shutil
 import hashlib
-import lxml.etree
-import xml.etree.ElementTree as ET
-import openpyxl
-from openpyxl.utils import get_column_letter
-import xlwings as xw
 import re
 import subprocess
+import time
+import queue
 import threading
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "KuroTools")) # Папка KuroTools (lib, translation_memory, fuzzy_match)
+from lib.xliff_writer import XliffWriter # Потоковая запись XLIFF
+from lib.xliff_reader import iter_trans_units # Потоковое чтение XLIFF
+from xlsx_patcher import patch_workbooks # Запись в .xlsx без Excel
+from xlsx_dialogs import scan_workbooks # Параллельный потоковый поиск строк в .xlsx
+from process_runner import run_processes, summarize # Параллельный запуск SenScriptsDecompiler
 
 # --- КОНСТАНТЫ И НАСТРОЙКИ ---
 XLIFF_NAMESPACE_URI = "urn:oasis:names:tc:xliff:document:1.2"
-LXML_NS_MAP = {'xliff': XLIFF_NAMESPACE_URI}
 NOTE_FILE_REGEX = re.compile(r"^File:\s*(.+)$", re.IGNORECASE)
 EDITOR_SCRIPT_NAME = "xliff_editor_gui.py"
 DECOMPILER_EXE_NAME = "SenScriptsDecompiler.exe"
 DECOMPILED_FOLDER_NAME = "recompiled_files"
 COMPILED_SOURCE_FOLDER_NAME = "recompiled_files"
 FINAL_DAT_FOLDER_NAME = "complete_dat"
+LOG_POLL_MS = 50        # Как часто окно забирает новые строки лога из очереди
+LOG_BATCH_LINES = 500   # Строк лога за один проход (чтобы окно не замирало на большом выводе)
 
 # --- ОСНОВНЫЕ ФУНКЦИИ (ЛОГИКА) ---
 
-def run_external_process(command, log_callback):
-    try:
-        creationflags = subprocess.CREATE_NO_WINDOW if sys.platform == 'win32' else 0
-        process = subprocess.run(
-            command, capture_output=True, text=True, encoding='utf-8', 
-            errors='replace', creationflags=creationflags
-        )
-        if process.stdout: log_callback(process.stdout)
-        if process.stderr: log_callback(f"ОШИБКА ПРОЦЕССА: {process.stderr}")
-        return process.returncode == 0
-    except FileNotFoundError:
-        log_callback(f"КРИТИЧЕСКАЯ ОШИБКА: Файл '{command[0]}' не найден!")
-        return False
-    except Exception as e:
-        log_callback(f"КРИТИЧЕСКАЯ ОШИБКА при запуске процесса: {e}")
-        return False
-
-def decompile_dats(input_folder, log_callback):
+def decompile_dats(input_folder, log_callback, cancel_event):
     script_dir = os.path.dirname(os.path.abspath(sys.argv[0]))
     decompiler_path = os.path.join(script_dir, DECOMPILER_EXE_NAME)
     output_folder_path = os.path.join(script_dir, DECOMPILED_FOLDER_NAME)
@@ -57,16 +44,14 @@ def decompile_dats(input_folder, log_callback):
     log_callback(f"Найдено {len(dat_files)} .dat файлов. Начинаю декомпиляцию...")
     if not os.path.exists(output_folder_path):
         os.makedirs(output_folder_path)
-    success_count = 0
-    for filename in dat_files:
-        filepath = os.path.join(input_folder, filename)
-        log_callback(f"\n--- Декомпиляция: {filename} ---")
-        if run_external_process([decompiler_path, filepath], log_callback):
-            success_count += 1
-    log_callback(f"\n--- ДЕКОМПИЛЯЦИЯ ЗАВЕРШЕНА ---\nУспешно: {success_count} из {len(dat_files)}")
+    start_time = time.perf_counter()
+    jobs = [(filename, [decompiler_path, os.path.join(input_folder, filename)]) for filename in dat_files]
+    results = run_processes(jobs, log_callback, cancel_event=cancel_event)
+    success_count = sum(1 for r in results if r.returncode == 0)
+    log_callback(f"\n--- ДЕКОМПИЛЯЦИЯ {'ОТМЕНЕНА' if cancel_event.is_set() else 'ЗАВЕРШЕНА'} ---\n{summarize(results, time.perf_counter() - start_time)}")
     messagebox.showinfo("Готово", f"Декомпиляция завершена.\nУспешно: {success_count} из {len(dat_files)}.\nФайлы в папке '{DECOMPILED_FOLDER_NAME}'.")
 
-def compile_xlsx(log_callback):
+def compile_xlsx(log_callback, cancel_event):
     script_dir = os.path.dirname(os.path.abspath(sys.argv[0]))
     decompiler_path = os.path.join(script_dir, DECOMPILER_EXE_NAME)
     input_folder_path = os.path.join(script_dir, DECOMPILED_FOLDER_NAME)
@@ -81,13 +66,11 @@ def compile_xlsx(log_callback):
         messagebox.showinfo("Завершено", "Не найдены .xlsx файлы для сборки.")
         return
     log_callback(f"Найдено {len(xlsx_files)} .xlsx файлов. Начинаю сборку...")
-    success_count = 0
-    for filename in xlsx_files:
-        filepath = os.path.join(input_folder_path, filename)
-        log_callback(f"\n--- Сборка: {filename} ---")
-        if run_external_process([decompiler_path, filepath], log_callback):
-            success_count += 1
-    log_callback(f"\n--- СБОРКА ЗАВЕРШЕНА ---\nУспешно скомпилировано: {success_count} из {len(xlsx_files)}")
+    start_time = time.perf_counter()
+    jobs = [(filename, [decompiler_path, os.path.join(input_folder_path, filename)]) for filename in xlsx_files]
+    results = run_processes(jobs, log_callback, cancel_event=cancel_event)
+    success_count = sum(1 for r in results if r.returncode == 0)
+    log_callback(f"\n--- СБОРКА {'ОТМЕНЕНА' if cancel_event.is_set() else 'ЗАВЕРШЕНА'} ---\n{summarize(results, time.perf_counter() - start_time)}")
     log_callback("\n--- Перемещение скомпилированных .dat файлов ---")
     source_dat_folder = os.path.join(script_dir, COMPILED_SOURCE_FOLDER_NAME)
     dest_dat_folder = os.path.join(script_dir, FINAL_DAT_FOLDER_NAME)
@@ -124,55 +107,35 @@ def create_master_xliff(log_callback):
         messagebox.showerror("Ошибка", f"В папке '{DECOMPILED_FOLDER_NAME}' не найдены .xlsx файлы.")
         return
 
-    xliff_root = ET.Element("xliff", version="1.2", xmlns=XLIFF_NAMESPACE_URI)
-    file_element = ET.SubElement(xliff_root, "file", original="master_translation", source_language="en", target_language="ru", datatype="plaintext")
-    body_element = ET.SubElement(file_element, "body")
+    # trans-unit пишутся на диск по мере нахождения; файл создается при первой найденной строке
+    xliff_path = os.path.join(script_dir, 'translation.xliff')
+    writer = XliffWriter(xliff_path, original="master_translation", source_language="en", target_language="ru", datatype="plaintext")
     
     total_strings_found = 0
-    
-    for filename in xlsx_files:
+
+    # Книги сканируются параллельно, результаты приходят в порядке xlsx_files (ID зависят от порядка)
+    file_paths = [os.path.join(folder_path, filename) for filename in xlsx_files]
+    for file_path, texts, error in scan_workbooks(file_paths):
+        filename = os.path.basename(file_path)
         log_callback(f"-> Обрабатываю файл: {filename}")
-        file_path = os.path.join(folder_path, filename)
-        try:
-            workbook = openpyxl.load_workbook(file_path, read_only=True, data_only=True)
-            for sheet in workbook.worksheets:
-                data = list(sheet.values)
-                for row_idx, row_data in enumerate(data):
-                    if row_idx >= len(data) - 1: break
-                    for col_idx, cell_value in enumerate(row_data):
-                        if isinstance(cell_value, str) and cell_value.lower() == 'dialog':
-                            text_to_translate = data[row_idx + 1][col_idx]
-                            if isinstance(text_to_translate, str) and text_to_translate.strip():
-                                total_strings_found += 1 # Счётчик увеличивается для каждой новой строки
-                                
-                                col_letter = get_column_letter(col_idx + 1)
-                                row_number = row_idx + 2
-                                cell_address = f"{sheet.title}!{col_letter}{row_number}"
+        if error:
+            log_callback(f"Ошибка при обработке файла {filename}: {error}")
+            continue
+        for cell_address, text_to_translate in texts:
+            total_strings_found += 1 # Счётчик увеличивается для каждой новой строки
 
-                                # --- ИСПРАВЛЕНИЕ: Генерируем ID из текста, адреса, ИМЕНИ ФАЙЛА и уникального СЧЁТЧИКА ---
-                                unique_string_for_hash = f"{text_to_translate}|{cell_address}|{filename}|{total_strings_found}"
-                                trans_id = hashlib.sha1(unique_string_for_hash.encode('utf-8')).hexdigest()[:12]
-                                # --------------------------------------------------------------------------------------
+            # --- ИСПРАВЛЕНИЕ: Генерируем ID из текста, адреса, ИМЕНИ ФАЙЛА и уникального СЧЁТЧИКА ---
+            unique_string_for_hash = f"{text_to_translate}|{cell_address}|{filename}|{total_strings_found}"
+            trans_id = hashlib.sha1(unique_string_for_hash.encode('utf-8')).hexdigest()[:12]
+            # --------------------------------------------------------------------------------------
 
-                                trans_unit = ET.SubElement(body_element, "trans-unit", id=trans_id)
-                                trans_unit.set("resname", cell_address)
-                                
-                                note_element = ET.SubElement(trans_unit, "note")
-                                note_element.text = f"File: {filename}"
-                                
-                                source = ET.SubElement(trans_unit, "source")
-                                source.text = text_to_translate
-                                
-                                ET.SubElement(trans_unit, "target")
-        except Exception as e:
-            log_callback(f"Ошибка при обработке файла {filename}: {e}")
-            continue
+            if writer.file is None:
+                writer.open()
+            writer.write_unit(trans_id, text_to_translate, note=f"File: {filename}",
+                              attributes={"resname": cell_address})
             
+    writer.close()
     if total_strings_found > 0:
-        xliff_path = os.path.join(script_dir, 'translation.xliff')
-        tree = ET.ElementTree(xliff_root)
-        ET.indent(tree, space="  ", level=0) 
-        tree.write(xliff_path, encoding="utf-8", xml_declaration=True)
         log_callback(f"\nНайдено {total_strings_found} строк.\nУспешно создан файл: {xliff_path}")
         messagebox.showinfo("Готово", f"Создан файл 'translation.xliff' с {total_strings_found} строками.")
     else:
@@ -187,62 +150,52 @@ def apply_translation_from_xliff(xliff_path, log_callback):
         return
     log_callback("Начинаю операцию: Применение перевода...")
     try:
-        parser = lxml.etree.XMLParser(remove_blank_text=True)
-        tree = lxml.etree.parse(xliff_path, parser)
         translations = {}
-        for trans_unit in tree.xpath('//xliff:trans-unit', namespaces=LXML_NS_MAP):
-            target_tag = trans_unit.find('xliff:target', namespaces=LXML_NS_MAP)
-            resname = trans_unit.get('resname')
+        for unit in iter_trans_units(xliff_path): # Потоковое чтение, память не растет с размером файла
             file_origin = None
-            note_node = trans_unit.find('xliff:note', namespaces=LXML_NS_MAP)
-            if note_node is not None and note_node.text:
-                match = NOTE_FILE_REGEX.match(note_node.text.strip())
+            if unit.note:
+                match = NOTE_FILE_REGEX.match(unit.note.strip())
                 if match: file_origin = match.group(1).strip()
-            if target_tag is not None and target_tag.text and file_origin and resname:
-                target_text = target_tag.text.strip()
+            if unit.target and file_origin and unit.resname:
+                target_text = unit.target.strip()
                 if target_text:
                     if file_origin not in translations: translations[file_origin] = {}
-                    translations[file_origin][resname] = target_text
+                    translations[file_origin][unit.resname] = target_text
         if not translations:
             messagebox.showwarning("Внимание", "В XLIFF файле не найдено заполненных переводов.")
             return
     except Exception as e:
         messagebox.showerror("Ошибка", f"Не удалось прочитать XLIFF файл: {e}")
         return
-    app = None
     total_files = len(translations)
-    processed_files = 0
     log_callback(f"Найдено переводов для {total_files} файлов. Начинаю обновление...")
-    try:
-        app = xw.App(visible=False)
-        app.display_alerts = False
-        for filename, changes in sorted(translations.items()):
-            processed_files += 1
-            log_callback(f"({processed_files}/{total_files}) Обновляю файл: {filename}")
-            xlsx_path = os.path.join(folder_path, filename)
-            if not os.path.exists(xlsx_path):
-                log_callback(f"-> ПРЕДУПРЕЖДЕНИЕ: Файл {filename} не найден. Пропускаю.")
-                continue
-            shutil.copy(xlsx_path, xlsx_path + '.bak')
-            book = app.books.open(xlsx_path)
-            updated_count = 0
-            for cell_address, translated_text in changes.items():
-                try:
-                    sheet_name, cell_coord = cell_address.split('!', 1)
-                    sheet = book.sheets[sheet_name]
-                    sheet.range(cell_coord).value = translated_text
-                    updated_count += 1
-                except Exception as e:
-                    log_callback(f"-> Ошибка при обновлении ячейки {cell_address}: {e}")
-            book.save()
-            book.close()
-            log_callback(f"-> Сохранено. Обновлено {updated_count} строк.")
+    jobs = {}
+    for filename, changes in sorted(translations.items()):
+        xlsx_path = os.path.join(folder_path, filename)
+        if not os.path.exists(xlsx_path):
+            log_callback(f"-> ПРЕДУПРЕЖДЕНИЕ: Файл {filename} не найден. Пропускаю.")
+            continue
+        shutil.copy(xlsx_path, xlsx_path + '.bak')
+        jobs[xlsx_path] = changes
+    # Книги обновляются параллельно, каждая - за один проход по архиву (Excel не нужен)
+    processed_files = 0
+    failed_files = 0
+    for xlsx_path, updated_count, missing, error in patch_workbooks(jobs):
+        processed_files += 1
+        filename = os.path.basename(xlsx_path)
+        if error:
+            failed_files += 1
+            log_callback(f"({processed_files}/{len(jobs)}) ОШИБКА в файле {filename}: {error}")
+            continue
+        log_callback(f"({processed_files}/{len(jobs)}) {filename}: обновлено {updated_count} строк.")
+        for cell_address in missing:
+            log_callback(f"-> Ошибка при обновлении ячейки {cell_address}: ячейка не найдена")
+    if failed_files:
+        messagebox.showerror("Ошибка", f"Не удалось обновить файлов: {failed_files} из {len(jobs)}. Подробности в журнале.")
+        log_callback("\nОперация завершена с ошибками.")
+    else:
         messagebox.showinfo("Готово", "Все переводы успешно применены!")
         log_callback("\nОперация успешно завершена.")
-    except Exception as e:
-        messagebox.showerror("Критическая ошибка", f"Ошибка во время работы с Excel: {e}")
-    finally:
-        if app: app.quit()
 
 def launch_editor(log_callback):
     script_dir = os.path.dirname(os.path.abspath(sys.argv[0]))
@@ -289,20 +242,46 @@ class App(ctk.CTk):
         self.apply_button.pack(fill="x", padx=btn_padx, pady=btn_pady)
         self.compile_button = ctk.CTkButton(self.button_frame, text="5. Собрать в DAT", command=self.run_compile, font=button_font)
         self.compile_button.pack(fill="x", padx=btn_padx, pady=btn_pady)
+        self.cancel_button = ctk.CTkButton(self.button_frame, text="Отменить", command=self.cancel_processes, font=button_font,
+                                           fg_color="#8B2E2E", hover_color="#A33A3A")
+        self.cancel_button.pack(side="bottom", fill="x", padx=btn_padx, pady=(btn_pady, 15))
+        # Строки лога приходят из фоновых потоков и процессов через очередь, окно забирает их пачками
+        self.log_queue = queue.Queue()
+        self.cancel_event = threading.Event()
+        self.after(LOG_POLL_MS, self.flush_log)
 
     def log(self, message):
-        def _log():
+        self.log_queue.put(message)
+
+    def flush_log(self):
+        lines = []
+        try:
+            while len(lines) < LOG_BATCH_LINES:
+                lines.append(self.log_queue.get_nowait().strip())
+        except queue.Empty:
+            pass
+        if lines:
             self.log_textbox.configure(state="normal")
-            self.log_textbox.insert("end", message.strip() + "\n")
+            self.log_textbox.insert("end", "\n".join(lines) + "\n")
             self.log_textbox.configure(state="disabled")
             self.log_textbox.see("end")
-        self.after(0, _log)
+        self.after(LOG_POLL_MS, self.flush_log)
 
     def clear_log(self):
+        try:
+            while True:
+                self.log_queue.get_nowait()
+        except queue.Empty:
+            pass
         self.log_textbox.configure(state="normal")
         self.log_textbox.delete("1.0", "end")
         self.log_textbox.configure(state="disabled")
 
+    def cancel_processes(self):
+        if not self.cancel_event.is_set():
+            self.cancel_event.set()
+            self.log("Отмена: незапущенные файлы пропускаются, запущенные процессы завершаются...")
+
     def run_threaded(self, target_func, *args):
         thread = threading.Thread(target=target_func, args=args, daemon=True)
         thread.start()
@@ -312,11 +291,13 @@ class App(ctk.CTk):
         folder = filedialog.askdirectory(title="Выберите папку с .dat файлами для декомпиляции")
         if folder:
             self.log(f"Выбрана папка с DAT: {folder}")
-            self.run_threaded(decompile_dats, folder, self.log)
+            self.cancel_event.clear()
+            self.run_threaded(decompile_dats, folder, self.log, self.cancel_event)
 
     def run_compile(self):
         self.clear_log()
-        self.run_threaded(compile_xlsx, self.log)
+        self.cancel_event.clear()
+        self.run_threaded(compile_xlsx, self.log, self.cancel_event)
 
     def run_create_xliff(self):
         self.clear_log()
@@ -0,0 +1,98 @@
+import os
+import sys
+import time
+import threading
+import subprocess
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+# Параллельный запуск внешней программы (SenScriptsDecompiler) по одному процессу на файл.
+# Одновременно работает не больше max_workers процессов; каждый процесс обслуживает свой поток, который
+# читает его вывод построчно и передает в log_callback с меткой файла. log_callback вызывается из разных
+# потоков, поэтому он должен быть потокобезопасным (в TranslatorApp это очередь, которую разбирает окно).
+#
+#    results = run_processes([("a.dat", [exe, "a.dat"]), ...], print, cancel_event=event)
+#
+# Отмена (cancel_event.set()): не запущенные файлы пропускаются, запущенные процессы завершаются.
+
+# --- Конфигурация ---
+MAX_WORKERS = None   # Одновременно запущенных процессов (None = по числу ядер, 1 = по одному)
+POLL_INTERVAL = 0.2  # Секунд между проверками отмены
+# --------------------
+
+CREATION_FLAGS = subprocess.CREATE_NO_WINDOW if sys.platform == 'win32' else 0
+
+# returncode = None, если процесс не запускался (отмена до старта или ошибка запуска)
+ProcessResult = namedtuple("ProcessResult", ["label", "returncode", "elapsed", "cancelled"])
+
+def forward_lines(pipe, label, log_callback, prefix=""):
+    for line in pipe:
+        line = line.rstrip()
+        if line:
+            log_callback(f"[{label}] {prefix}{line}")
+    pipe.close()
+
+def run_process(label, command, log_callback, running, lock, cancel_event):
+    if cancel_event.is_set():
+        return ProcessResult(label, None, 0.0, True)
+    start_time = time.perf_counter()
+    try:
+        process = subprocess.Popen(
+            command, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True,
+            encoding='utf-8', errors='replace', creationflags=CREATION_FLAGS
+        )
+    except OSError as e:
+        log_callback(f"[{label}] КРИТИЧЕСКАЯ ОШИБКА при запуске '{command[0]}': {e}")
+        return ProcessResult(label, None, time.perf_counter() - start_time, False)
+    with lock:
+        running.add(process)
+    # stderr читается отдельным потоком, иначе процесс может встать на заполненном канале
+    stderr_thread = threading.Thread(target=forward_lines, args=(process.stderr, label, log_callback, "ОШИБКА ПРОЦЕССА: "), daemon=True)
+    stderr_thread.start()
+    forward_lines(process.stdout, label, log_callback)
+    stderr_thread.join()
+    returncode = process.wait()
+    with lock:
+        running.discard(process)
+    return ProcessResult(label, returncode, time.perf_counter() - start_time, cancel_event.is_set() and returncode != 0)
+
+def run_processes(jobs, log_callback, max_workers=MAX_WORKERS, cancel_event=None):
+    """
+    Запускает команды jobs [(метка, команда)] параллельно и пишет время каждого файла по завершении.
+    Возвращает [ProcessResult] в порядке jobs.
+    """
+    cancel_event = cancel_event or threading.Event()
+    running = set()
+    lock = threading.Lock()
+    terminated = set()
+    with ThreadPoolExecutor(max_workers=max_workers or os.cpu_count() or 1) as executor:
+        futures = [executor.submit(run_process, label, command, log_callback, running, lock, cancel_event) for label, command in jobs]
+        pending = set(futures)
+        while pending:
+            done, pending = wait(pending, timeout=POLL_INTERVAL, return_when=FIRST_COMPLETED)
+            for future in done:
+                result = future.result()
+                if result.returncode is None and result.cancelled:
+                    continue
+                if result.cancelled:
+                    status = "ОТМЕНЕН"
+                elif result.returncode == 0:
+                    status = "готово"
+                else:
+                    status = f"ОШИБКА (код {result.returncode})"
+                log_callback(f"[{result.label}] {status} за {result.elapsed:.2f} сек.")
+            if cancel_event.is_set():
+                with lock:
+                    for process in running - terminated:
+                        process.terminate()
+                        terminated.add(process)
+    return [future.result() for future in futures]
+
+def summarize(results, elapsed):
+    """Строка итога: успешно/ошибки/отменено и общее время против суммы времени по файлам."""
+    succeeded = sum(1 for r in results if r.returncode == 0)
+    cancelled = sum(1 for r in results if r.cancelled)
+    failed = len(results) - succeeded - cancelled
+    busy_time = sum(r.elapsed for r in results)
+    return (f"Успешно: {succeeded}, с ошибками: {failed}, отменено: {cancelled}. "
+            f"Время: {elapsed:.2f} сек. (сумма по файлам: {busy_time:.2f} сек.)")
@@ -1,9 +1,11 @@
 import openpyxl
-from openpyxl.utils import get_column_letter
-from lxml import etree
 import sys
 import os
 import hashlib
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__)))) # Папка SSD1_6 (xlsx_dialogs)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))), "KuroTools")) # Папка KuroTools (для lib)
+from lib.xliff_writer import XliffWriter # Потоковая запись XLIFF
+from xlsx_dialogs import iter_dialog_texts # Построчный поиск строк под 'dialog'
 
 def create_xliff_from_xlsx_fast(xlsx_path):
     print(f"Открываю файл: {os.path.basename(xlsx_path)}...")
@@ -15,63 +17,31 @@ def create_xliff_from_xlsx_fast(xlsx_path):
         input("Нажмите Enter для выхода.")
         return
 
-    # Настройки XLIFF
-    XLIFF_NS = "urn:oasis:names:tc:xliff:document:1.2"
-    root = etree.Element("xliff", version="1.2", nsmap={None: XLIFF_NS})
-    
-    file_element = etree.SubElement(root, "file", 
-                                    original=os.path.basename(xlsx_path),
-                                    source_language="en", 
-                                    target_language="ru",
-                                    datatype="plaintext")
-    body_element = etree.SubElement(file_element, "body")
+    # XLIFF пишется на диск по мере нахождения строк; файл создается при первой найденной строке
+    xliff_path = os.path.splitext(xlsx_path)[0] + '.xliff'
+    writer = XliffWriter(xliff_path,
+                         original=os.path.basename(xlsx_path),
+                         source_language="en",
+                         target_language="ru",
+                         datatype="plaintext")
     
     strings_found = 0
     print("Начинаю высокоскоростной анализ листов...")
 
-    # --- СВЕРХБЫСТРЫЙ МЕТОД ---
+    # Листы читаются построчно с просмотром на одну строку вперед, весь лист в память не загружается
     for sheet in workbook.worksheets:
         print(f"-> Анализ листа: {sheet.title}...")
-        # 1. Считываем ВСЕ данные с листа в память. Это одна быстрая операция.
-        # list() материализует генератор sheet.values в список списков
-        data = list(sheet.values)
-        
-        # 2. Проходим по данным в памяти. Это очень быстро.
-        for row_idx, row_data in enumerate(data):
-            # Останавливаемся на предпоследней строке, т.к. нам нужна следующая (row_idx + 1)
-            if row_idx >= len(data) - 1:
-                break
-            
-            # Ищем все ячейки с 'dialog' в текущей строке
-            for col_idx, cell_value in enumerate(row_data):
-                if isinstance(cell_value, str) and cell_value.lower() == 'dialog':
-                    # Нашли 'dialog'. Берем текст из строки ниже в той же колонке.
-                    text_to_translate = data[row_idx + 1][col_idx]
-                    
-                    if isinstance(text_to_translate, str) and text_to_translate.strip():
-                        strings_found += 1
-                        trans_id = hashlib.sha1(text_to_translate.encode('utf-8')).hexdigest()[:10]
-                        
-                        # Вычисляем адрес ячейки (индексы 0-based, адреса 1-based)
-                        col_letter = get_column_letter(col_idx + 1)
-                        # +2 потому что: +1 для перехода от 0-based к 1-based, и еще +1 т.к. нам нужна следующая строка
-                        row_number = row_idx + 2 
-                        cell_address = f"{sheet.title}!{col_letter}{row_number}"
-                        
-                        # Создаем элемент XLIFF
-                        trans_unit = etree.SubElement(body_element, "trans-unit", 
-                                                      id=trans_id,
-                                                      resname=cell_address)
-                        source = etree.SubElement(trans_unit, "source")
-                        source.text = text_to_translate
-                        target = etree.SubElement(trans_unit, "target")
-                        target.text = ""
+        for cell_address, text_to_translate in iter_dialog_texts(sheet):
+            strings_found += 1
+            trans_id = hashlib.sha1(text_to_translate.encode('utf-8')).hexdigest()[:10]
+
+            # Записываем trans-unit
+            if writer.file is None:
+                writer.open()
+            writer.write_unit(trans_id, text_to_translate, attributes={"resname": cell_address})
 
-    # Сохранение XLIFF файла
+    writer.close()
     if strings_found > 0:
-        xliff_path = os.path.splitext(xlsx_path)[0] + '.xliff'
-        tree = etree.ElementTree(root)
-        tree.write(xliff_path, pretty_print=True, xml_declaration=True, encoding='UTF-8')
         print(f"\nАнализ завершен. Найдено строк: {strings_found}")
         print(f"Файл XLIFF успешно создан: {os.path.basename(xliff_path)}")
     else:
@@ -1,8 +1,9 @@
-import xlwings as xw
 from lxml import etree
 import sys
 import os
 import shutil
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__)))) # Папка SSD1_6 (xlsx_patcher)
+from xlsx_patcher import patch_workbook, group_by_sheet # Запись в .xlsx без Excel
 
 def import_translation_via_excel(xliff_path):
     xlsx_path = os.path.splitext(xliff_path)[0] + '.xlsx'
@@ -50,50 +51,23 @@ def import_translation_via_excel(xliff_path):
         input("Нажмите Enter для выхода.")
         return
 
-    # 3. --- ГЛАВНОЕ ИЗМЕНЕНИЕ: Используем Excel для внесения правок ---
-    app = None
+    # 3. Правки вносятся прямо в XML листов внутри .xlsx (Excel не нужен), остальная разметка файла не трогается
     try:
-        print("3. Запускаю Excel в фоновом режиме для безопасного редактирования...")
-        # Запускаем Excel невидимо для пользователя
-        app = xw.App(visible=False)
-        # Отключаем любые предупреждения от Excel (например, "сохранить?")
-        app.display_alerts = False
-        
-        # Открываем книгу
-        book = app.books.open(xlsx_path)
-        
-        print(f"4. Вношу {len(translations)} изменений в файл...")
-        updated_count = 0
-        
-        for cell_address, translated_text in translations.items():
-            try:
-                sheet_name, cell_coord = cell_address.split('!', 1)
-                sheet = book.sheets[sheet_name]
-                # Напрямую меняем значение ячейки
-                sheet.range(cell_coord).value = translated_text
-                updated_count += 1
-            except Exception as e:
-                print(f"\nПредупреждение: не удалось обновить ячейку {cell_address}. Ошибка: {e}")
+        print(f"3. Вношу {len(translations)} изменений в файл...")
+        updated_count, missing = patch_workbook(xlsx_path, group_by_sheet(translations))
+        for cell_address in missing:
+            print(f"\nПредупреждение: не удалось обновить ячейку {cell_address}. Ячейка не найдена.")
 
-        # 5. Сохраняем и закрываем
         if updated_count > 0:
-            print("5. Сохраняю изменения через Excel...")
-            book.save()
-            book.close()
             print(f"\nУспешно обновлено {updated_count} строк.")
             print(f"Файл '{os.path.basename(xlsx_path)}' изменен без повреждения структуры.")
         else:
-            book.close()
             print("\nНе найдено ячеек для обновления.")
             os.remove(backup_path)
 
     except Exception as e:
         print(f"\nПроизошла критическая ошибка: {e}")
-        print("Возможно, у вас не установлен Excel, или файл защищен от записи.")
-    finally:
-        # Гарантированно закрываем процесс Excel, чтобы он не завис
-        if app:
-            app.quit()
+        print("Возможно, файл открыт в другой программе или защищен от записи.")
     
     input("\nРабота завершена. Нажмите Enter для выхода.")
 
@@ -0,0 +1,103 @@
+import os
+import sys
+import time
+import threading
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from process_runner import run_processes, summarize
+
+# Вместо SenScriptsDecompiler запускается маленький скрипт на Python:
+#   fake.py <имя> <пауза> [код возврата]
+# пишет две строки в stdout, при ненулевом коде - строку в stderr.
+FAKE_SCRIPT = """\
+import sys
+import time
+name, delay = sys.argv[1], float(sys.argv[2])
+code = int(sys.argv[3]) if len(sys.argv) > 3 else 0
+print(f"start {name}", flush=True)
+time.sleep(delay)
+print(f"end {name}", flush=True)
+if code:
+    print(f"broken {name}", file=sys.stderr, flush=True)
+sys.exit(code)
+"""
+
+class LogCollector(object):
+    """log_callback, который вызывается из разных потоков."""
+    def __init__(self):
+        self.lines = []
+        self.lock = threading.Lock()
+
+    def __call__(self, line):
+        with self.lock:
+            self.lines.append(line)
+
+@pytest.fixture
+def fake_script(tmp_path):
+    path = tmp_path / "fake.py"
+    path.write_text(FAKE_SCRIPT, encoding="utf-8")
+    return str(path)
+
+def job(fake_script, name, delay=0.0, code=0):
+    return name, [sys.executable, fake_script, name, str(delay), str(code)]
+
+def test_output_is_prefixed_with_label(fake_script):
+    log = LogCollector()
+    results = run_processes([job(fake_script, "a.dat"), job(fake_script, "b.dat", code=3)], log, max_workers=2)
+    assert [r.returncode for r in results] == [0, 3]
+    assert "[a.dat] start a.dat" in log.lines
+    assert "[a.dat] end a.dat" in log.lines
+    assert "[b.dat] ОШИБКА ПРОЦЕССА: broken b.dat" in log.lines
+    assert any(line.startswith("[a.dat] готово за ") for line in log.lines)
+    assert any(line.startswith("[b.dat] ОШИБКА (код 3) за ") for line in log.lines)
+
+def test_results_keep_job_order(fake_script):
+    # Первый файл завершается последним
+    jobs = [job(fake_script, "slow.dat", 0.6), job(fake_script, "fast1.dat"), job(fake_script, "fast2.dat")]
+    log = LogCollector()
+    results = run_processes(jobs, log, max_workers=3)
+    assert [r.label for r in results] == ["slow.dat", "fast1.dat", "fast2.dat"]
+    assert all(r.returncode == 0 and not r.cancelled for r in results)
+    finished = [line.split("]")[0][1:] for line in log.lines if " готово за " in line]
+    assert finished[-1] == "slow.dat"
+
+def test_nonzero_exit_code_is_reported(fake_script):
+    results = run_processes([job(fake_script, "bad.dat", code=2)], LogCollector())
+    assert results[0].returncode == 2
+    assert not results[0].cancelled
+    assert summarize(results, 1.0).startswith("Успешно: 0, с ошибками: 1, отменено: 0.")
+
+def test_missing_program_gives_no_returncode(tmp_path):
+    log = LogCollector()
+    missing = str(tmp_path / "SenScriptsDecompiler_missing.exe")
+    results = run_processes([("a.dat", [missing, "a.dat"])], log)
+    assert results[0].returncode is None
+    assert not results[0].cancelled
+    assert any(line.startswith("[a.dat] КРИТИЧЕСКАЯ ОШИБКА при запуске") for line in log.lines)
+
+def test_cancel_terminates_running_and_skips_unstarted(fake_script):
+    cancel_event = threading.Event()
+    log = LogCollector()
+
+    def log_callback(line):
+        log(line)
+        # Отмена, как только первый процесс начал работу
+        if line == "[first.dat] start first.dat":
+            cancel_event.set()
+
+    jobs = [job(fake_script, "first.dat", 30), job(fake_script, "second.dat", 30), job(fake_script, "third.dat", 30)]
+    start_time = time.perf_counter()
+    results = run_processes(jobs, log_callback, max_workers=1, cancel_event=cancel_event)
+    # Запущенный процесс завершен, а не дождались его 30 секунд
+    assert time.perf_counter() - start_time < 10
+    first, second, third = results
+    assert first.cancelled and first.returncode not in (None, 0)
+    assert "[first.dat] end first.dat" not in log.lines
+    assert any(line.startswith("[first.dat] ОТМЕНЕН за ") for line in log.lines)
+    for skipped in (second, third):
+        assert skipped.cancelled and skipped.returncode is None
+    assert not any(line.startswith(("[second.dat]", "[third.dat]")) for line in log.lines)
+    assert "отменено: 3" in summarize(results, 1.0)
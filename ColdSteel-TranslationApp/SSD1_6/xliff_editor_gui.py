@@ -52,6 +52,24 @@ except ImportError:
     DEFAULT_TRANSLATOR_SERVICE = None
 # --- /Deep Translator imports ---
 
+# --- Память переводов (translation_memory.py и fuzzy_match.py из папки KuroTools, одна копия на оба редактора) ---
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "KuroTools")) # Папка KuroTools (lib, translation_memory, fuzzy_match)
+try:
+    from translation_memory import TranslationMemory
+    TM_AVAILABLE = True
+except ImportError:
+    print(f"{Fore.YELLOW}Предупреждение: translation_memory.py не найден. Подстановка из памяти переводов будет недоступна.{Style.RESET_ALL}")
+    TranslationMemory = None
+    TM_AVAILABLE = False
+try:
+    from fuzzy_match import FuzzyIndex, FUZZY_THRESHOLD
+    FUZZY_AVAILABLE = True
+except ImportError:
+    print(f"{Fore.YELLOW}Предупреждение: fuzzy_match.py не найден. Будут подставляться только точные совпадения из памяти.{Style.RESET_ALL}")
+    FuzzyIndex = None
+    FUZZY_THRESHOLD = None
+    FUZZY_AVAILABLE = False
+
 # --- Конфигурация ---
 XLIFF_FILE_DEFAULT = "data_game_strings.xliff"
 BACKUP_SUFFIX = ".bak"
@@ -63,6 +81,7 @@ DEFAULT_STATUS_FILTER = "untranslated" # 'untranslated', 'translated', 'all'
 TRANSLATION_DELAY_SECONDS = 0.15
 NOTE_FILE_REGEX = re.compile(r"^File:\s*(.+)$", re.IGNORECASE)
 ALL_FILES_FILTER = "--- Все файлы ---"
+TM_DB_PATH = None # База памяти переводов (None = общая база, см. translation_memory.default_db_path)
 # --------------------
 
 # --- Mappings for MyMemory ---
@@ -127,6 +146,8 @@ class XliffEditorApp:
         self.current_font_size = 11         # Начальный размер шрифта редактора
         self.search_term = ""               # Текущий термин для поиска
         self.last_search_pos = "1.0"        # Последняя позиция поиска в тексте
+        self.translation_memory = None      # TranslationMemory, открывается при первом запросе
+        self.fuzzy_index = None             # FuzzyIndex по памяти переводов, строится при первом запросе
 
         # --- Переменные виджетов ---
         self.main_window = root # Alias for clarity in methods
@@ -136,6 +157,7 @@ class XliffEditorApp:
         self.markup_mode_button = None
         self.edit_mode_button = None
         self.translate_button = None
+        self.tm_button = None
         self.stats_button = None # Variable was present, creation was missing
         self.status_label = None
         self.page_label = None
@@ -229,6 +251,7 @@ class XliffEditorApp:
         if self.page_size_entry: self.page_size_entry.configure(state=tk.DISABLED)
         if self.page_size_button: self.page_size_button.configure(state=tk.DISABLED)
         if self.translate_button: self.translate_button.configure(state=tk.DISABLED)
+        if self.tm_button: self.tm_button.configure(state=tk.DISABLED)
         if self.stats_button: self.stats_button.configure(state=tk.DISABLED) # Reset stats button state
         if self.page_var: self.page_var.set("")
         if self.page_label: self.page_label.configure(text="Страница: - / -")
@@ -467,12 +490,14 @@ class XliffEditorApp:
         next_state = tk.NORMAL if has_content and self.current_page_index < num_pages - 1 else tk.DISABLED
         entry_state = tk.NORMAL if has_content else tk.DISABLED
         translate_state = tk.NORMAL if self.xliff_tree and TRANSLATION_AVAILABLE and self.current_page_units_map else tk.DISABLED
+        tm_state = tk.NORMAL if self.xliff_tree and TM_AVAILABLE and self.current_page_units_map else tk.DISABLED
 
         if self.prev_button: self.prev_button.configure(state=prev_state)
         if self.next_button: self.next_button.configure(state=next_state)
         if self.page_entry: self.page_entry.configure(state=entry_state)
         if self.go_button: self.go_button.configure(state=entry_state)
         if self.translate_button: self.translate_button.configure(state=translate_state)
+        if self.tm_button: self.tm_button.configure(state=tm_state)
 
         # Elements depending only on file load state
         general_state = tk.NORMAL if self.xliff_tree else tk.DISABLED
@@ -1103,6 +1128,79 @@ class XliffEditorApp:
             untranslated_count = sum(1 for status in self.unit_status_map.values() if status == 'untranslated')
             self.update_status(f"{final_status_part1} {final_status_part2} | Нет изменений. | Неперев.: {untranslated_count}")
 
+    def fill_from_translation_memory(self):
+        """
+        Заполняет пустые <target> на текущей странице из памяти переводов: сначала точные совпадения,
+        для остальных строк - лучшее нечеткое совпадение (fuzzy_match.py), помеченное на вычитку.
+        """
+        if not TM_AVAILABLE:
+            messagebox.showerror("Ошибка", "Память переводов недоступна (нет translation_memory.py).")
+            return
+        if not self.current_page_units_map:
+            messagebox.showinfo("Информация", "Нет строк на текущей странице (учитывая фильтры).")
+            return
+        # Правки в редакторе сначала сохраняются в память, иначе они пропадут при перерисовке страницы
+        if not self.save_current_page_data_if_dirty(prompt_save=False):
+            return
+        try:
+            if self.translation_memory is None:
+                self.translation_memory = TranslationMemory(TM_DB_PATH)
+            if FUZZY_AVAILABLE and self.fuzzy_index is None:
+                self.update_status("Построение индекса нечеткого поиска...")
+                self.root.update_idletasks()
+                self.fuzzy_index = FuzzyIndex.from_translation_memory(self.translation_memory)
+        except Exception as e:
+            messagebox.showerror("Ошибка", f"Не удалось открыть память переводов:\n{e}")
+            return
+
+        exact_count = 0
+        fuzzy_count = 0
+        checked_count = 0
+        for unit_id, unit in self.current_page_units_map.items():
+            if self.unit_status_map.get(unit_id) != 'untranslated':
+                continue
+            source_node = unit.find("xliff:source", namespaces=LXML_NSMAP)
+            source_text = "".join(source_node.itertext()).strip() if source_node is not None else ""
+            if not source_text:
+                continue
+            checked_count += 1
+            matches = self.translation_memory.lookup(source_text)
+            if matches:
+                translation = matches[0][0]
+                exact_count += 1
+            else:
+                found = self.fuzzy_index.search(source_text, FUZZY_THRESHOLD, limit=1) if self.fuzzy_index is not None else []
+                if not found:
+                    continue
+                translation = found[0][2]
+                fuzzy_count += 1
+            target_node = unit.find("xliff:target", namespaces=LXML_NSMAP)
+            if target_node is None:
+                target_node = ET.Element(f"{{{LXML_NSMAP['xliff']}}}target")
+                source_node.addnext(target_node)
+            target_node.clear()
+            target_node.text = translation
+            if matches:
+                target_node.set('state-qualifier', 'exact-match')
+            else:
+                target_node.set('state', 'needs-review-translation')
+                target_node.set('state-qualifier', 'fuzzy-match')
+            self.unit_status_map[unit_id] = self._is_unit_translated(unit)
+
+        filled_count = exact_count + fuzzy_count
+        print(f"Память переводов: заполнено {filled_count} из {checked_count} непереведенных строк на стр. {self.current_page_index + 1} "
+              f"(точных: {exact_count}, нечетких: {fuzzy_count}).")
+        if filled_count:
+            self.set_dirty_flag(True)
+            self._update_unit_statuses_and_filters()
+            self.apply_current_filters(reset_page=False)
+            inner_widget = self._get_inner_text_widget()
+            if inner_widget:
+                try: inner_widget.edit_modified(False)
+                except tk.TclError: pass
+        untranslated_count = sum(1 for status in self.unit_status_map.values() if status == 'untranslated')
+        self.update_status(f"Из памяти переводов: точных {exact_count}, нечетких {fuzzy_count} из {checked_count} | Неперев.: {untranslated_count}")
+
     # --- Функции фильтрации ---
 
     def on_file_filter_change(self, event=None):
@@ -1737,6 +1835,10 @@ class XliffEditorApp:
         else:
             self.translator_combobox.configure(state=tk.DISABLED)
             self.translate_button.configure(state=tk.DISABLED, text="Перевод (N/A)")
+        self.tm_button = ctk.CTkButton(translate_group, text="Из памяти", command=self.fill_from_translation_memory, width=90)
+        self.tm_button.pack(side=tk.LEFT, padx=(3, 0))
+        if not TM_AVAILABLE:
+            self.tm_button.configure(state=tk.DISABLED, text="Память (N/A)")
 
         # Font Group
         font_group = ctk.CTkFrame(left_controls, fg_color="transparent")
@@ -0,0 +1,49 @@
+from concurrent.futures import ProcessPoolExecutor
+import openpyxl
+from openpyxl.utils import get_column_letter
+
+# Поиск текста для перевода в .xlsx от SenScriptsDecompiler: реплика стоит в ячейке под ячейкой 'dialog'.
+# Листы читаются построчно (read_only) с просмотром на одну строку вперед: в памяти только столбцы
+# с 'dialog' из предыдущей строки, а не весь лист. Книги сканируются параллельно в пуле процессов.
+
+# --- Конфигурация ---
+DIALOG_MARKER = "dialog" # Значение ячейки над текстом (без учета регистра)
+MAX_WORKERS = None       # Процессов для сканирования книг (None = по числу ядер, 1 = без пула)
+# --------------------
+
+def iter_dialog_texts(sheet):
+    """(адрес 'Лист!B5', текст) для каждой непустой ячейки под ячейкой 'dialog', сверху вниз."""
+    marker_columns = []
+    row_number = 0
+    for row in sheet.iter_rows(values_only=True):
+        row_number += 1
+        for col_idx in marker_columns:
+            text = row[col_idx] if col_idx < len(row) else None
+            if isinstance(text, str) and text.strip():
+                yield f"{sheet.title}!{get_column_letter(col_idx + 1)}{row_number}", text
+        marker_columns = [col_idx for col_idx, value in enumerate(row)
+                          if isinstance(value, str) and value.lower() == DIALOG_MARKER]
+
+def scan_workbook(file_path):
+    """Все тексты книги: (путь, [(адрес, текст)], ошибка или None). Ошибка возвращается, а не выбрасывается (для пула)."""
+    try:
+        workbook = openpyxl.load_workbook(file_path, read_only=True, data_only=True)
+        try:
+            texts = [entry for sheet in workbook.worksheets for entry in iter_dialog_texts(sheet)]
+        finally:
+            workbook.close()
+        return file_path, texts, None
+    except Exception as e:
+        return file_path, [], str(e)
+
+def scan_workbooks(file_paths, max_workers=MAX_WORKERS):
+    """
+    Сканирует книги параллельно. Результаты выдаются в порядке file_paths, поэтому
+    содержимое XLIFF (и ID, зависящие от порядка) не зависит от числа процессов.
+    """
+    if max_workers == 1 or len(file_paths) < 2:
+        for file_path in file_paths:
+            yield scan_workbook(file_path)
+        return
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        yield from executor.map(scan_workbook, file_paths)
@@ -0,0 +1,176 @@
+import os
+import re
+import zipfile
+import posixpath
+import xml.etree.ElementTree as ET
+from xml.sax.saxutils import escape
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+# Запись переводов в .xlsx без Excel (и без openpyxl): файл - это zip с XML, поэтому меняются только
+# XML нужных листов и таблица общих строк, все остальные части архива копируются байт в байт.
+# Оформление, ширины столбцов и прочая разметка, которую ждет SenScriptsDecompiler, не пересохраняются.
+#
+#    patch_workbook("a.xlsx", {"Sheet1": {"B5": "Перевод"}})
+#
+# Новые строки дописываются в конец sharedStrings.xml (как это делает Excel), ячейка получает t="s".
+# Ячейки, которых нет в листе, не создаются: они возвращаются в списке missing.
+
+# --- Конфигурация ---
+MAX_WORKERS = None # Процессов для параллельной обработки книг (None = по числу ядер, 1 = без пула)
+# --------------------
+
+MAIN_NS = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+REL_NS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+PACKAGE_REL_NS = "http://schemas.openxmlformats.org/package/2006/relationships"
+SHARED_STRINGS_TYPE = REL_NS + "/sharedStrings"
+
+# <c ...>...</c> или <c .../>; внутри ячейки нет вложенных <c>, поэтому нежадного совпадения достаточно
+CELL_RE = re.compile(r'<c\b([^>]*?)(?:/>|>(.*?)</c>)', re.S)
+ATTRIBUTE_RE = re.compile(r'\s([\w:]+)\s*=\s*("[^"]*"|\'[^\']*\')')
+COUNT_ATTRIBUTE_RE = re.compile(r'\b(count|uniqueCount)="(\d+)"')
+SST_START_RE = re.compile(r'<(?:\w+:)?sst\b[^>]*>')
+CLOSING_SST_RE = re.compile(r'</(?:\w+:)?sst>\s*$')
+
+def split_cell_address(cell_address):
+    """'Sheet1!B5' -> ('Sheet1', 'B5'). Имя листа может быть в кавычках."""
+    sheet_name, cell_coord = cell_address.rsplit('!', 1)
+    if len(sheet_name) > 1 and sheet_name[0] == sheet_name[-1] == "'":
+        sheet_name = sheet_name[1:-1].replace("''", "'")
+    return sheet_name, cell_coord.replace("$", "").upper()
+
+def resolve_target(base_dir, target):
+    if target.startswith("/"):
+        return target.lstrip("/")
+    return posixpath.normpath(posixpath.join(base_dir, target))
+
+def read_workbook_parts(archive):
+    """({имя листа: путь XML в архиве}, путь sharedStrings.xml или None)."""
+    workbook = ET.fromstring(archive.read("xl/workbook.xml"))
+    rels = ET.fromstring(archive.read("xl/_rels/workbook.xml.rels"))
+    targets = {}
+    shared_strings_path = None
+    for rel in rels.iter(f"{{{PACKAGE_REL_NS}}}Relationship"):
+        path = resolve_target("xl", rel.get("Target"))
+        targets[rel.get("Id")] = path
+        if rel.get("Type") == SHARED_STRINGS_TYPE:
+            shared_strings_path = path
+    sheets = {}
+    for sheet in workbook.iter(f"{{{MAIN_NS}}}sheet"):
+        rel_id = sheet.get(f"{{{REL_NS}}}id")
+        if rel_id in targets:
+            sheets[sheet.get("name")] = targets[rel_id]
+    return sheets, shared_strings_path
+
+def text_element(text):
+    # Пробелы по краям и переносы строк сохраняются только с xml:space="preserve"
+    return f'<t xml:space="preserve">{escape(text)}</t>'
+
+class SharedStrings(object):
+    """Дописывает строки в конец sharedStrings.xml, не разбирая и не пересохраняя существующие."""
+    def __init__(self, xml_bytes):
+        self.xml = xml_bytes.decode("utf-8")
+        self.count = len(ET.fromstring(xml_bytes).findall(f"{{{MAIN_NS}}}si"))
+        self.added = []
+
+    def add(self, text):
+        self.added.append(f"<si>{text_element(text)}</si>")
+        self.count += 1
+        return self.count - 1
+
+    def to_bytes(self):
+        added = len(self.added)
+        end = CLOSING_SST_RE.search(self.xml).start()
+        start = SST_START_RE.search(self.xml)
+        # count - число ссылок на строки, uniqueCount - число <si>; новые ячейки добавляют по одной ссылке
+        start_tag = COUNT_ATTRIBUTE_RE.sub(lambda m: f'{m.group(1)}="{int(m.group(2)) + added}"', start.group(0))
+        xml = self.xml[:start.start()] + start_tag + self.xml[start.end():end] + "".join(self.added) + self.xml[end:]
+        return xml.encode("utf-8")
+
+def patch_sheet_xml(xml_bytes, updates, shared_strings):
+    """Заменяет значения ячеек {координата: текст}. Возвращает (новый XML, список обновленных координат)."""
+    updated = []
+
+    def replace_cell(match):
+        attributes = ATTRIBUTE_RE.findall(match.group(1))
+        coord = next((value[1:-1] for name, value in attributes if name == "r"), None)
+        if coord not in updates:
+            return match.group(0)
+        text = updates[coord]
+        kept = "".join(f" {name}={value}" for name, value in attributes if name != "t")
+        updated.append(coord)
+        if shared_strings is not None:
+            return f'<c{kept} t="s"><v>{shared_strings.add(text)}</v></c>'
+        return f'<c{kept} t="inlineStr"><is>{text_element(text)}</is></c>'
+
+    xml = CELL_RE.sub(replace_cell, xml_bytes.decode("utf-8"))
+    return xml.encode("utf-8"), updated
+
+def patch_workbook(xlsx_path, sheet_updates):
+    """
+    Записывает тексты в ячейки книги за один проход по архиву.
+    sheet_updates: {имя листа: {координата: текст}}.
+    Возвращает (кол-во обновленных ячеек, список ненайденных адресов 'Лист!A1').
+    """
+    missing = []
+    replaced_parts = {}
+    with zipfile.ZipFile(xlsx_path) as archive:
+        sheets, shared_strings_path = read_workbook_parts(archive)
+        shared_strings = SharedStrings(archive.read(shared_strings_path)) if shared_strings_path else None
+        updated_count = 0
+        for sheet_name, updates in sheet_updates.items():
+            sheet_path = sheets.get(sheet_name)
+            if sheet_path is None:
+                missing.extend(f"{sheet_name}!{coord}" for coord in updates)
+                continue
+            xml, updated = patch_sheet_xml(archive.read(sheet_path), updates, shared_strings)
+            replaced_parts[sheet_path] = xml
+            updated_count += len(updated)
+            updated_set = set(updated)
+            missing.extend(f"{sheet_name}!{coord}" for coord in updates if coord not in updated_set)
+        if not updated_count:
+            return 0, missing
+        if shared_strings is not None and shared_strings.added:
+            replaced_parts[shared_strings_path] = shared_strings.to_bytes()
+
+        # Новый архив пишется рядом и подменяет старый только целиком
+        temp_path = xlsx_path + ".tmp"
+        with zipfile.ZipFile(temp_path, "w") as output:
+            for info in archive.infolist():
+                data = replaced_parts.get(info.filename)
+                if data is None:
+                    data = archive.read(info.filename)
+                output.writestr(info, data, compress_type=info.compress_type)
+    os.replace(temp_path, xlsx_path)
+    return updated_count, missing
+
+def group_by_sheet(translations):
+    """{'Лист!A1': текст} -> {лист: {координата: текст}}."""
+    sheet_updates = {}
+    for cell_address, text in translations.items():
+        sheet_name, cell_coord = split_cell_address(cell_address)
+        sheet_updates.setdefault(sheet_name, {})[cell_coord] = text
+    return sheet_updates
+
+def patch_workbook_task(xlsx_path, translations):
+    """Задача пула: ошибки возвращаются строкой, чтобы одна испорченная книга не останавливала остальные."""
+    try:
+        updated_count, missing = patch_workbook(xlsx_path, group_by_sheet(translations))
+        return xlsx_path, updated_count, missing, None
+    except (OSError, zipfile.BadZipFile, ET.ParseError, KeyError, ValueError, AttributeError) as e:
+        if os.path.exists(xlsx_path + ".tmp"):
+            os.remove(xlsx_path + ".tmp")
+        return xlsx_path, 0, [], f"{type(e).__name__}: {e}"
+
+def patch_workbooks(jobs, max_workers=MAX_WORKERS):
+    """
+    Обрабатывает книги параллельно. jobs: {путь .xlsx: {'Лист!A1': текст}}.
+    Выдает (путь, обновлено, ненайденные адреса, ошибка или None) по мере готовности.
+    """
+    if max_workers == 1 or len(jobs) < 2:
+        for xlsx_path, translations in jobs.items():
+            yield patch_workbook_task(xlsx_path, translations)
+        return
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(patch_workbook_task, xlsx_path, translations) for xlsx_path, translations in jobs.items()]
+        for future in as_completed(futures):
+            yield future.result()
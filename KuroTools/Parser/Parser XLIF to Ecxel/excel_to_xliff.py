@@ -1,15 +1,10 @@
 import pandas as pd # type: ignore
-import xml.etree.ElementTree as ET
-from xml.dom import minidom # Для красивого форматирования XML
 import argparse
 import math # Для проверки на NaN
-
-def prettify_xml(elem):
-    """Возвращает красиво отформатированную строку XML."""
-    rough_string = ET.tostring(elem, 'utf-8')
-    reparsed = minidom.parseString(rough_string)
-    # toprettyxml добавляет лишние пустые строки, используем splitlines/join для их удаления
-    return '\n'.join([line for line in reparsed.toprettyxml(indent="  ").splitlines() if line.strip()])
+import os
+import sys
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))) # Папка KuroTools (для lib)
+from lib.xliff_writer import XliffWriter # Потоковая запись XLIFF с отступами
 
 
 def excel_to_xliff(excel_path, xliff_path, source_lang='en', target_lang='ru', original_filename='combined_python_scripts'):
@@ -37,66 +32,19 @@ def excel_to_xliff(excel_path, xliff_path, source_lang='en', target_lang='ru', o
             print(f"Ошибка: В Excel файле отсутствуют необходимые столбцы: {', '.join(missing)}")
             return
 
-        # --- Создаем структуру XLIFF ---
-        xliff_ns = 'urn:oasis:names:tc:xliff:document:1.2'
-        ET.register_namespace('', xliff_ns) # Регистрируем как default namespace
-
-        # Корневой элемент <xliff>
-        root = ET.Element('xliff', version='1.2', xmlns=xliff_ns)
-
-        # Элемент <file>
-        file_elem = ET.SubElement(root, 'file',
-                                  original=original_filename,
-                                  datatype='plaintext',
-                                  source_language=source_lang,
-                                  target_language=target_lang)
-
-        # Элемент <body>
-        body_elem = ET.SubElement(file_elem, 'body')
-
-        # --- Заполняем данными из DataFrame ---
-        for index, row in df.iterrows():
-            # Получаем данные из строки, гарантируем строковый тип
-            unit_id = str(row['ID'])
-            filename = str(row['FILE'])
-            source_text = str(row['ENGLISH'])
-            target_text = str(row['RUSSIAN'])
-
-            # Создаем <trans-unit>
-            trans_unit = ET.SubElement(body_elem, 'trans-unit', id=unit_id)
-
-            # Создаем <note> (если имя файла есть)
-            if filename:
-                note = ET.SubElement(trans_unit, 'note')
-                note.text = f"File: {filename}"
-
-            # Создаем <source>
-            source = ET.SubElement(trans_unit, 'source')
-            # Заменяем символы новой строки обратно на \n если нужно для совместимости с каким-то инструментом
-            # НО обычно ElementTree сам правильно экранирует XML
-            # source.text = source_text.replace('\n', '\\n') # Оставляем как есть, ET сам обработает
-            source.text = source_text
-
-            # Создаем <target>
-            target = ET.SubElement(trans_unit, 'target')
-            # target.text = target_text.replace('\n', '\\n') # Оставляем как есть
-            target.text = target_text
-
-
-        # --- Сохраняем XLIFF файл ---
-        # Используем minidom для красивого вывода
-        pretty_xml_string = prettify_xml(root)
-
-        with open(xliff_path, 'w', encoding='utf-8') as f:
-            # Добавляем XML декларацию вручную, т.к. prettify_xml её не всегда добавляет
-            f.write('<?xml version=\'1.0\' encoding=\'UTF-8\'?>\n')
-            f.write(pretty_xml_string)
-
-        # Альтернативный способ без красивого форматирования:
-        # tree = ET.ElementTree(root)
-        # tree.write(xliff_path, encoding='utf-8', xml_declaration=True, default_namespace=xliff_ns)
-        # print("Внимание: файл сохранен без дополнительного форматирования (отступов).")
-
+        # --- Пишем XLIFF потоково, по одной строке таблицы ---
+        with XliffWriter(xliff_path,
+                         original=original_filename,
+                         datatype='plaintext',
+                         source_language=source_lang,
+                         target_language=target_lang) as writer:
+            for row in df.itertuples(index=False):
+                # Получаем данные из строки, гарантируем строковый тип
+                unit_id = str(row.ID)
+                filename = str(row.FILE)
+                # Текст пишется как есть (\n уже записаны в таблице текстом), экранирование XML делает writer
+                writer.write_unit(unit_id, str(row.ENGLISH), str(row.RUSSIAN),
+                                  note=f"File: {filename}" if filename else None) # <note> только если имя файла есть
 
         print(f"XLIFF файл успешно сохранен в: {xliff_path}")
 
@@ -3,6 +3,9 @@ import pandas as pd # type: ignore
 import argparse
 import re
 import os
+import sys
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))) # Папка KuroTools (для lib)
+from lib.xliff_reader import iter_trans_units
 
 def extract_filename_from_note(note_text):
     """Извлекает имя файла из текста заметки (например, 'File: a0601.py')."""
@@ -28,43 +31,17 @@ def xliff_to_excel(xliff_path, excel_path):
         excel_path (str): Путь для сохранения выходного Excel файла.
     """
     try:
-        # Регистрируем пространство имен XLIFF для корректного поиска элементов
-        # Это важно, т.к. XLIFF использует default namespace
-        namespaces = {'xliff': 'urn:oasis:names:tc:xliff:document:1.2'}
-        ET.register_namespace('', namespaces['xliff']) # Регистрируем как default namespace
-
-        tree = ET.parse(xliff_path)
-        root = tree.getroot()
-
         data = []
 
-        # Ищем все элементы trans-unit внутри body
-        # Используем пространство имен при поиске
-        body = root.find('.//xliff:body', namespaces)
-        if body is None:
-             print(f"Ошибка: Тег <body> не найден в файле {xliff_path}. Возможно, это невалидный XLIFF 1.2.")
-             return
-
-        for trans_unit in body.findall('xliff:trans-unit', namespaces):
-            unit_id = trans_unit.get('id', '') # Безопасно получаем id
-
-            note_element = trans_unit.find('xliff:note', namespaces)
-            note_text = note_element.text if note_element is not None else ""
-            filename = extract_filename_from_note(note_text)
-
-            source_element = trans_unit.find('xliff:source', namespaces)
-            source_text = source_element.text if source_element is not None else ""
+        # XLIFF читается потоково: каждый trans-unit освобождается сразу после обработки
+        for unit in iter_trans_units(xliff_path):
+            filename = extract_filename_from_note(unit.note or "")
             # Важно: Сохраняем переносы строк как есть
-            source_text = source_text.replace('\\n', '\n') if source_text else ""
-
-
-            target_element = trans_unit.find('xliff:target', namespaces)
-            target_text = target_element.text if target_element is not None else ""
-             # Важно: Сохраняем переносы строк как есть
-            target_text = target_text.replace('\\n', '\n') if target_text else ""
+            source_text = unit.source.replace('\\n', '\n') if unit.source else ""
+            target_text = unit.target.replace('\\n', '\n') if unit.target else ""
 
             data.append({
-                'ID': unit_id,
+                'ID': unit.id or '', # Безопасно получаем id
                 'FILE': filename,
                 'ENGLISH': source_text,
                 'RUSSIAN': target_text
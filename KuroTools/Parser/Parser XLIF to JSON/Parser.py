@@ -3,6 +3,9 @@ import json
 import argparse
 import os
 import re
+import sys
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))) # KuroTools folder (for lib)
+from lib.xliff_reader import iter_trans_units
 
 def extract_filename_from_note(note_text):
     """
@@ -26,65 +29,23 @@ def convert_xliff_to_json(xliff_path, json_path):
         json_path (str): Path to the output JSON file.
     """
     try:
-        # Define the XLIFF namespace
-        # The namespace URI is found in the <xliff> tag's xmlns attribute
-        # Using '*' ignores namespaces, which is simpler for this specific structure
-        # but less robust if the XLIFF structure were more complex.
-        # For robustness, use: namespaces = {'xliff': 'urn:oasis:names:tc:xliff:document:1.2'}
-        # and find elements like: root.findall('.//xliff:trans-unit', namespaces)
-        
-        # Let's use namespace-aware parsing for correctness
-        namespaces = {'xliff': 'urn:oasis:names:tc:xliff:document:1.2'}
-        
-        # Register the namespace prefix for ET functions that support it (like findall)
-        ET.register_namespace('', namespaces['xliff']) 
-
-        tree = ET.parse(xliff_path)
-        root = tree.getroot()
-        
+        # The XLIFF is read with a streaming parser: each <trans-unit> is released
+        # as soon as it has been processed, so memory stays flat on large master files.
         result_data = {}
-
-        # Find all trans-unit elements within the body
-        # Using the namespace map is the correct way
-        trans_units = root.findall('.//xliff:trans-unit', namespaces)
-
-        if not trans_units:
-             # Try finding without namespace if the first attempt failed (e.g., namespace mismatch)
-             # This is less ideal but can be a fallback.
-             print("Warning: Could not find <trans-unit> elements with the standard XLIFF 1.2 namespace. Trying without namespace.")
-             trans_units = root.findall('.//trans-unit') # Fallback
-
-        if not trans_units:
-            print(f"Error: No <trans-unit> elements found in {xliff_path}.")
-            return
-
-        print(f"Found {len(trans_units)} <trans-unit> elements.")
-
         processed_count = 0
         skipped_count = 0
-        
-        for unit in trans_units:
-            unit_id = unit.get('id')
+
+        for unit in iter_trans_units(xliff_path):
+            unit_id = unit.id
             if not unit_id:
                 print(f"Warning: Skipping <trans-unit> without an 'id' attribute.")
                 skipped_count += 1
                 continue
 
-            # Find elements within the trans-unit using the namespace
-            note_elem = unit.find('xliff:note', namespaces)
-            source_elem = unit.find('xliff:source', namespaces)
-            target_elem = unit.find('xliff:target', namespaces)
-            
-            # Fallback if elements not found with namespace
-            if note_elem is None: note_elem = unit.find('note')
-            if source_elem is None: source_elem = unit.find('source')
-            if target_elem is None: target_elem = unit.find('target')
-
-
-            note_text = note_elem.text if note_elem is not None and note_elem.text is not None else ''
-            source_text = source_elem.text if source_elem is not None and source_elem.text is not None else ''
-            # Target text can be legitimately empty, handle None explicitly
-            target_text = target_elem.text if target_elem is not None and target_elem.text is not None else None 
+            note_text = unit.note or ''
+            source_text = unit.source or ''
+            # Target text can be legitimately empty (None)
+            target_text = unit.target
 
             filename = extract_filename_from_note(note_text)
 
@@ -106,6 +67,12 @@ def convert_xliff_to_json(xliff_path, json_path):
             result_data[filename][unit_id] = value
             processed_count += 1
 
+        if processed_count == 0 and skipped_count == 0:
+            print(f"Error: No <trans-unit> elements found in {xliff_path}.")
+            return
+
+        print(f"Found {processed_count + skipped_count} <trans-unit> elements.")
+
         # Write the JSON output file
         with open(json_path, 'w', encoding='utf-8') as f:
             json.dump(result_data, f, ensure_ascii=False, indent=4)
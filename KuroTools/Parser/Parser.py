@@ -1,20 +1,30 @@
 import json
-import xml.etree.ElementTree as ET
 import os
-import random
-import string
+import sys
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__)))) # Папка KuroTools (для lib)
+from lib.xliff_writer import XliffWriter, ContentIds, load_previous_xliff # Потоковая запись XLIFF
 
-def generate_random_id(length=10):
-    """Генерирует случайный ID из букв и цифр."""
-    return ''.join(random.choices(string.ascii_letters + string.digits, k=length))
+PATHS_SUFFIX = ".paths.json" # Карта {ID: [пути в JSON]} рядом с JSON и XLIFF
+REPEATS_NOTE = "Повторов: {}" # <note> у текста, который встречается в JSON несколько раз
 
-def find_and_replace_text(json_filepath, text_fields):
+def save_path_map(json_filepath, occurrences):
+    """Сохраняет, по каким путям JSON (список ключей и индексов) стоит каждый ID."""
+    paths_filepath = os.path.splitext(json_filepath)[0] + PATHS_SUFFIX
+    with open(paths_filepath, 'w', encoding='utf-8') as f:
+        json.dump(occurrences, f, ensure_ascii=False, separators=(',', ':'))
+    return paths_filepath
+
+def find_and_replace_text(json_filepath, text_fields, merge_previous=True, collapse_duplicates=True):
     """
     Находит текст в JSON по указанным ключам, создает XLIFF и заменяет текст на ID.
+    ID строится из хеша текста, поэтому при повторном запуске ID те же.
 
     Args:
         json_filepath: Путь к JSON файлу.
         text_fields: Список ключей, по которым осуществляется поиск текста.
+        merge_previous: Если XLIFF уже существует, перенести из него переводы, approved и примечания.
+        collapse_duplicates: Одинаковые тексты попадают в XLIFF одной строкой с общим ID
+            (иначе каждое вхождение - отдельная строка, повторы получают _2, _3...).
 
     Returns:
         True, если успешно, False в противном случае.
@@ -27,57 +37,70 @@ def find_and_replace_text(json_filepath, text_fields):
         print(f"Ошибка при чтении JSON файла: {e}")
         return False
 
-    # Создаем корневой элемент XLIFF
-    xliff_root = ET.Element("xliff", version="1.2", xmlns="urn:oasis:names:tc:xliff:document:1.2")
-    file_element = ET.SubElement(xliff_root, "file", original=os.path.basename(json_filepath), source_language="en", target_language="ru")
-    body_element = ET.SubElement(file_element, "body")
+    xliff_filepath = os.path.splitext(json_filepath)[0] + ".xliff"
+    # Переводы из прошлого XLIFF этого JSON (если он есть) переносятся в новый.
+    # Счетчик повторов пересчитывается при каждом запуске: старый не должен заменить новый при переносе примечаний
+    previous_units = None
+    if merge_previous:
+        previous_units = load_previous_xliff(
+            xliff_filepath, generated_note_prefix=REPEATS_NOTE.split("{")[0],
+            on_error=lambda e: print(f"Предупреждение: Не удалось прочитать прошлый XLIFF, переводы не перенесены: {e}"))
+    text_ids = ContentIds(length=10)
 
-    # Словарь для хранения соответствия ID и исходного текста
-    id_map = {}
+    sources = {}     # {ID: исходный текст}, в порядке первого появления
+    occurrences = {} # {ID: [путь в JSON, ...]}
+    seen_ids = {}    # {исходный текст: ID} для collapse_duplicates
 
-    def recursive_search_and_replace(obj):
+    def recursive_search_and_replace(obj, path):
         """Рекурсивно ищет текст в JSON и заменяет его на ID."""
         if isinstance(obj, dict):
             for key, value in obj.items():
                 if key in text_fields and isinstance(value, str) and value:  # Проверяем, что значение - строка и не пустая
-                    text_id = generate_random_id()
-                    id_map[text_id] = value  # Сохраняем соответствие ID и текста
+                    text_id = seen_ids.get(value) if collapse_duplicates else None
+                    if text_id is None:
+                        text_id = text_ids.get(value)
+                        sources[text_id] = value
+                        if collapse_duplicates:
+                            seen_ids[value] = text_id
+                    occurrences.setdefault(text_id, []).append(path + [key])
                     obj[key] = text_id  # Заменяем текст на ID
-
-                    # Добавляем текст в XLIFF
-                    trans_unit = ET.SubElement(body_element, "trans-unit", id=text_id)
-                    source = ET.SubElement(trans_unit, "source")
-                    source.text = value.replace("\n", "\\n")  # Сохраняем \n как текст
-                    target = ET.SubElement(trans_unit, "target")
-                    target.text = ""  # Пустой target
                 elif isinstance(value, (dict, list)):  # Рекурсивный вызов для вложенных объектов
-                    recursive_search_and_replace(value)
+                    recursive_search_and_replace(value, path + [key])
         elif isinstance(obj, list):
-            for item in obj:
+            for i, item in enumerate(obj):
                 if isinstance(item, (dict, list)):  # Рекурсивный вызов для вложенных объектов
-                    recursive_search_and_replace(item)
+                    recursive_search_and_replace(item, path + [i])
 
     # Запуск рекурсивного поиска и замены
-    recursive_search_and_replace(data)
+    recursive_search_and_replace(data, [])
 
-    # Записываем измененный JSON
+    # XLIFF пишется потоково: одна строка на уникальный текст (\n сохраняем как текст, target пустой)
+    xliff_writer = XliffWriter(xliff_filepath, original=os.path.basename(json_filepath), source_language="en", target_language="ru",
+                               previous_units=previous_units)
     try:
-        with open(json_filepath, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=4, ensure_ascii=False)
+        with xliff_writer:
+            for text_id, value in sources.items():
+                repeats = len(occurrences[text_id])
+                note = REPEATS_NOTE.format(repeats) if repeats > 1 else None
+                xliff_writer.write_unit(text_id, value.replace("\n", "\\n"), note=note)
+        paths_filepath = save_path_map(json_filepath, occurrences)
     except IOError as e:
-        print(f"Ошибка при записи измененного JSON: {e}")
+        print(f"Ошибка при записи XLIFF файла: {e}")
         return False
 
-    # Создаем XLIFF файл
-    xliff_filepath = os.path.splitext(json_filepath)[0] + ".xliff"
+    # Записываем измененный JSON
     try:
-        tree = ET.ElementTree(xliff_root)
-        tree.write(xliff_filepath, encoding="utf-8", xml_declaration=True)
+        with open(json_filepath, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=4, ensure_ascii=False)
     except IOError as e:
-        print(f"Ошибка при записи XLIFF файла: {e}")
+        print(f"Ошибка при записи измененного JSON: {e}")
         return False
 
+    total = sum(len(paths) for paths in occurrences.values())
     print(f"Обработка завершена. JSON перезаписан, XLIFF файл создан: {xliff_filepath}")
+    print(f"Строк в XLIFF: {len(sources)} (вхождений в JSON: {total}). Пути сохранены в: {paths_filepath}")
+    if previous_units is not None:
+        print(f"Перенесено переводов из прошлого XLIFF: {xliff_writer.carried} из {xliff_writer.count}")
     return True
 
 
@@ -1,21 +1,16 @@
 import json
-import xml.etree.ElementTree as ET
 import os
-import random
-import string
+import sys
 import logging
 import re # Импортируем модуль для работы с регулярными выражениями
-import xml.dom.minidom # Для красивого форматирования XLIFF
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__)))) # Папка KuroTools (для lib)
+from lib.xliff_writer import XliffWriter, ContentIds, load_previous_xliff # Потоковая запись XLIFF
 
 # Настройка логирования (опционально)
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 # logging.basicConfig(level=logging.DEBUG, format='%(asctime)s - %(levelname)s - %(message)s') # Для отладки
 
-def generate_random_id(length=10):
-    """Генерирует случайный ID из букв и цифр."""
-    return ''.join(random.choices(string.ascii_letters + string.digits, k=length))
-
-def find_and_replace_text(json_filepath, text_fields):
+def find_and_replace_text(json_filepath, text_fields, merge_previous=True):
     """
     Находит текст в JSON по указанным ключам.
     Если значение состоит из одного слова (без пробелов внутри) и НЕ содержит кириллицы:
@@ -24,9 +19,12 @@ def find_and_replace_text(json_filepath, text_fields):
     - Заменяет значение в JSON на этот ID.
     В остальных случаях значение остается неизменным в JSON и не добавляется в XLIFF.
 
+    ID строится из хеша текста (повторы получают _2, _3...), поэтому при повторном запуске ID те же.
+
     Args:
         json_filepath: Путь к JSON файлу.
         text_fields: Список ключей, по которым осуществляется поиск текста.
+        merge_previous: Если XLIFF уже существует, перенести из него переводы, approved и примечания.
 
     Returns:
         True, если успешно, False в противном случае.
@@ -46,10 +44,17 @@ def find_and_replace_text(json_filepath, text_fields):
         logging.error(f"Непредвиденная ошибка при чтении JSON файла '{json_filepath}': {e}")
         return False
 
-    # Создаем корневой элемент XLIFF
-    xliff_root = ET.Element("xliff", version="1.2", xmlns="urn:oasis:names:tc:xliff:document:1.2")
-    file_element = ET.SubElement(xliff_root, "file", original=os.path.basename(json_filepath), source_language="en", target_language="ru") # Укажите правильные языки
-    body_element = ET.SubElement(file_element, "body")
+    # XLIFF пишется потоково по мере нахождения записей; файл создается только при первой записи
+    xliff_filepath = os.path.splitext(json_filepath)[0] + ".xliff"
+    # Переводы из прошлого XLIFF этого JSON (если он есть) переносятся в новый
+    previous_units = None
+    if merge_previous:
+        previous_units = load_previous_xliff(
+            xliff_filepath,
+            on_error=lambda e: logging.warning(f"Не удалось прочитать прошлый XLIFF '{xliff_filepath}', переводы не перенесены: {e}"))
+    xliff_writer = XliffWriter(xliff_filepath, original=os.path.basename(json_filepath), source_language="en", target_language="ru", # Укажите правильные языки
+                               previous_units=previous_units)
+    text_ids = ContentIds(length=10)
 
     # Счетчик добавленных в XLIFF записей
     xliff_count = 0
@@ -80,18 +85,16 @@ def find_and_replace_text(json_filepath, text_fields):
 
                     if is_single_word and not contains_cyrillic:
                         # Действия для подходящих значений:
-                        text_id = generate_random_id()
+                        text_id = text_ids.get(original_value_for_xliff)
 
                         # 2.1. Заменяем значение в JSON на ID
                         obj[key] = text_id
                         logging.debug(f"Ключ '{key}': значение '{text_for_check}' (одно слово, не кириллица) заменено на ID '{text_id}' в JSON.")
 
                         # 2.2. Добавляем в XLIFF (используем исходное значение с пробелами по краям, если они были)
-                        trans_unit = ET.SubElement(body_element, "trans-unit", id=text_id)
-                        source = ET.SubElement(trans_unit, "source")
-                        source.text = original_value_for_xliff.replace("\n", "\\n")
-                        target = ET.SubElement(trans_unit, "target")
-                        target.text = ""
+                        if xliff_writer.file is None:
+                            xliff_writer.open()
+                        xliff_writer.write_unit(text_id, original_value_for_xliff.replace("\n", "\\n"))
                         xliff_count += 1
                         logging.debug(f"Значение '{original_value_for_xliff}' добавлено в XLIFF с ID '{text_id}'.")
                     else:
@@ -117,7 +120,13 @@ def find_and_replace_text(json_filepath, text_fields):
 
     # Запуск рекурсивной обработки
     logging.info("Начало обработки JSON...")
-    recursive_process(data)
+    try:
+        recursive_process(data)
+    except IOError as e:
+        xliff_writer.close(complete=False)
+        logging.error(f"Ошибка при записи XLIFF файла '{xliff_filepath}': {e}")
+        return False
+    xliff_writer.close()
     logging.info("Обработка JSON завершена.")
 
     # Записываем измененный JSON
@@ -132,19 +141,10 @@ def find_and_replace_text(json_filepath, text_fields):
         logging.error(f"Непредвиденная ошибка при записи JSON файла '{json_filepath}': {e}")
         return False
 
-    # Создаем XLIFF файл, только если были найдены подходящие записи
     if xliff_count > 0:
-        xliff_filepath = os.path.splitext(json_filepath)[0] + ".xliff"
-        try:
-            rough_string = ET.tostring(xliff_root, encoding='utf-8', method='xml')
-            reparsed = xml.dom.minidom.parseString(rough_string)
-            with open(xliff_filepath, "w", encoding='utf-8') as f:
-                f.write(reparsed.toprettyxml(indent="  "))
-            logging.info(f"Создан XLIFF файл '{xliff_filepath}' с {xliff_count} записями (одно слово, не кириллица).")
-        except IOError as e:
-            logging.error(f"Ошибка при записи XLIFF файла '{xliff_filepath}': {e}")
-        except Exception as e:
-             logging.error(f"Непредвиденная ошибка при записи XLIFF файла '{xliff_filepath}': {e}")
+        logging.info(f"Создан XLIFF файл '{xliff_filepath}' с {xliff_count} записями (одно слово, не кириллица).")
+        if previous_units is not None:
+            logging.info(f"Перенесено переводов из прошлого XLIFF: {xliff_writer.carried} из {xliff_count}.")
     else:
         logging.info("Не найдено однословных некириллических значений для добавления в XLIFF. Файл XLIFF не создан.")
 
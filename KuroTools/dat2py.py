@@ -14,6 +14,12 @@ def init_argparse() -> argparse.ArgumentParser:
     
     parser.add_argument('--markers', nargs='?', type=str)
     parser.add_argument('--decompile', nargs='?', type=str)
+    parser.add_argument('--format', choices=['py', 'ir', 'both'], default='py',
+                        help="py: Python script, ir: compact IR (.ir.json) for batch round-trips, both: both files")
+    parser.add_argument('--profile', action='store_true',
+                        help="print phase timers and counters (bytes, functions, instructions/s, strings)")
+    parser.add_argument('--p3a', default=None,
+                        help="read FILE from this P3A archive instead of the disk")
     parser.add_argument('file')
     return parser
 
@@ -42,8 +48,15 @@ def main() -> None:
     if not args.file:
         raise Exception("ED9Disassembler needs a file to disassemble!")
     else:
-        disasm = ED9Disassembler.ED9Disassembler(args.markers, args.decompile)
-        disasm.parse(args.file)
+        disasm = ED9Disassembler.ED9Disassembler(args.markers, args.decompile, args.format, profile = args.profile)
+        if args.p3a:
+            from lib.p3a import P3AArchive
+            with P3AArchive(args.p3a) as archive:
+                disasm.parse(args.file, archive)
+        else:
+            disasm.parse(args.file)
+        if args.profile:
+            disasm.print_stats()
     
         
 
@@ -5,9 +5,13 @@ import os
 import traceback
 import disasm.ED9Disassembler as ED9Disassembler
 import disasm.ED9InstructionsSet as ED9InstructionsSet # Импортируем для сброса состояния
+from disasm.ED9IR import IR_EXTENSION
 import shutil # Для копирования файлов
 import time # Для статистики времени
 import argparse
+import json # Для манифеста
+import hashlib # Для хешей .dat в манифесте
+from processcle import processCLE
 
 # --- УБРАН импорт tqdm ---
 
@@ -28,6 +32,14 @@ OUTPUT_PY_SUBDIR = "data_to_py"
 LOG_FILE = "LogDisassembler.txt"
 DECOMPILE_MODE = True
 SHOW_MARKERS = False
+OUTPUT_FORMAT = "py" # "py", "ir" (компактный IR для пакетной сборки/извлечения) или "both"
+MANIFEST_FILE = "dat2py_manifest.json" # Манифест в папке вывода: хеши .dat, версия инструмента, режим
+MANIFEST_VERSION = 1
+PROFILE_FILE = "dat2py_profile.json" # Отчет --profile (время по фазам и счетчики по каждому файлу)
+PROFILE_TOP = 20 # Сколько самых медленных файлов вывести в отчет отдельно
+# Исходники, от которых зависит результат дизассемблирования (их хеш = версия инструмента)
+TOOL_SOURCES = ["disasm/ED9Disassembler.py", "disasm/ED9InstructionsSet.py", "disasm/ED9Commands.py", "disasm/script.py",
+                "disasm/function.py", "disasm/ED9IR.py", "lib/parser.py"]
 # --------------------
 
 # --- Код для добавления sys.path ---
@@ -38,24 +50,97 @@ PYTHON_PATH_PREPEND_CODE = """\
 
 # --- УБРАНА функция safe_print ---
 
-def prepend_code_to_file(filepath, code_to_prepend): # Убран use_tqdm_flag
-    """Добавляет строку кода в начало файла."""
+# --- МАНИФЕСТ (пропуск неизмененных .dat) ---
+def compute_tool_version():
+    """Хеш исходников дизассемблера и вставляемого заголовка: меняется при любом изменении инструмента."""
+    h = hashlib.sha256(f"{MANIFEST_VERSION}\n{PYTHON_PATH_PREPEND_CODE}".encode("utf-8"))
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    for rel_path in TOOL_SOURCES:
+        try:
+            with open(os.path.join(script_dir, rel_path), 'rb') as f:
+                h.update(f.read())
+        except OSError:
+            h.update(rel_path.encode("utf-8"))
+    return h.hexdigest()[:16]
+
+def make_manifest_header(current_decompile_mode, output_format):
+    return {
+        "version": MANIFEST_VERSION,
+        "tool_version": compute_tool_version(),
+        "decompile": current_decompile_mode,
+        "markers": SHOW_MARKERS,
+        "output_format": output_format,
+    }
+
+def load_manifest(manifest_path, header):
+    """Возвращает {имя.dat: запись} из манифеста, если он создан тем же инструментом в том же режиме."""
     try:
-        abs_filepath = os.path.abspath(filepath)
-        if not os.path.exists(abs_filepath):
-            return # Молча выходим, если файла нет
-        with open(abs_filepath, 'r', encoding='utf-8') as f_read:
-            original_content = f_read.read()
-        with open(abs_filepath, 'w', encoding='utf-8') as f_write:
-            f_write.write(code_to_prepend)
-            f_write.write(original_content)
-    except Exception as e:
-         # Используем обычный print
-        print(f"\n{Fore.YELLOW}Предупреждение: Ошибка при добавлении кода sys.path в файл {os.path.basename(filepath)}: {e}{Style.RESET_ALL}")
-
-
-def process_directory(input_dir_path, current_decompile_mode):
-    """Обрабатывает все .dat файлы в указанной директории."""
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return {}
+    if manifest.get("header") != header:
+        print(f"{Fore.YELLOW}Манифест создан другой версией инструмента или в другом режиме: все файлы будут обработаны заново.{Style.RESET_ALL}")
+        return {}
+    return manifest.get("files", {})
+
+def save_manifest(manifest_path, header, files):
+    try:
+        with open(manifest_path, 'w', encoding='utf-8') as f:
+            json.dump({"header": header, "files": files}, f, indent=1, sort_keys=True)
+    except OSError as e:
+        print(f"{Fore.YELLOW}Предупреждение: Не удалось записать манифест {manifest_path}: {e}{Style.RESET_ALL}")
+
+def sha256_bytes(data):
+    return hashlib.sha256(data).hexdigest()
+
+def is_unchanged(dat_path, entry, output_paths):
+    """
+    Проверяет файл по манифесту. Сначала сравнивается хеш файла как есть, затем (если файл
+    зашифрован/сжат или был расшифрован на месте) - хеш после декодирования CLE.
+    Возвращает (не_изменился, raw_hash, content_hash|None).
+    """
+    with open(dat_path, 'rb') as f:
+        raw = f.read()
+    raw_hash = sha256_bytes(raw)
+    if entry is None or not all(os.path.exists(p) for p in output_paths):
+        return False, raw_hash, None
+    if entry.get("raw_hash") == raw_hash:
+        return True, raw_hash, entry.get("content_hash")
+    content_hash = raw_hash if raw[0:4] == b"#scp" else sha256_bytes(processCLE(raw))
+    return content_hash == entry.get("content_hash"), raw_hash, content_hash
+# --- КОНЕЦ МАНИФЕСТА ---
+
+def write_profile_report(report_path, files_stats):
+    """Сводит статистику ED9Disassembler по файлам в JSON отчет и печатает итоги по фазам."""
+    totals = {"files": len(files_stats), "bytes": 0, "functions": 0, "instructions": 0, "strings": 0, "total": 0.0, "phases": {}}
+    for stats in files_stats:
+        for key in ("bytes", "functions", "instructions", "strings", "total"):
+            totals[key] += stats[key]
+        for name, seconds in stats["phases"].items():
+            totals["phases"][name] = totals["phases"].get(name, 0) + seconds
+    decode_time = totals["phases"].get("header", 0) + totals["phases"].get("instructions", 0)
+    totals["instructions_per_sec"] = totals["instructions"] / decode_time if decode_time > 0 else 0
+    report = {
+        "totals": totals,
+        "slowest": [s["file"] for s in sorted(files_stats, key=lambda s: s["total"], reverse=True)[:PROFILE_TOP]],
+        "files": files_stats,
+    }
+    try:
+        with open(report_path, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=1)
+    except OSError as e:
+        print(f"{Fore.RED}Не удалось записать отчет профилирования {report_path}: {e}{Style.RESET_ALL}")
+        return
+    print(f"\n--- {Style.BRIGHT}Профилирование{Style.RESET_ALL} ---")
+    for name, seconds in sorted(totals["phases"].items(), key=lambda item: item[1], reverse=True):
+        print(f"  {name:<22} {seconds:8.2f} сек.")
+    print(f"  Инструкций/сек (декодирование): {totals['instructions_per_sec']:.0f}")
+    print(f"{Fore.CYAN}Отчет сохранен в: {Style.BRIGHT}{report_path}{Style.RESET_ALL}")
+
+
+def process_directory(input_dir_path, current_decompile_mode, output_format=OUTPUT_FORMAT, force=False, profile=False):
+    """Обрабатывает все .dat файлы в указанной директории (неизмененные по манифесту пропускаются, если не force)."""
     # global tqdm_available - больше не нужен
 
     if not os.path.isdir(input_dir_path):
@@ -72,6 +157,12 @@ def process_directory(input_dir_path, current_decompile_mode):
     failed_files_list = []
     log_entries = []
     success_count = 0
+    unchanged_count = 0
+    manifest_path = os.path.join(output_py_dir_path, MANIFEST_FILE)
+    manifest_header = make_manifest_header(current_decompile_mode, output_format)
+    old_manifest = {} if force else load_manifest(manifest_path, manifest_header)
+    new_manifest = {}
+    profile_stats = []
     original_cwd = os.getcwd()
     start_time = time.time()
 
@@ -101,9 +192,25 @@ def process_directory(input_dir_path, current_decompile_mode):
             # Определяем пути
             full_dat_path_abs = os.path.abspath(os.path.join(original_cwd, input_dir_path, filename))
             base_name = os.path.splitext(filename)[0]
-            output_py_filename = f"{base_name}.py"
+            output_py_filename = f"{base_name}.py" if output_format != "ir" else f"{base_name}{IR_EXTENSION}"
             current_file_output_path = output_py_filename
             output_py_path_abs = os.path.abspath(output_py_filename)
+            expected_outputs = [os.path.abspath(f"{base_name}.py")] if output_format != "ir" else []
+            if output_format != "py":
+                expected_outputs.append(os.path.abspath(f"{base_name}{IR_EXTENSION}"))
+
+            # Пропуск файлов, не изменившихся с прошлого запуска
+            try:
+                unchanged, raw_hash, content_hash = is_unchanged(full_dat_path_abs, old_manifest.get(filename), expected_outputs)
+            except Exception:
+                unchanged, raw_hash, content_hash = False, None, None
+            if unchanged:
+                new_manifest[filename] = {"raw_hash": raw_hash, "content_hash": content_hash}
+                unchanged_count += 1
+                success_count += 1
+                if current_decompile_mode:
+                    print(f"  {filename}: без изменений, пропуск.")
+                continue
 
             # --- ИЗМЕНЕНИЕ: Условный вывод прогресса ---
             if not current_decompile_mode: # Режим извлечения строк
@@ -115,11 +222,10 @@ def process_directory(input_dir_path, current_decompile_mode):
             # --- КОНЕЦ ИЗМЕНЕНИЯ ---
 
             # Сброс состояния
-            ED9InstructionsSet.locations_dict = {}
-            ED9InstructionsSet.location_counter = 0
-            ED9InstructionsSet.smallest_data_ptr = sys.maxsize
+            ED9InstructionsSet.reset_state()
 
-            disasm = ED9Disassembler.ED9Disassembler(markers=SHOW_MARKERS, decomp=current_decompile_mode)
+            # Заголовок sys.path пишется сразу при генерации .py (без второго прохода по файлу)
+            disasm = ED9Disassembler.ED9Disassembler(markers=SHOW_MARKERS, decomp=current_decompile_mode, output_format=output_format, preamble=PYTHON_PATH_PREPEND_CODE, profile=profile)
             parse_successful = False
             error_details = None
 
@@ -130,9 +236,13 @@ def process_directory(input_dir_path, current_decompile_mode):
                 if os.path.exists(current_file_output_path):
                     if current_decompile_mode: # Только в режиме компиляции
                         print(f"{Fore.GREEN}  Успешно дизассемблировано: {filename} -> {output_py_filename}{Style.RESET_ALL}")
-                    # Вызываем prepend БЕЗ флага use_tqdm
-                    prepend_code_to_file(output_py_path_abs, PYTHON_PATH_PREPEND_CODE)
                     success_count += 1
+                    # parse() расшифровывает файл на месте, поэтому хеш содержимого берется с диска
+                    with open(full_dat_path_abs, 'rb') as f_dat:
+                        content_hash = sha256_bytes(f_dat.read())
+                    new_manifest[filename] = {"raw_hash": content_hash, "content_hash": content_hash}
+                    if profile:
+                        profile_stats.append(disasm.stats)
                 else:
                     parse_successful = False
                     # --- ИЗМЕНЕНИЕ: Вывод ошибки с новой строки, если был режим извлечения ---
@@ -189,6 +299,8 @@ def process_directory(input_dir_path, current_decompile_mode):
         # --- КОНЕЦ ИЗМЕНЕНИЯ ---
 
     finally:
+        # Файлы с ошибками (и не дошедшие до обработки) в манифест не попадают - обработаются заново
+        save_manifest(manifest_path, manifest_header, new_manifest)
         print(f"{Fore.CYAN}Возврат в рабочую директорию: {original_cwd}{Style.RESET_ALL}")
         os.chdir(original_cwd)
 
@@ -221,12 +333,15 @@ def process_directory(input_dir_path, current_decompile_mode):
     total_time = end_time - start_time
     print(f"\n--- {Style.BRIGHT}Дизассемблирование завершено{Style.RESET_ALL} ---")
     print(f"{Fore.GREEN}Успешно обработано: {success_count} / {total_files} файлов{Style.RESET_ALL}")
+    print(f"{Fore.CYAN}Без изменений (пропущено): {unchanged_count}{Style.RESET_ALL}")
     failed_count = len(set(failed_files_list))
     if failed_count > 0: print(f"{Fore.RED}Файлов с ошибками:  {failed_count}{Style.RESET_ALL}")
     else: print(f"{Fore.GREEN}Файлов с ошибками:  0{Style.RESET_ALL}")
     print(f"{Fore.CYAN}Затраченное время:   {total_time:.2f} сек.{Style.RESET_ALL}")
     if failed_files_list: print(f"{Fore.YELLOW}Подробности ошибок см. в файле: {LOG_FILE}{Style.RESET_ALL}")
     print("------------------------------------")
+    if profile:
+        write_profile_report(os.path.join(script_dir, PROFILE_FILE), profile_stats)
     return failed_count == 0
 
 
@@ -239,6 +354,12 @@ if __name__ == "__main__":
                         help="Путь к папке, содержащей .dat файлы.")
     parser.add_argument("--decompile-mode", dest="decompile_mode_arg", type=str, choices=['true', 'false'], default=None,
                         help="Установить режим DECOMPILE_MODE ('true' для компиляции, 'false' для извлечения строк). По умолчанию используется значение из скрипта (True).")
+    parser.add_argument("--output-format", dest="output_format", choices=['py', 'ir', 'both'], default=OUTPUT_FORMAT,
+                        help=f"Формат вывода: py (скрипты Python), ir (компактный {IR_EXTENSION} для пакетной обработки) или both. По умолчанию: {OUTPUT_FORMAT}.")
+    parser.add_argument("--force", action="store_true",
+                        help=f"Обработать все файлы заново, игнорируя манифест {MANIFEST_FILE}.")
+    parser.add_argument("--profile", action="store_true",
+                        help=f"Замерить время по фазам и счетчики для каждого файла, отчет в {PROFILE_FILE}. Используйте вместе с --force, иначе неизмененные файлы пропускаются.")
 
 
     args = parser.parse_args()
@@ -259,7 +380,7 @@ if __name__ == "__main__":
         sys.exit(1)
 
 
-    success = process_directory(input_directory, current_decompile_mode)
+    success = process_directory(input_directory, current_decompile_mode, args.output_format, args.force, args.profile)
     sys.exit(0 if success else 1)
 
 # --- END OF FILE dat2py_batch.py ---
\ No newline at end of file
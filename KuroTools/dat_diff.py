@@ -0,0 +1,268 @@
+import sys
+import os
+import json
+import time
+import hashlib
+import argparse
+import traceback
+import xml.etree.ElementTree as ET
+
+try:
+    import colorama
+    colorama.init(autoreset=True)
+    Fore = colorama.Fore
+    Style = colorama.Style
+except ImportError:
+    print("Предупреждение: Библиотека colorama не найдена (pip install colorama). Цветной вывод будет отключен.")
+    class DummyStyle:
+        def __getattr__(self, name): return ""
+    Fore = DummyStyle(); Style = DummyStyle()
+
+# --- Конфигурация ---
+OUTPUT_XLIFF_FILE = "data_game_strings_carried.xliff" # Новый XLIFF с перенесенными переводами
+XLIFF_NAMESPACE = "urn:oasis:names:tc:xliff:document:1.2"
+REVIEW_STATE = "needs-review-translation" # Состояние для переводов, перенесенных на измененную строку
+JUMP_OPCODES = (0x0B, 0x0E, 0x0F, 0x25)
+# --------------------
+
+# Хеш функции строится по нормализованному потоку инструкций:
+# - метки переходов и адреса возврата заменяются смещением от начала функции,
+# - строки PUSHSTRING заменяются маркером (их изменения отслеживаются отдельно),
+# - CALL хранит имя вызываемой функции, CALLFROMANOTHERSCRIPT - имена скрипта/функции.
+# Поэтому сдвиг кода из-за других функций или перевод строк не меняют хеш.
+
+class FunctionInfo(object):
+    def __init__(self, name, digest, strings):
+        self.name = name
+        self.hash = digest
+        self.strings = strings #тексты PUSHSTRING по порядку (нормализованные, как ключи strings_map.json)
+
+def load_functions(dat_path):
+    """Разбирает .dat и возвращает {имя функции: FunctionInfo}."""
+    from disasm.script import ScriptFile
+    from disasm.ED9Disassembler import ED9Disassembler
+    from disasm.ED9IR import normalize_string_key
+    from lib.parser import readtextoffset, remove2MSB, identifytype
+
+    scp = ScriptFile(dat_path).load_all()
+    # Метки адресов возврата и PUSHCALLERFUNCTIONINDEX расставляет дизассемблер, как для .py
+    disasm = ED9Disassembler(markers=False, decomp=False)
+    disasm.script = scp
+    disasm.stream = scp.stream
+    with scp.decoding_state():
+        for fun in scp.functions_by_start:
+            disasm.add_return_addresses(fun)
+    label_addresses = {label: addr for addr, label in scp.locations_dict.items()}
+
+    def value_key(value):
+        if identifytype(value) == "string":
+            return ("str", readtextoffset(scp.stream, remove2MSB(value)))
+        return value
+
+    functions = {}
+    for fun in scp.functions:
+        h = hashlib.sha1()
+        h.update(repr((fun.b0, fun.b1, [value_key(v) for v in fun.input_args], [value_key(v) for v in fun.output_args],
+                       [(st["id"], st["nb_sth1"], [value_key(v) for v in st["array2"]]) for st in fun.structs])).encode("utf-8"))
+        strings = []
+        for instruction in fun.instructions:
+            op_code = instruction.op_code
+            operands = [op.value for op in instruction.operands]
+            if op_code == 0:
+                if instruction.name == "PUSHSTRING":
+                    strings.append(normalize_string_key(readtextoffset(scp.stream, remove2MSB(operands[0]))))
+                    key = (0, "S")
+                elif instruction.name == "PUSHRETURNADDRESS":
+                    key = (0, "L", label_addresses[operands[0]] - fun.start)
+                elif instruction.name == "PUSHCALLERFUNCTIONINDEX":
+                    key = (0, "F")
+                else:
+                    key = (0, operands[0])
+            elif op_code in JUMP_OPCODES:
+                key = (op_code, label_addresses[operands[0]] - fun.start)
+            elif op_code == 0x0C:
+                # Хешируется имя вызываемой функции, а не ее индекс: индекс сдвигается, если перед ней
+                # добавили или удалили функцию (add_return_addresses обычно уже заменил индекс на имя)
+                callee = operands[0]
+                if isinstance(callee, int):
+                    callee = scp.functions[callee].name
+                key = (0x0C, callee)
+            elif op_code in (0x22, 0x23):
+                key = (op_code, value_key(operands[0]), value_key(operands[1]), operands[2])
+            else:
+                key = (op_code, *operands)
+            h.update(repr(key).encode("utf-8"))
+        functions[fun.name] = FunctionInfo(fun.name, h.hexdigest(), strings)
+    return functions
+
+def diff_scripts(old_functions, new_functions):
+    """Сравнивает функции двух версий скрипта. Возвращает dict с added/removed/changed/changed_strings."""
+    result = {"added": [], "removed": [], "changed": [], "unchanged": [], "changed_strings": []}
+    for name in old_functions:
+        if name not in new_functions:
+            result["removed"].append(name)
+    for name, new_fun in new_functions.items():
+        old_fun = old_functions.get(name)
+        if old_fun is None:
+            result["added"].append(name)
+        elif old_fun.hash != new_fun.hash:
+            result["changed"].append(name)
+        else:
+            result["unchanged"].append(name)
+            # Структура та же: строки сопоставляются по позиции
+            for old_text, new_text in zip(old_fun.strings, new_fun.strings):
+                if old_text != new_text:
+                    result["changed_strings"].append({"function": name, "old": old_text, "new": new_text})
+    return result
+
+def carried_string_pairs(old_functions, new_functions):
+    """{новая строка: старая строка} для строк неизмененных функций."""
+    pairs = {}
+    for name, new_fun in new_functions.items():
+        old_fun = old_functions.get(name)
+        if old_fun is None or old_fun.hash != new_fun.hash:
+            continue
+        for old_text, new_text in zip(old_fun.strings, new_fun.strings):
+            pairs.setdefault(new_text, old_text)
+    return pairs
+
+def pair_dat_files(old_path, new_path):
+    """Пары (имя, старый путь|None, новый путь|None) для двух файлов или двух папок."""
+    if os.path.isfile(old_path) and os.path.isfile(new_path):
+        return [(os.path.basename(new_path), old_path, new_path)]
+    if not (os.path.isdir(old_path) and os.path.isdir(new_path)):
+        raise ValueError("Нужно указать два .dat файла или две папки с .dat файлами.")
+    old_files = {f for f in os.listdir(old_path) if f.lower().endswith(".dat")}
+    new_files = {f for f in os.listdir(new_path) if f.lower().endswith(".dat")}
+    return [(f, os.path.join(old_path, f) if f in old_files else None, os.path.join(new_path, f) if f in new_files else None)
+            for f in sorted(old_files | new_files)]
+
+def print_report(report):
+    for name, entry in report["scripts"].items():
+        if entry.get("status") in ("added", "removed", "failed"):
+            color = Fore.RED if entry["status"] == "failed" else Fore.YELLOW
+            print(f"{color}{name}: {entry['status']}{Style.RESET_ALL}")
+            continue
+        if not (entry["added"] or entry["removed"] or entry["changed"] or entry["changed_strings"]):
+            continue
+        print(f"{Style.BRIGHT}{name}{Style.RESET_ALL}")
+        for fun_name in entry["added"]:
+            print(f"  {Fore.GREEN}+ {fun_name}{Style.RESET_ALL}")
+        for fun_name in entry["removed"]:
+            print(f"  {Fore.RED}- {fun_name}{Style.RESET_ALL}")
+        for fun_name in entry["changed"]:
+            print(f"  {Fore.YELLOW}~ {fun_name}{Style.RESET_ALL}")
+        for change in entry["changed_strings"]:
+            print(f"  {Fore.CYAN}\" {change['function']}: {change['old']!r} -> {change['new']!r}{Style.RESET_ALL}")
+
+def diff_paths(old_path, new_path):
+    """Сравнивает файлы/папки. Возвращает (отчет, {новая строка: старая строка} для переноса переводов)."""
+    report = {"scripts": {}, "totals": {"added": 0, "removed": 0, "changed": 0, "unchanged": 0, "changed_strings": 0}}
+    pairs = {}
+    for name, old_file, new_file in pair_dat_files(old_path, new_path):
+        if old_file is None or new_file is None:
+            report["scripts"][name] = {"status": "added" if old_file is None else "removed"}
+            continue
+        try:
+            old_functions = load_functions(old_file)
+            new_functions = load_functions(new_file)
+        except Exception as e:
+            print(f"{Fore.RED}Ошибка при разборе {name}: {e}{Style.RESET_ALL}")
+            traceback.print_exc()
+            report["scripts"][name] = {"status": "failed", "error": str(e)}
+            continue
+        entry = diff_scripts(old_functions, new_functions)
+        for key in report["totals"]:
+            report["totals"][key] += len(entry[key])
+        entry["unchanged"] = len(entry["unchanged"])
+        report["scripts"][name] = entry
+        for new_text, old_text in carried_string_pairs(old_functions, new_functions).items():
+            pairs.setdefault(new_text, old_text)
+    return report, pairs
+
+def xliff_text(text):
+    # В XLIFF переводы строк записаны как \n
+    return text.replace("\n", "\\n")
+
+def carry_forward_xliff(old_xliff_path, new_xliff_path, output_path, pairs):
+    """Заполняет пустые target в новом XLIFF переводами из старого для строк неизмененных функций."""
+    ns = {"xliff": XLIFF_NAMESPACE}
+    ET.register_namespace("", XLIFF_NAMESPACE)
+    old_translations = {}
+    for unit in ET.parse(old_xliff_path).getroot().iterfind(".//xliff:trans-unit", ns):
+        source = unit.find("xliff:source", ns)
+        target = unit.find("xliff:target", ns)
+        if source is not None and source.text and target is not None and target.text:
+            old_translations[source.text] = target.text
+
+    xliff_pairs = {xliff_text(new_text): xliff_text(old_text) for new_text, old_text in pairs.items()}
+    new_tree = ET.parse(new_xliff_path)
+    carried = 0
+    to_review = 0
+    for unit in new_tree.getroot().iterfind(".//xliff:trans-unit", ns):
+        source = unit.find("xliff:source", ns)
+        if source is None or source.text not in xliff_pairs:
+            continue
+        target = unit.find("xliff:target", ns)
+        if target is None:
+            target = ET.SubElement(unit, f"{{{XLIFF_NAMESPACE}}}target")
+        if target.text:
+            continue
+        old_source = xliff_pairs[source.text]
+        if old_source not in old_translations:
+            continue
+        target.text = old_translations[old_source]
+        carried += 1
+        if old_source != source.text:
+            target.set("state", REVIEW_STATE)
+            to_review += 1
+    new_tree.write(output_path, encoding="utf-8", xml_declaration=True)
+    return carried, to_review
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Сравнивает две версии .dat по функциям (добавлены/удалены/изменены, измененные строки) и переносит переводы XLIFF на неизмененные функции.")
+    parser.add_argument("old", help="Старый .dat или папка со старыми .dat.")
+    parser.add_argument("new", help="Новый .dat или папка с новыми .dat.")
+    parser.add_argument("--json", dest="json_report", default=None, help="Сохранить отчет в JSON файл.")
+    parser.add_argument("--old-xliff", default=None, help="XLIFF с переводами старой версии (для переноса переводов).")
+    parser.add_argument("--new-xliff", default=None, help="XLIFF, извлеченный из новой версии (для переноса переводов).")
+    parser.add_argument("-o", "--output", default=None, help=f"Куда записать XLIFF с перенесенными переводами. По умолчанию: {OUTPUT_XLIFF_FILE} рядом со скриптом.")
+    args = parser.parse_args()
+
+    if bool(args.old_xliff) != bool(args.new_xliff):
+        print(f"{Fore.RED}Ошибка: для переноса переводов нужны оба параметра --old-xliff и --new-xliff.{Style.RESET_ALL}")
+        sys.exit(1)
+
+    start_time = time.time()
+    try:
+        report, pairs = diff_paths(args.old, args.new)
+    except ValueError as e:
+        print(f"{Fore.RED}Ошибка: {e}{Style.RESET_ALL}")
+        sys.exit(1)
+    print_report(report)
+    totals = report["totals"]
+    print(f"\n--- {Style.BRIGHT}Сравнение завершено{Style.RESET_ALL} ---")
+    print(f"{Fore.GREEN}Добавлено функций:   {totals['added']}{Style.RESET_ALL}")
+    print(f"{Fore.RED}Удалено функций:     {totals['removed']}{Style.RESET_ALL}")
+    print(f"{Fore.YELLOW}Изменено функций:    {totals['changed']}{Style.RESET_ALL}")
+    print(f"Без изменений:       {totals['unchanged']}")
+    print(f"{Fore.CYAN}Измененных строк:    {totals['changed_strings']}{Style.RESET_ALL}")
+
+    if args.json_report:
+        with open(args.json_report, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=1)
+        print(f"{Fore.CYAN}Отчет сохранен в: {Style.BRIGHT}{args.json_report}{Style.RESET_ALL}")
+
+    if args.old_xliff:
+        output_path = args.output or os.path.join(os.path.dirname(os.path.abspath(__file__)), OUTPUT_XLIFF_FILE)
+        try:
+            carried, to_review = carry_forward_xliff(args.old_xliff, args.new_xliff, output_path, pairs)
+        except (OSError, ET.ParseError) as e:
+            print(f"{Fore.RED}Ошибка при переносе переводов: {e}{Style.RESET_ALL}")
+            sys.exit(1)
+        print(f"{Fore.GREEN}Перенесено переводов: {carried} (на проверку: {to_review}){Style.RESET_ALL}")
+        print(f"{Fore.CYAN}XLIFF сохранен в: {Style.BRIGHT}{output_path}{Style.RESET_ALL}")
+
+    print(f"{Fore.CYAN}Затраченное время:   {time.time() - start_time:.2f} сек.{Style.RESET_ALL}")
+    failed = [name for name, entry in report["scripts"].items() if entry.get("status") == "failed"]
+    sys.exit(1 if failed else 0)
@@ -0,0 +1,128 @@
+import sys
+import os
+import time
+import json
+import argparse
+import traceback
+from disasm.ED9StringPatcher import patch_dat_bytes
+
+try:
+    import colorama
+    colorama.init(autoreset=True)
+    Fore = colorama.Fore
+    Style = colorama.Style
+except ImportError:
+    print("Предупреждение: Библиотека colorama не найдена (pip install colorama). Цветной вывод будет отключен.")
+    class DummyStyle:
+        def __getattr__(self, name): return ""
+    Fore = DummyStyle(); Style = DummyStyle()
+
+# --- Конфигурация ---
+OUTPUT_DAT_SUBDIR = "patched_dat"    # Папка для пропатченных .dat
+STRMAP_FILE = "strings_map.json"     # Карта переводов {"оригинал": "перевод"}
+ONLY_TRANSLATED = True               # Записывать только файлы, в которых были замены
+# --------------------
+
+def load_string_map(strmap_filepath):
+    """Загружает карту строк из JSON. Возвращает dict или None."""
+    if not os.path.exists(strmap_filepath):
+        print(f"{Fore.RED}Ошибка: Файл карты строк '{strmap_filepath}' не найден.{Style.RESET_ALL}")
+        return None
+    try:
+        with open(strmap_filepath, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        return {str(k): str(v) for k, v in data.items()}
+    except (OSError, json.JSONDecodeError) as e:
+        print(f"{Fore.RED}Ошибка при чтении JSON карты строк '{strmap_filepath}': {e}{Style.RESET_ALL}")
+        return None
+
+def patch_files(dat_paths, output_dir_path, translation_map, only_translated):
+    """Патчит строки в каждом .dat напрямую, без промежуточных .py."""
+    os.makedirs(output_dir_path, exist_ok=True)
+    print(f"{Fore.CYAN}Выходная директория для .dat файлов: {Style.BRIGHT}{output_dir_path}{Style.RESET_ALL}")
+
+    patched_count = 0
+    skipped_count = 0
+    failed_files = []
+    total_replacements = 0
+    start_time = time.time()
+
+    for i, dat_path in enumerate(dat_paths):
+        filename = os.path.basename(dat_path)
+        print(f"--- [{i+1}/{len(dat_paths)}] {Style.BRIGHT}{filename}{Style.RESET_ALL} ---")
+        try:
+            with open(dat_path, 'rb') as f:
+                content = f.read()
+            patched, replacements = patch_dat_bytes(content, translation_map, os.path.splitext(filename)[0])
+        except Exception as e:
+            print(f"{Fore.RED}  Ошибка при обработке {filename}: {e}{Style.RESET_ALL}")
+            traceback.print_exc()
+            failed_files.append(filename)
+            continue
+
+        if only_translated and replacements == 0:
+            print(f"{Fore.YELLOW}  Пропуск: строки не были переведены.{Style.RESET_ALL}")
+            skipped_count += 1
+            continue
+        try:
+            with open(os.path.join(output_dir_path, filename), 'wb') as f:
+                f.write(patched)
+        except OSError as e:
+            print(f"{Fore.RED}  Ошибка записи {filename}: {e}{Style.RESET_ALL}")
+            failed_files.append(filename)
+            continue
+        print(f"{Fore.GREEN}  Замен строк: {replacements}{Style.RESET_ALL}")
+        patched_count += 1
+        total_replacements += replacements
+
+    total_time = time.time() - start_time
+    print(f"\n--- {Style.BRIGHT}Патчинг завершен{Style.RESET_ALL} ---")
+    print(f"Обработано .dat файлов: {len(dat_paths)}")
+    print(f"{Fore.GREEN}Записано файлов:        {patched_count}{Style.RESET_ALL}")
+    if only_translated:
+        print(f"{Fore.YELLOW}Пропущено (без перевода): {skipped_count}{Style.RESET_ALL}")
+    print(f"{(Fore.RED if failed_files else Fore.GREEN)}Файлов с ошибками:      {len(failed_files)}{Style.RESET_ALL}")
+    print(f"{Fore.CYAN}Всего замен строк:      {total_replacements}{Style.RESET_ALL}")
+    print(f"{Fore.CYAN}Затраченное время:      {total_time:.2f} сек.{Style.RESET_ALL}")
+    for fname in failed_files:
+        print(f"- {fname}")
+    return not failed_files
+
+def str_to_bool(value):
+    """Преобразует строку в булево значение."""
+    if isinstance(value, bool):
+        return value
+    if value.lower() in ('yes', 'true', 't', 'y', '1'):
+        return True
+    elif value.lower() in ('no', 'false', 'f', 'n', '0'):
+        return False
+    else:
+        raise argparse.ArgumentTypeError('Boolean value expected.')
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Вставляет переводы из карты строк прямо в .dat файлы (без дизассемблирования и сборки).")
+    parser.add_argument("-i", "--input", required=True, help="Путь к .dat файлу или папке с .dat файлами (оригиналы игры).")
+    parser.add_argument("-o", "--output", default=None, help=f"Папка для результата. По умолчанию: {OUTPUT_DAT_SUBDIR} рядом со скриптом.")
+    parser.add_argument("--map", default=None, help=f"Карта строк JSON. По умолчанию: {STRMAP_FILE} рядом со скриптом.")
+    parser.add_argument("--only-translated", type=str_to_bool, nargs='?', const=True, default=ONLY_TRANSLATED,
+                        help="Записывать только файлы, в которых были заменены строки. По умолчанию: true.")
+    args = parser.parse_args()
+
+    script_location = os.path.dirname(os.path.abspath(__file__))
+    output_dir = args.output or os.path.join(script_location, OUTPUT_DAT_SUBDIR)
+    strmap_path = args.map or os.path.join(script_location, STRMAP_FILE)
+
+    translation_map = load_string_map(strmap_path)
+    if translation_map is None:
+        sys.exit(1)
+    print(f"Загружено записей в карте строк: {len(translation_map)}")
+
+    if os.path.isdir(args.input):
+        dat_paths = sorted(os.path.join(args.input, f) for f in os.listdir(args.input) if f.lower().endswith(".dat"))
+    elif os.path.isfile(args.input):
+        dat_paths = [args.input]
+    else:
+        print(f"{Fore.RED}Ошибка: Путь '{args.input}' не найден.{Style.RESET_ALL}")
+        sys.exit(1)
+
+    sys.exit(0 if patch_files(dat_paths, output_dir, translation_map, args.only_translated) else 1)
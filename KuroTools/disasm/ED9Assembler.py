@@ -3,6 +3,7 @@ import struct
 import disasm.ED9InstructionsSet as ED9InstructionsSet
 import disasm.script as script
 import disasm.function as function
+import disasm.ED9IR as ED9IR
 from lib.parser import process_data, readint, readintoffset, readtextoffset, remove2MSB, get_actual_value_str
 from lib.packer import write_dword_in_byte_array
 import traceback
@@ -118,10 +119,9 @@ def set_current_function(name):
         variable_names[i] = "PARAM_" + str(i)
     current_function_number = current_function_number + 1
     
-def compile():
-    global current_script
-    global bin_code_section
-
+def link_script(scp, code_section, code_strings, jumps, return_addresses):
+    #Lays out all the sections around an already assembled code section and returns the bytes of the .dat
+    #code_strings: [(offset in code_section, string)], jumps: {label: jump}, return_addresses: [jump]
     bin_function_header_section = bytearray([])
     bin_script_header_section   = bytearray([])
     bin_fun_input_vars_section  = bytearray([])
@@ -137,17 +137,17 @@ def compile():
     strings_offsets_fun_varin     = []
     strings_offsets_fun_names     = []
 
-    #from here, we should have filled bin_code_section with placeholder pointers
+    #from here, we should have filled code_section with placeholder pointers
     #now we need to get all the necessary addresses (we have everything so we should be able to get all of them)
     
-    start_functions_var_out          = start_functions_headers_section + 0x20 * len(current_script.functions)
+    start_functions_var_out          = start_functions_headers_section + 0x20 * len(scp.functions)
     
     total_in      = 0
     total_out     = 0
     total_structs = 0
     size_total_params_structs = 0
     
-    for f in current_script.functions:
+    for f in scp.functions:
         total_in      = total_in      + len(f.input_args)
         total_out     = total_out     + len(f.output_args)
         total_structs = total_structs + len(f.structs)
@@ -158,17 +158,17 @@ def compile():
     start_structs_section           = start_functions_var_in + total_in * 4
     start_structs_params_section    = start_structs_section + 3 * 4 * total_structs
     start_script_variables          = start_structs_params_section + size_total_params_structs
-    start_code_section              = start_script_variables + len(current_script.script_variables_in) * 8 + len(current_script.script_variables_out) * 8
-    start_strings_section           = start_code_section + len(bin_code_section)
+    start_code_section              = start_script_variables + len(scp.script_variables_in) * 8 + len(scp.script_variables_out) * 8
+    start_strings_section           = start_code_section + len(code_section)
 
     #building the script header
     fourCC = "#scp"
     header_b = bytearray(fourCC.encode("ASCII"))
     header_b = header_b + bytearray(struct.pack("<I", start_functions_headers_section))
-    header_b = header_b + bytearray(struct.pack("<I", len(current_script.functions)))
+    header_b = header_b + bytearray(struct.pack("<I", len(scp.functions)))
     header_b = header_b + bytearray(struct.pack("<I", start_script_variables)) 
-    header_b = header_b + bytearray(struct.pack("<I", len(current_script.script_variables_in))) 
-    header_b = header_b + bytearray(struct.pack("<I", len(current_script.script_variables_out))) 
+    header_b = header_b + bytearray(struct.pack("<I", len(scp.script_variables_in))) 
+    header_b = header_b + bytearray(struct.pack("<I", len(scp.script_variables_out))) 
 
     current_addr_fun_var_in     = start_functions_var_in
     current_addr_fun_var_out    = start_functions_var_out
@@ -176,9 +176,9 @@ def compile():
     current_addr_structs_params = start_structs_params_section
     current_addr_script_vars    = start_script_variables
 
-    current_script.functions.sort(key=lambda fun: fun.id) 
+    scp.functions.sort(key=lambda fun: fun.id) 
 
-    for vin_scp in current_script.script_variables_in:
+    for vin_scp in scp.script_variables_in:
             for v in vin_scp:
                 if type(v) == str:
                     bin_script_var_section = bin_script_var_section + bytearray(struct.pack("<I", 0)) #placeholder
@@ -186,7 +186,7 @@ def compile():
                 else:
                     bin_script_var_section = bin_script_var_section + bytearray(struct.pack("<I",  v))
                 current_addr_script_vars = current_addr_script_vars  + 4
-    for vout_scp in current_script.script_variables_out:
+    for vout_scp in scp.script_variables_out:
         for v in vout_scp:
             if type(vout_scp) == str:
                 bin_script_var_section = bin_script_var_section + bytearray(struct.pack("<I", 0)) #placeholder
@@ -195,7 +195,7 @@ def compile():
                 bin_script_var_section = bin_script_var_section + bytearray(struct.pack("<I", v))
             current_addr_script_vars = current_addr_script_vars  + 4
 
-    for f in current_script.functions:
+    for f in scp.functions:
         header_f = bytearray(struct.pack("<I", start_code_section + f.start))
         vars     = len(f.input_args) + (f.b0 << 8) + (f.b1 << 16) + (len(f.output_args) << 24)
         header_f = header_f + bytearray(struct.pack("<I", vars))
@@ -239,28 +239,28 @@ def compile():
     #updating the jumps destination
     
     
-    for j in jump_dict.items():
+    for j in jumps.items():
         for start in j[1].addr_start:
-            write_dword_in_byte_array("<I", bin_code_section, start, start_code_section + j[1].addr_destination)
-    for j in return_addr_vector:
+            write_dword_in_byte_array("<I", code_section, start, start_code_section + j[1].addr_destination)
+    for j in return_addresses:
         for start in j.addr_start:
-            write_dword_in_byte_array("<I", bin_code_section, start, start_code_section + j.addr_destination)
+            write_dword_in_byte_array("<I", code_section, start, start_code_section + j.addr_destination)
     
             
     string_section_addr = start_strings_section     
     
     #first we write the strings from the code
-    for str_data in strings_offsets_code:
+    for str_data in code_strings:
         where_to_update_ptr = str_data[0]
         actual_string       = str_data[1]
         output = actual_string.encode("utf-8") + b"\0"
         bin_string_section = bin_string_section + output 
-        write_dword_in_byte_array("<I", bin_code_section, where_to_update_ptr, STR(string_section_addr))
+        write_dword_in_byte_array("<I", code_section, where_to_update_ptr, STR(string_section_addr))
         string_section_addr = string_section_addr + len(output)
     
     bin_file = header_b + bin_function_header_section + bin_fun_output_vars_section + bin_fun_input_vars_section 
     bin_file = bin_file +  bin_structs_section + bin_structs_params_section 
-    bin_file = bin_file + bin_script_var_section + bin_code_section
+    bin_file = bin_file + bin_script_var_section + code_section
     
     for str_data in strings_offsets_fun_names:
         where_to_update_ptr = str_data[0]
@@ -305,11 +305,104 @@ def compile():
     
     
     bin_file = bin_file + bin_string_section
-    
+    return bin_file
+
+def compile():
+    bin_file = link_script(current_script, bin_code_section, strings_offsets_code, jump_dict, return_addr_vector)
     dat_file = open(current_script.name + ".dat", "wb")
     dat_file.write(bin_file)
     dat_file.close()
 
+#Operand formats of the instructions with a single immediate operand, used by assemble_ir
+ir_operand_formats = {0x01: "<B", 0x02: "<i", 0x03: "<i", 0x04: "<i", 0x05: "<i", 0x06: "<i", 0x07: "<i", 0x08: "<i",
+                      0x09: "<B", 0x0A: "<B", 0x26: "<H", 0x27: "<B", 0x28: "<I"}
+
+def assemble_ir(ir, translation_map = None)->bytes:
+    #Assembles the compact IR (see ED9IR) in a single loop, without the stack tracking of the Python DSL
+    strings = ir["strings"]
+    if translation_map is None:
+        translation_map = {}
+
+    scp = script.script()
+    scp.name = ir["name"]
+    scp.script_variables_in = ir["varin"]
+    scp.script_variables_out = ir["varout"]
+    functions_ids = {}
+    for id_fun, f_ir in enumerate(ir["functions"]):
+        f = function.function()
+        f.id = id_fun
+        f.name = f_ir["name"]
+        f.hash = f_ir["hash"]
+        f.input_args = f_ir["input_args"]
+        f.output_args = f_ir["output_args"]
+        f.b0 = f_ir["b0"]
+        f.b1 = f_ir["b1"]
+        f.structs = f_ir["structs"]
+        scp.functions.append(f)
+        functions_ids[f.name] = id_fun
+
+    code = bytearray()
+    code_strings = []
+    jumps = {}
+    placeholder = b"\0\0\0\0"
+    for block in ir["code"]:
+        current_fun = scp.functions[functions_ids[block["function"]]]
+        current_fun.start = len(code)
+        for ins in block["instructions"]:
+            if type(ins) == str:
+                if ins not in jumps:
+                    jumps[ins] = jump()
+                jumps[ins].addr_destination = len(code)
+                continue
+            op_code = ins[0]
+            if op_code == 0:
+                if type(ins[1]) == int:
+                    code += b"\0\4" + struct.pack("<I", ins[1])
+                elif ins[1] == "S":
+                    text = strings[ins[2]]
+                    translated = ED9IR.lookup_translation(translation_map, text) #only PUSHSTRING is translated
+                    code_strings.append((len(code) + 2, text if translated is None else translated))
+                    code += b"\0\4" + placeholder
+                elif ins[1] == "L":
+                    if ins[2] not in jumps:
+                        jumps[ins[2]] = jump()
+                    jumps[ins[2]].addr_start.append(len(code) + 2)
+                    code += b"\0\4" + placeholder
+                else: #"F"
+                    code += b"\0\4" + struct.pack("<I", current_fun.id)
+            elif op_code in (0x0B, 0x0E, 0x0F, 0x25):
+                if ins[1] not in jumps:
+                    jumps[ins[1]] = jump()
+                jumps[ins[1]].addr_start.append(len(code) + 1)
+                code.append(op_code)
+                code += placeholder
+            elif op_code == 0x0C:
+                code.append(0x0C)
+                code += struct.pack("<H", functions_ids[ins[1]])
+            elif op_code in (0x22, 0x23):
+                code_strings.append((len(code) + 1, strings[ins[1]]))
+                code_strings.append((len(code) + 5, strings[ins[2]]))
+                code.append(op_code)
+                code += placeholder + placeholder + struct.pack("<B", ins[3])
+            elif op_code == 0x24:
+                code += bytearray([0x24, ins[1], ins[2], ins[3]])
+            elif op_code in ir_operand_formats:
+                code.append(op_code)
+                code += struct.pack(ir_operand_formats[op_code], ins[1])
+            else:
+                code.append(op_code)
+
+    return bytes(link_script(scp, code, code_strings, jumps, []))
+
+def compile_ir(ir_path, translation_map = None, output_path = None):
+    ir = ED9IR.load_ir(ir_path)
+    bin_file = assemble_ir(ir, translation_map)
+    if output_path is None:
+        output_path = ir["name"] + ".dat"
+    with open(output_path, "wb") as dat_file:
+        dat_file.write(bin_file)
+    return output_path
+
 def create_script_header(name, varin, varout):
     global current_script
     current_script.name = name
@@ -1,9 +1,13 @@
+import io
 import math
 import struct
 import os
+import time
+import contextlib
 from pathlib import Path
-from lib.parser import process_data, readint, readintoffset, readtextoffset, remove2MSB, get_actual_value_str
+from lib.parser import process_data, readint, readintoffset, readtextoffset, remove2MSB, get_actual_value_str, identifytype
 from disasm.script import script
+from disasm.ED9IR import IR_FORMAT, IR_VERSION, IR_EXTENSION, save_ir
 import disasm.ED9InstructionsSet as ED9InstructionsSet
 import traceback
 from processcle import processCLE
@@ -17,38 +21,96 @@ def get_var_symbol(var_names, stack) -> str:
     return output
 
 class ED9Disassembler(object):
-    def __init__(self, markers, decomp):
+    def __init__(self, markers, decomp, output_format = "py", preamble = "", profile = False):
         self.markers = markers
         self.decomp = decomp
+        self.preamble = preamble #written at the very top of the .py (e.g. sys.path setup)
+        self.output_format = output_format #"py", "ir" (compact IR, see ED9IR) or "both"
+        self.return_addresses_added = False
+        self.profile = profile #collect phase timers and counters in self.stats
+        self.stats = {}
         self.smallest_data_ptr = -1
         self.dict_stacks = {}
         self.instruction_stacks = {}
         self.variables_names = {}
         self.stream = None
 
-    def parse(self, path):
+    @contextlib.contextmanager
+    def phase(self, name):
+        #Adds the time spent in the block to self.stats["phases"][name] (only with profile)
+        if not self.profile:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            phases = self.stats["phases"]
+            phases[name] = phases.get(name, 0) + time.perf_counter() - start
+
+    def parse(self, path, archive = None):
+        #archive: lib.p3a.P3AArchive to read path from; the entry is decrypted in memory, the archive is not modified
         filename = Path(path).stem
-        filesize = os.path.getsize(path)
-
-        self.stream = open(path, "rb")
-        magic = self.stream.read(4)
-        if magic != b"#scp":
-            with open(path, mode='rb') as encrypted_file: 
-                fileContent = encrypted_file.read()
-            decrypted_file = processCLE(fileContent)
-            with open(path, "w+b") as outputfile:
-                outputfile.write(decrypted_file)
+        start_time = time.perf_counter()
+        if archive is not None:
+            content = archive.read(path)
+            self.stats = {"file": os.path.basename(path), "bytes": len(content), "phases": {}}
+            if content[:4] != b"#scp":
+                with self.phase("cle_decode"):
+                    content = processCLE(content)
+            filesize = len(content)
+            self.stream = io.BytesIO(content)
+        else:
             filesize = os.path.getsize(path)
+            self.stats = {"file": os.path.basename(path), "bytes": filesize, "phases": {}}
             self.stream = open(path, "rb")
+            magic = self.stream.read(4)
+            if magic != b"#scp":
+                with self.phase("cle_decode"):
+                    with open(path, mode='rb') as encrypted_file: 
+                        fileContent = encrypted_file.read()
+                    decrypted_file = processCLE(fileContent)
+                    with open(path, "w+b") as outputfile:
+                        outputfile.write(decrypted_file)
+                    filesize = os.path.getsize(path)
+                    self.stream = open(path, "rb")
             
         self.stream.seek(0)
         self.smallest_data_ptr = filesize
-        self.script = script(self.stream, filename, markers = self.markers)
-        self.write_script()
+        self.script = script(self.stream, filename, markers = self.markers, timings = self.stats["phases"] if self.profile else None)
+        if self.output_format in ("py", "both"):
+            self.write_script()
+        if self.output_format in ("ir", "both"):
+            self.write_ir()
+        if self.profile:
+            self.collect_stats(filesize, time.perf_counter() - start_time)
+
+    def collect_stats(self, decoded_size, total_time):
+        instructions = [instruction for f in self.script.functions for instruction in f.instructions]
+        strings = sum(1 for instruction in instructions if instruction.op_code == 0 and instruction.name == "PUSHSTRING")
+        strings += sum(2 for instruction in instructions if instruction.op_code in (0x22, 0x23))
+        decode_time = self.stats["phases"].get("header", 0) + self.stats["phases"].get("instructions", 0)
+        self.stats.update({
+            "decoded_bytes": decoded_size,
+            "functions": len(self.script.functions),
+            "instructions": len(instructions),
+            "strings": strings,
+            "total": total_time,
+            "instructions_per_sec": len(instructions) / decode_time if decode_time > 0 else 0,
+        })
+
+    def print_stats(self):
+        print(f"{self.stats['file']}: {self.stats['bytes']} bytes ({self.stats['decoded_bytes']} decoded), "
+              f"{self.stats['functions']} functions, {self.stats['instructions']} instructions, {self.stats['strings']} strings")
+        for name, seconds in self.stats["phases"].items():
+            print(f"  {name:<22} {seconds * 1000:10.2f} ms")
+        print(f"  {'total':<22} {self.stats['total'] * 1000:10.2f} ms")
+        print(f"  {self.stats['instructions_per_sec']:.0f} instructions/s decoded")
 
 
     def write_script(self):
         python_file = open(self.script.name + ".py", "wt",encoding='utf8')
+        python_file.write(self.preamble)
         python_file.write("from disasm.ED9Assembler import *\n\n")
         python_file.write("def script():\n")
         python_file.write("\n    create_script_header(\n")
@@ -90,17 +152,99 @@ class ED9Disassembler(object):
 
         if (self.decomp == False):
             for f in functions_sorted_by_addr:
-                self.add_return_addresses(f)
-                python_file.write(self.disassemble_function(f))
+                with self.phase("add_return_addresses"):
+                    self.add_return_addresses(f)
+                with self.phase("disassemble"):
+                    text = self.disassemble_function(f)
+                with self.phase("write"):
+                    python_file.write(text)
+            self.return_addresses_added = True
         else:
             for f in functions_sorted_by_addr:
-                python_file.write(self.decompile_function(f))
+                with self.phase("decompile"):
+                    text = self.decompile_function(f)
+                with self.phase("write"):
+                    python_file.write(text)
 
         python_file.write("\n    compile()")
         python_file.write("\n\nscript()")
         python_file.close()
 
 
+    def write_ir(self):
+        #Same content as the disassembled (not decompiled) .py, but as data: see ED9IR for the format
+        functions_sorted_by_addr = self.script.functions.copy()
+        functions_sorted_by_addr.sort(key=lambda fun: fun.start)
+        if not self.return_addresses_added:
+            self.dict_stacks = {}
+            with self.phase("add_return_addresses"):
+                for f in functions_sorted_by_addr:
+                    self.add_return_addresses(f)
+            self.return_addresses_added = True
+
+        strings = []
+        string_ids = {}
+        def string_id(value):
+            text = readtextoffset(self.stream, remove2MSB(value))
+            if text not in string_ids:
+                string_ids[text] = len(strings)
+                strings.append(text)
+            return string_ids[text]
+
+        ir = {
+            "format": IR_FORMAT,
+            "version": IR_VERSION,
+            "name": self.script.name,
+            "varin": [[self.ir_value(v) for v in var] for var in self.script.script_variables_in],
+            "varout": [[self.ir_value(v) for v in var] for var in self.script.script_variables_out],
+            "functions": [],
+            "strings": strings,
+            "code": [],
+        }
+        for f in self.script.functions:
+            ir["functions"].append({
+                "name": f.name,
+                "hash": f.hash,
+                "input_args": [self.ir_value(v) for v in f.input_args],
+                "output_args": [self.ir_value(v) for v in f.output_args],
+                "b0": f.b0,
+                "b1": f.b1,
+                "structs": [{"id": st["id"], "nb_sth1": st["nb_sth1"], "array2": [self.ir_value(v) for v in st["array2"]]} for st in f.structs],
+            })
+
+        for f in functions_sorted_by_addr:
+            instructions = []
+            for instruction in f.instructions:
+                if instruction.addr in ED9InstructionsSet.locations_dict:
+                    instructions.append(ED9InstructionsSet.locations_dict[instruction.addr])
+                op_code = instruction.op_code
+                operands = [op.value for op in instruction.operands]
+                if op_code == 0:
+                    if instruction.name == "PUSHSTRING":
+                        instructions.append([0, "S", string_id(operands[0])])
+                    elif instruction.name == "PUSHRETURNADDRESS":
+                        instructions.append([0, "L", operands[0]])
+                    elif instruction.name == "PUSHCALLERFUNCTIONINDEX":
+                        instructions.append([0, "F"])
+                    else:
+                        instructions.append([0, operands[0]])
+                elif op_code in (0x22, 0x23):
+                    instructions.append([op_code, string_id(operands[0]), string_id(operands[1]), operands[2]])
+                elif op_code == 0x24:
+                    (id_struct, command_op_code) = ED9InstructionsSet.reverse_commands_dict[operands[1]]
+                    instructions.append([0x24, id_struct, command_op_code, operands[0]])
+                else:
+                    instructions.append([op_code] + operands)
+            ir["code"].append({"function": f.name, "instructions": instructions})
+
+        with self.phase("write"):
+            save_ir(ir, self.script.name + IR_EXTENSION)
+
+    def ir_value(self, value):
+        if identifytype(value) == "string":
+            return readtextoffset(self.stream, remove2MSB(value))
+        return value
+
     def add_function_str(self, function)->str:
 
         result = "    add_function(\n"
@@ -0,0 +1,81 @@
+import os
+import json
+
+#Compact IR of a script: a flat instruction list with labels and a string table.
+#Written by ED9Disassembler.write_ir, assembled by ED9Assembler.assemble_ir without executing Python.
+#
+#{
+#  "format": "ED9IR", "version": 1, "name": "...",
+#  "varin": [[v, v], ...], "varout": [[v, v], ...],        v: raw MSB-encoded int, or str for strings
+#  "functions": [{"name", "hash", "input_args", "output_args", "b0", "b1", "structs": [{"id", "nb_sth1", "array2"}]}],  by id
+#  "strings": ["...", ...],                                 strings referenced by the code
+#  "code": [{"function": "name", "instructions": [...]}],   in address order
+#}
+#
+#Instructions: "Loc_N" (label definition) or [op_code, operands...]
+#  [0, value]                   push of a raw MSB-encoded value
+#  [0, "S", id]                 PUSHSTRING strings[id]
+#  [0, "L", label]              PUSHRETURNADDRESS
+#  [0, "F"]                     PUSHCALLERFUNCTIONINDEX
+#  [0x0B|0x0E|0x0F|0x25, label] jumps / PUSHRETURNADDRESSFROMANOTHERSCRIPT
+#  [0x0C, function name]        CALL
+#  [0x22|0x23, id1, id2, nb]    CALLFROMANOTHERSCRIPT(2), ids in strings
+#  [0x24, struct, op, nb]       RUNCMD
+#  [op, value]                  any other instruction with one operand
+#  [op]                         instructions without operands
+
+IR_FORMAT = "ED9IR"
+IR_VERSION = 1
+IR_EXTENSION = ".ir.json"
+
+def normalize_string_key(text):
+    #The disassembler writes " as ' in the .py, so the keys of strings_map.json use '
+    return text.replace('"', "'")
+
+def lookup_translation(translation_map, text):
+    """Translation of text (exact or normalized key), or None if there is none."""
+    for key in (text, normalize_string_key(text)):
+        if key in translation_map:
+            translated = translation_map[key]
+            return None if translated == key else translated
+    return None
+
+def save_ir(ir, path):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(ir, f, ensure_ascii=False, separators=(",", ":"))
+
+def load_ir(path):
+    with open(path, "r", encoding="utf-8") as f:
+        ir = json.load(f)
+    if ir.get("format") != IR_FORMAT or ir.get("version") != IR_VERSION:
+        raise ValueError(f"{os.path.basename(path)}: неподдерживаемый формат IR")
+    return ir
+
+def iter_pushstrings(ir):
+    """Ids in ir["strings"] of every PUSHSTRING, in code order."""
+    for block in ir["code"]:
+        for ins in block["instructions"]:
+            if type(ins) != str and ins[0] == 0 and ins[1] == "S":
+                yield ins[2]
+
+def find_script_sources(directory):
+    """
+    Returns {base name: path} of the source to use for each script in directory.
+    The IR is preferred unless the .py is newer (edited by hand).
+    """
+    sources = {}
+    for filename in os.listdir(directory):
+        path = os.path.join(directory, filename)
+        if filename.lower().endswith(IR_EXTENSION):
+            base = filename[:-len(IR_EXTENSION)]
+        elif filename.lower().endswith(".py"):
+            base = filename[:-3]
+        else:
+            continue
+        if base not in sources:
+            sources[base] = path
+            continue
+        other = sources[base]
+        ir_path, py_path = (path, other) if path.lower().endswith(IR_EXTENSION) else (other, path)
+        sources[base] = py_path if os.path.getmtime(py_path) > os.path.getmtime(ir_path) else ir_path
+    return sources
@@ -0,0 +1,173 @@
+import io
+from lib.parser import readintoffset, remove2MSB, identifytype
+from lib.packer import write_dword_in_byte_array
+from disasm.script import script
+from disasm.ED9IR import lookup_translation
+import disasm.ED9InstructionsSet as ED9InstructionsSet
+from processcle import processCLE
+
+#Прямая замена строк в .dat без дизассемблирования/сборки.
+#Ни один раздел до секции строк не меняет размер, поэтому достаточно пересобрать
+#секцию строк (она всегда в конце файла) и переписать все указатели на строки.
+
+#Типы мест, где хранится указатель на строку
+SITE_PUSHSTRING   = "pushstring"  #PUSHSTRING в коде - единственные переводимые строки
+SITE_CALL         = "call"        #CALLFROMANOTHERSCRIPT(2): имена скрипта и функции
+SITE_FUN_NAME     = "fun_name"    #Имя функции в заголовке
+SITE_FUN_VAROUT   = "fun_varout"
+SITE_FUN_VARIN    = "fun_varin"
+SITE_STRUCT_PARAM = "struct_param"
+SITE_SCRIPT_VAR   = "script_var"
+
+class ED9StringPatcher(object):
+    def __init__(self, translation_map):
+        self.translation_map = translation_map
+        self.data = None
+        self.script = None
+        self.sites = [] #(тип, смещение указателя в файле, адрес строки)
+        self.strings_start = -1
+        self.replacements = 0
+
+    def load(self, file_content, name = ""):
+        """Разбирает .dat (при необходимости расшифровывает CLE) и собирает все указатели на строки."""
+        if file_content[0:4] != b"#scp":
+            file_content = processCLE(file_content)
+        if file_content[0:4] != b"#scp":
+            raise ValueError("Файл не является скриптом ED9 (#scp)")
+        self.data = bytearray(file_content)
+        ED9InstructionsSet.reset_state()
+        self.script = script(io.BytesIO(file_content), name)
+        self.strings_start = ED9InstructionsSet.smallest_data_ptr
+        self.collect_sites()
+
+    def add_value_site(self, kind, offset):
+        value = readintoffset_bytes(self.data, offset)
+        if identifytype(value) == "string":
+            self.sites.append((kind, offset, remove2MSB(value)))
+
+    def collect_sites(self):
+        self.sites = []
+        stream = io.BytesIO(self.data)
+        for f in self.script.functions:
+            self.sites.append((SITE_FUN_NAME, f.header_addr + 0x1C, remove2MSB(readintoffset_bytes(self.data, f.header_addr + 0x1C))))
+            for id_out in range(len(f.output_args)):
+                self.add_value_site(SITE_FUN_VAROUT, f.out_ptr + id_out * 4)
+            for id_in in range(len(f.input_args)):
+                self.add_value_site(SITE_FUN_VARIN, f.in_ptr + id_in * 4)
+            for id_st in range(len(f.structs)):
+                ptr_sth = readintoffset(stream, f.structs_ptr + id_st * 0xC + 8, 4)
+                for id_arr in range(len(f.structs[id_st]["array2"])):
+                    self.add_value_site(SITE_STRUCT_PARAM, ptr_sth + id_arr * 4)
+            for instr in f.instructions:
+                if instr.op_code == 0 and instr.name == "PUSHSTRING":
+                    #opcode, size, value
+                    self.sites.append((SITE_PUSHSTRING, instr.addr + 2, remove2MSB(instr.operands[0].value)))
+                elif instr.op_code in (0x22, 0x23):
+                    for id_op in range(2):
+                        if identifytype(instr.operands[id_op].value) == "string":
+                            self.sites.append((SITE_CALL, instr.addr + 1 + id_op * 4, remove2MSB(instr.operands[id_op].value)))
+        nb_script_vars = len(self.script.script_variables_in) + len(self.script.script_variables_out)
+        for id_var in range(nb_script_vars * 2):
+            self.add_value_site(SITE_SCRIPT_VAR, self.script.script_variables_ptr + id_var * 4)
+
+    def split_strings_section(self):
+        """Делит секцию строк на последовательность нуль-терминированных фрагментов [(начало, байты)]."""
+        chunks = []
+        pos = self.strings_start
+        end = len(self.data)
+        while pos < end:
+            zero = self.data.find(b"\0", pos)
+            next_pos = end if zero == -1 else zero + 1
+            chunks.append((pos, bytes(self.data[pos:next_pos])))
+            pos = next_pos
+        return chunks
+
+    def translate(self, raw):
+        translated = lookup_translation(self.translation_map, raw.rstrip(b"\0").decode("utf-8"))
+        if translated is None:
+            return None
+        return translated.encode("utf-8") + b"\0"
+
+    def patch(self):
+        """Пересобирает секцию строк и переписывает указатели. Возвращает новые байты файла."""
+        if self.strings_start >= len(self.data):
+            return bytes(self.data) #строк нет
+        chunks = self.split_strings_section()
+        chunk_starts = [c[0] for c in chunks]
+        chunk_index = {start: i for i, start in enumerate(chunk_starts)}
+
+        #Какие фрагменты используются только как переводимые строки
+        kinds_by_chunk = {}
+        for kind, offset, ptr in self.sites:
+            if ptr in chunk_index:
+                kinds_by_chunk.setdefault(chunk_index[ptr], set()).add(kind)
+
+        new_section = bytearray()
+        new_starts = []
+        translated_chunks = {} #индекс фрагмента -> перевод (для общих фрагментов)
+        for i, (start, raw) in enumerate(chunks):
+            new_starts.append(self.strings_start + len(new_section))
+            translated = self.translate(raw) if SITE_PUSHSTRING in kinds_by_chunk.get(i, ()) else None
+            if translated is not None and kinds_by_chunk[i] == {SITE_PUSHSTRING}:
+                new_section += translated
+                translated_chunks[i] = None #переведен на месте
+            else:
+                new_section += raw
+                if translated is not None:
+                    translated_chunks[i] = translated #переведенная копия будет дописана в конец
+
+        appended = {} #байты строки -> адрес в новой секции (для дописанных в конец строк)
+        def append_string(raw):
+            if raw not in appended:
+                appended[raw] = self.strings_start + len(new_section)
+                new_section.extend(raw)
+            return appended[raw]
+
+        for kind, offset, ptr in self.sites:
+            if ptr < self.strings_start or ptr >= len(self.data):
+                print(f"Предупреждение: указатель на строку 0x{ptr:X} по адресу 0x{offset:X} вне секции строк, пропущен.")
+                continue
+            if ptr in chunk_index:
+                i = chunk_index[ptr]
+                if kind == SITE_PUSHSTRING and translated_chunks.get(i) is not None:
+                    new_ptr = append_string(translated_chunks[i])
+                else:
+                    new_ptr = new_starts[i]
+                if kind == SITE_PUSHSTRING and i in translated_chunks:
+                    self.replacements += 1
+            else:
+                #Указатель в середину фрагмента (общий суффикс)
+                i = self.find_chunk(chunk_starts, ptr)
+                if i in translated_chunks and translated_chunks[i] is None:
+                    #Фрагмент переведен на месте - суффикс сохраняем отдельной строкой
+                    zero = self.data.find(b"\0", ptr)
+                    suffix = bytes(self.data[ptr:] if zero == -1 else self.data[ptr:zero + 1])
+                    new_ptr = append_string(suffix)
+                else:
+                    new_ptr = new_starts[i] + (ptr - chunk_starts[i])
+            write_dword_in_byte_array("<I", self.data, offset, STR(new_ptr))
+
+        return bytes(self.data[:self.strings_start]) + bytes(new_section)
+
+    @staticmethod
+    def find_chunk(chunk_starts, ptr):
+        lo, hi = 0, len(chunk_starts) - 1
+        while lo < hi:
+            mid = (lo + hi + 1) // 2
+            if chunk_starts[mid] <= ptr:
+                lo = mid
+            else:
+                hi = mid - 1
+        return lo
+
+def readintoffset_bytes(data, offset):
+    return int.from_bytes(data[offset:offset + 4], byteorder="little")
+
+def STR(value: int)->int:
+    return (value & 0x3FFFFFFF) | 0xC0000000
+
+def patch_dat_bytes(file_content, translation_map, name = ""):
+    """Возвращает (новые байты .dat, кол-во замен)."""
+    patcher = ED9StringPatcher(translation_map)
+    patcher.load(file_content, name)
+    return patcher.patch(), patcher.replacements
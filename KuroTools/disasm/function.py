@@ -11,7 +11,13 @@ class function:
         self.instructions = []
         self.hash = -1
         self.start = -1
+        #Addresses of the tables referenced by the header (used by the string patcher)
+        self.header_addr = -1
+        self.out_ptr = -1
+        self.in_ptr = -1
+        self.structs_ptr = -1
         if stream != None:
+            self.header_addr = stream.tell()
             self.start = readint(stream, 4)
             varin = readint(stream, 1)
             self.b0 = readint(stream, 1)
@@ -20,6 +26,8 @@ class function:
 
             out_ptr = readint(stream, 4)
             in_ptr = readint(stream, 4)
+            self.out_ptr = out_ptr
+            self.in_ptr = in_ptr
 
             for id_out in range(varout):
                 self.output_args.append(readintoffset(stream, out_ptr + id_out * 4, 4))
@@ -30,6 +38,7 @@ class function:
             
             nb_structs = readint(stream, 4)
             structs_ptr = readint(stream, 4)
+            self.structs_ptr = structs_ptr
 
             for id_st in range(nb_structs):
                 id_chr = readintoffset(stream, structs_ptr + id_st * 0xC + 0, 4, signed = True)
@@ -1,52 +1,79 @@
 
 import os
+import io
+import sys
+import contextlib
+import time
 from lib.parser import process_data, readint, readintoffset, readtextoffset, remove2MSB, get_actual_value_str, identifytype
 import disasm.ED9InstructionsSet as ED9InstructionsSet
 import disasm.function as function
 
+def read_header(dat_file):
+    """
+    Parses the script header, the script variables and the function table (without the code).
+    Returns (script_variables_ptr, script_variables_in, script_variables_out, functions sorted by id).
+    """
+    script_variables_in = []
+    script_variables_out = []
+    functions = []
+    fourCC = readint(dat_file, 4)
+    start_ptr = readint(dat_file, 4)
+    functions_count = readint(dat_file, 4)
+    script_variables_ptr = readint(dat_file, 4)
+    script_variables_in_count = readint(dat_file, 4)
+    script_variables_out_count = readint(dat_file, 4)
+
+    #Retrieving script variables if any
+    for id_var in range(script_variables_in_count):
+        vars = []
+        for id_field in range(2):
+            var = readintoffset(dat_file, script_variables_ptr + id_var * 8 + id_field * 4, 4)
+            if (identifytype(var) == "string"):
+                actual_ptr = remove2MSB(var)
+                if actual_ptr < ED9InstructionsSet.smallest_data_ptr:
+                    ED9InstructionsSet.smallest_data_ptr = actual_ptr
+            vars.append(var)
+        script_variables_in.append(vars)
+    for id_var in range(script_variables_out_count):
+        vars = []
+        for id_field in range(2):
+            var = readintoffset(dat_file, script_variables_ptr + len(script_variables_in) * 8 + id_var * 8 + id_field * 4, 4)
+            if (identifytype(var) == "string"):
+                actual_ptr = remove2MSB(var)
+                if actual_ptr < ED9InstructionsSet.smallest_data_ptr:
+                    ED9InstructionsSet.smallest_data_ptr = actual_ptr
+            vars.append(var)
+        script_variables_out.append(vars)
+    #Parsing functions headers 
+    for id_fun in range(functions_count):
+        functions.append(function.function(dat_file, id_fun))
+    return script_variables_ptr, script_variables_in, script_variables_out, functions
+
+def read_instructions(dat_file, fun, end_addr):
+    """Decodes the code of fun up to end_addr (or up to the string section if it starts earlier)."""
+    dat_file.seek(fun.start)
+    while (dat_file.tell() < end_addr):
+        op_code = readint(dat_file, 1)
+        instruction = ED9InstructionsSet.instruction(dat_file, op_code)
+        fun.instructions.append(instruction)
+       
+        if ED9InstructionsSet.smallest_data_ptr < end_addr:
+            end_addr = ED9InstructionsSet.smallest_data_ptr
+
 class script:
 
-    def __init__(self, dat_file = None, name = "", markers = False):
+    def __init__(self, dat_file = None, name = "", markers = False, timings = None):
+        #timings: optional dict, receives the time (s) spent in "header" and "instructions"
         self.name = name
         script_variables_in = []
         script_variables_out = []
         functions = []
+        self.script_variables_ptr = -1
         if dat_file != None:
             #Parsing script header
-            fourCC = readint(dat_file, 4)
-            start_ptr = readint(dat_file, 4)
-            functions_count = readint(dat_file, 4)
-            script_variables_ptr = readint(dat_file, 4)
-            script_variables_in_count = readint(dat_file, 4)
-            script_variables_out_count = readint(dat_file, 4)
-        
-            #Retrieving script variables if any
-            for id_var in range(script_variables_in_count):
-                vars = []
-                for id_field in range(2):
-                    var = readintoffset(dat_file, script_variables_ptr + id_var * 8 + id_field * 4, 4)
-                    if (identifytype(var) == "string"):
-                        actual_ptr = remove2MSB(var)
-                        if actual_ptr < ED9InstructionsSet.smallest_data_ptr:
-                            ED9InstructionsSet.smallest_data_ptr = actual_ptr
-                    vars.append(var)
-                script_variables_in.append(vars)
-            for id_var in range(script_variables_out_count):
-                vars = []
-                for id_field in range(2):
-                    var = readintoffset(dat_file, script_variables_ptr + len(script_variables_in) * 8 + id_var * 8 + id_field * 4, 4)
-                    if (identifytype(var) == "string"):
-                        actual_ptr = remove2MSB(var)
-                        if actual_ptr < ED9InstructionsSet.smallest_data_ptr:
-                            ED9InstructionsSet.smallest_data_ptr = actual_ptr
-                    vars.append(var)
-                script_variables_out.append(vars)
-            #Parsing functions headers 
-            for id_fun in range(functions_count):
-                functions.append(function.function(dat_file, id_fun))
-
-            dat_file.seek(0, os.SEEK_END)
-            file_size = dat_file.tell()
+            start_time = time.perf_counter()
+            self.script_variables_ptr, script_variables_in, script_variables_out, functions = read_header(dat_file)
+            header_time = time.perf_counter()
         
             functions.sort(key=lambda fun: fun.start) 
 
@@ -56,25 +83,96 @@ class script:
                else:
                    end_addr = ED9InstructionsSet.smallest_data_ptr
 
-               dat_file.seek(functions[id_f].start)
                #Reading the instructions
-
-               while (dat_file.tell() < end_addr):
-                   op_code = readint(dat_file, 1)
-                   instruction = ED9InstructionsSet.instruction(dat_file, op_code)
-                   functions[id_f].instructions.append(instruction)
-                  
-                   if ED9InstructionsSet.smallest_data_ptr < end_addr:
-                       end_addr = ED9InstructionsSet.smallest_data_ptr
-
-           
+               read_instructions(dat_file, functions[id_f], end_addr)
 
             functions.sort(key=lambda fun: fun.id) 
-
-            
-            
+            if timings is not None:
+                timings["header"] = timings.get("header", 0) + header_time - start_time
+                timings["instructions"] = timings.get("instructions", 0) + time.perf_counter() - header_time
 
         self.functions = functions
         self.script_variables_in = script_variables_in
         self.script_variables_out = script_variables_out  
 
+class ScriptFile:
+    """
+    Lazy view of a script: only the header and the function table are parsed when opening.
+    The code of a function is decoded on first access and cached, so reading metadata
+    (names, hashes, varin/varout) or a single function does not decode the whole file.
+
+    Each ScriptFile keeps its own decoding state (labels, start of the string section),
+    so several files can be open at the same time.
+    """
+
+    def __init__(self, source, name = ""):
+        #source: path to a .dat or its content (bytes). Encrypted/compressed files are decoded with processCLE.
+        if isinstance(source, (bytes, bytearray)):
+            content = bytes(source)
+        else:
+            with open(source, "rb") as f:
+                content = f.read()
+            if name == "":
+                name = os.path.splitext(os.path.basename(source))[0]
+        if content[0:4] != b"#scp":
+            from processcle import processCLE
+            content = processCLE(content)
+        if content[0:4] != b"#scp":
+            raise ValueError(f"{name}: not an ED9 script (#scp)")
+        self.name = name
+        self.stream = io.BytesIO(content)
+        self.locations_dict = {}
+        self.location_counter = 0
+        self.smallest_data_ptr = sys.maxsize
+        with self.decoding_state():
+            self.script_variables_ptr, self.script_variables_in, self.script_variables_out, self.functions = read_header(self.stream)
+        self.functions_by_name = {fun.name: fun for fun in self.functions}
+        self.functions_by_start = sorted(self.functions, key=lambda fun: fun.start)
+        self.decoded = set() #ids of the functions whose code is decoded
+
+    @contextlib.contextmanager
+    def decoding_state(self):
+        #The instruction decoders work on the module state of ED9InstructionsSet: swap ours in and out
+        saved = (ED9InstructionsSet.locations_dict, ED9InstructionsSet.location_counter, ED9InstructionsSet.smallest_data_ptr)
+        ED9InstructionsSet.locations_dict = self.locations_dict
+        ED9InstructionsSet.location_counter = self.location_counter
+        ED9InstructionsSet.smallest_data_ptr = self.smallest_data_ptr
+        try:
+            yield
+        finally:
+            self.locations_dict = ED9InstructionsSet.locations_dict
+            self.location_counter = ED9InstructionsSet.location_counter
+            self.smallest_data_ptr = ED9InstructionsSet.smallest_data_ptr
+            ED9InstructionsSet.locations_dict, ED9InstructionsSet.location_counter, ED9InstructionsSet.smallest_data_ptr = saved
+
+    def function_names(self):
+        return [fun.name for fun in self.functions]
+
+    def get_function(self, key):
+        """Function by name or id, with its instructions decoded."""
+        fun = self.functions_by_name[key] if isinstance(key, str) else self.functions[key]
+        self.decode(fun)
+        return fun
+
+    def decode(self, fun):
+        if fun.id in self.decoded:
+            return
+        position = self.functions_by_start.index(fun)
+        if position == len(self.functions_by_start) - 1:
+            #The last function ends where the string section starts, which is only fully known
+            #once the strings pushed by the other functions have been seen
+            for other in self.functions_by_start[:-1]:
+                self.decode(other)
+            end_addr = self.smallest_data_ptr
+        else:
+            end_addr = self.functions_by_start[position + 1].start
+        with self.decoding_state():
+            read_instructions(self.stream, fun, end_addr)
+        self.decoded.add(fun.id)
+
+    def load_all(self):
+        """Decodes every function; the result is equivalent to script(...)."""
+        for fun in self.functions_by_start:
+            self.decode(fun)
+        return self
+
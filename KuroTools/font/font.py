@@ -1,67 +1,96 @@
 
+import re
 import sys
-import os 
 import struct
-from pathlib import Path
-from lib.parser import readint
+from array import array
+from collections import namedtuple
 
-class character:
-    def __init__(self, stream):
-        self.addr = stream.tell()
-        self.code = readint(stream, 4)
-        self.int0 = readint(stream, 4)
-        self.GNF_X = readint(stream, 2)
-        self.GNF_Y = readint(stream, 2)
-        self.half0 = readint(stream, 2)
-        self.half1 = readint(stream, 2)
-        self.half2 = readint(stream, 2)
-        self.half3 = readint(stream, 2)
-        self.half4 = readint(stream, 2)
-        self.half5 = readint(stream, 2)
+#Glyph table (FLTI) of the game font: fixed 24-byte records read in one struct.iter_unpack pass.
+#
+#    glyphs = load_glyph_index("font_en.fnt")  # {code point: Glyph}
+#    "Ж" in glyphs
+#    widths = WidthTable(glyphs.values())
+#    widths.line_width("Привет")
+#    widths.line_width(split_lines(target)[0])
 
-    def to_string(self)->str:
-        print("Character at " + str(hex(self.addr)))
-        pixel_nb = self.GNF_X + self.GNF_Y * 4096
-        result = ""
-        result = result + str(hex(self.addr)) + ";" + "\"" + chr(self.code) + "\"" + ";" + str(hex(self.int0)) + ";" + str((self.GNF_X)) + ";" + str((self.GNF_Y)) + ";" + str(pixel_nb) + ";" + str(hex(self.half0))+ ";"
-        result = result + str(hex(self.half1)) + ";" + str(hex(self.half2)) + ";" + str(hex(self.half3)) + ";" + str(hex(self.half4))+ ";"
-        result = result + str(hex(self.half5))+ ";"
-        return result
+FONT_MAGIC = b'FCV\0'
+GLYPH_TABLE_MAGIC = b'FLTI'
+#FCV\0, half0, half1, char_count, half2..half5, int0..int2, FLTI, table size
+FONT_HEADER = struct.Struct("<4sHHIHHHHIII4sI")
+GLYPH = struct.Struct("<IIHHHHHHHH")
 
-def parse_font_file(font_file_path):
-    filename = Path(font_file_path).stem
-    filesize = os.path.getsize(font_file_path)
+Glyph = namedtuple("Glyph", ["addr", "code", "int0", "GNF_X", "GNF_Y", "half0", "half1", "half2", "half3", "half4", "half5"])
+
+#Markup in translated text (XLIFF targets, strings_map.json) that is not drawn with glyphs
+LINE_BREAK = "\\n" #Line break as written by py_to_xliff (\n escaped as \\n)
+CONTROL_CODE_RE = re.compile(r"#\d*[A-Za-z](?:\[[^\]]*\]|_[0-9A-Z])?") #Control codes (#K, #0T, #E[5], #M_0, #003c)
+
+CSV_HEADER = "Address;Character;Int0;GNF_X_Origin;GNF_Y_Origin;Pixel_Nb;Width;Height;(Green = 0x100, Red = 0x200);Half0;Half1;Half2;\n"
+
+def read_glyphs(data):
+    """All glyph records of a font file (bytes), in file order."""
+    if len(data) < FONT_HEADER.size:
+        raise ValueError("not a font file")
+    header = FONT_HEADER.unpack_from(data, 0)
+    if header[0] != FONT_MAGIC or header[11] != GLYPH_TABLE_MAGIC:
+        raise ValueError("not a font file (FCV/FLTI magic not found)")
+    start = FONT_HEADER.size
+    #The table size is in bytes; a partial record at the end is ignored
+    size = min(header[12], len(data) - start)
+    end = start + size - size % GLYPH.size
+    return [Glyph(addr, *fields) for addr, fields in zip(range(start, end, GLYPH.size), GLYPH.iter_unpack(data[start:end]))]
+
+def displayed_text(text):
+    """Text as drawn in game: control codes removed, escaped line breaks turned into real ones."""
+    return CONTROL_CODE_RE.sub("", text.replace(LINE_BREAK, "\n"))
+
+def split_lines(text):
+    return displayed_text(text).split("\n")
+
+def load_glyph_index(font_file_path):
+    """{code point: Glyph}."""
     with open(font_file_path, "rb") as fnt_file:
-        fourCC = readint(fnt_file, 4)
-        font_fcc = struct.unpack("<I",b'FCV\0')[0]
-        
-        if fourCC == font_fcc:
-            half0 = readint(fnt_file, 2)
-            half1 = readint(fnt_file, 2)
-            char_count = readint(fnt_file, 4)
-            half2 = readint(fnt_file, 2)
-            half3 = readint(fnt_file, 2)
-            half4 = readint(fnt_file, 2)
-            half5 = readint(fnt_file, 2)
-            int0 = readint(fnt_file, 4)
-            int1 = readint(fnt_file, 4)
-            int2 = readint(fnt_file, 4)
-            fourcc2 = readint(fnt_file, 4)
-            font_fcc2 = struct.unpack("<I",b'FLTI')[0]
-            if fourcc2 == font_fcc2:
-                size = readint(fnt_file, 4)
-                current_addr = 0
-                chr_list = []
-                while(current_addr < size):
-                    start = fnt_file.tell()
-                    chr_list.append(character(fnt_file))
-                    current_addr = current_addr + fnt_file.tell() - start
-                
-                with open('font.csv', 'w', encoding="utf-8") as f:
-                    f.write("Address;Character;Int0;GNF_X_Origin;GNF_Y_Origin;Pixel_Nb;Width;Height;(Green = 0x100, Red = 0x200);Half0;Half1;Half2;"+"\n")
-                    for chr in chr_list:
+        glyphs = read_glyphs(fnt_file.read())
+    return {glyph.code: glyph for glyph in glyphs}
+
+class WidthTable(object):
+    """Advance width (half0, the Width column of font.csv) of every code point, for measuring lines of text."""
+    def __init__(self, glyphs, missing_width = None):
+        widths = {glyph.code: glyph.half0 for glyph in glyphs if glyph.code <= sys.maxunicode}
+        #Characters missing from the font are measured as the widest glyph unless told otherwise
+        if missing_width is None:
+            missing_width = max(widths.values(), default=0)
+        self.missing_width = missing_width
+        self.table = array("H", [missing_width]) * (sys.maxunicode + 1)
+        for code, width in widths.items():
+            self.table[code] = width
+        #When every width fits in a byte, str.translate maps a whole line to one character per width
+        #and sum() adds up the encoded bytes, so no Python code runs per character
+        self.translation = None
+        if max(widths.values(), default=0) < 256 and missing_width < 256:
+            self.translation = bytes(array("B", self.table)).decode("latin-1")
+
+    def line_width(self, line):
+        if self.translation is not None:
+            return sum(line.translate(self.translation).encode("latin-1"))
+        return sum(map(self.table.__getitem__, map(ord, line)))
 
-                        f.write(chr.to_string() + "\n")
+def glyph_to_csv(glyph):
+    pixel_nb = glyph.GNF_X + glyph.GNF_Y * 4096
+    return (f"{glyph.addr:#x};\"{chr(glyph.code)}\";{glyph.int0:#x};{glyph.GNF_X};{glyph.GNF_Y};{pixel_nb};"
+            f"{glyph.half0:#x};{glyph.half1:#x};{glyph.half2:#x};{glyph.half3:#x};{glyph.half4:#x};{glyph.half5:#x};\n")
+
+def parse_font_file(font_file_path):
+    with open(font_file_path, "rb") as fnt_file:
+        glyphs = read_glyphs(fnt_file.read())
+    with open('font.csv', 'w', encoding="utf-8") as f:
+        f.write(CSV_HEADER)
+        f.writelines(glyph_to_csv(glyph) for glyph in glyphs)
+    print(f"{len(glyphs)} characters written to font.csv")
 
 if __name__ == "__main__":
-    parse_font_file(sys.argv[1])
+    try:
+        parse_font_file(sys.argv[1])
+    except (OSError, ValueError) as e:
+        print(f"{sys.argv[1]}: {e}")
+        sys.exit(1)
@@ -0,0 +1,330 @@
+import sys
+import json
+import time
+import heapq
+import shutil
+import argparse
+import xml.etree.ElementTree as ET
+from array import array
+from collections import Counter
+from lib.xliff_reader import iter_trans_units
+from translation_memory import TranslationMemory, fill_empty_targets
+try:
+    import colorama
+    colorama.init(autoreset=True)
+    Fore = colorama.Fore
+    Style = colorama.Style
+except ImportError:
+    class DummyStyle:
+        def __getattr__(self, name): return ""
+    Fore = Style = DummyStyle()
+
+# Необязательное ускорение: rapidfuzz считает расстояние Левенштейна на C
+try:
+    from rapidfuzz.distance import Levenshtein as rapidfuzz_levenshtein # type: ignore
+except ImportError:
+    rapidfuzz_levenshtein = None
+
+# Нечеткий поиск по исходникам переведенных XLIFF (из памяти переводов или из файлов напрямую).
+# 1. Отбор кандидатов: инвертированный индекс триграмм -> строки, считаются общие триграммы.
+#    Просматриваются только самые редкие триграммы запроса (в пределах POSTINGS_BUDGET):
+#    частые (" th", "the") встречаются почти везде и ничего не отбирают, но стоят дороже всего.
+# 2. Переранжирование: расстояние Левенштейна с отсечением по k - максимуму правок для порога.
+#    Порог поднимается по мере нахождения хороших вариантов, поэтому k быстро уменьшается.
+# Сходство = 1 - расстояние / длина более длинной строки.
+
+# --- Конфигурация ---
+FUZZY_THRESHOLD = 0.75      # Минимальное сходство (0..1)
+MAX_RESULTS = 5             # Вариантов на один запрос
+SHORTLIST_SIZE = 30         # Кандидатов после отбора по триграммам, которые проверяются расстоянием
+POSTINGS_BUDGET = 40000     # Сколько записей индекса просматривается на запрос (берутся самые редкие триграммы)
+CACHE_SUFFIX = ".fuzzy.cache" # Кэш индекса рядом с базой памяти переводов
+CACHE_VERSION = 2
+# --------------------
+
+def trigrams(text):
+    """Множество триграмм строки (с пробелом по краям, чтобы короткие строки и имена тоже находились)."""
+    padded = f" {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+def bounded_levenshtein(a, b, max_distance):
+    """
+    Расстояние Левенштейна, если оно не больше max_distance (k), иначе max_distance + 1.
+    Строки, длины которых отличаются больше чем на k, отсекаются сразу; остальные считаются
+    бит-параллельным алгоритмом Майерса (столбец матрицы - одно целое число) с выходом,
+    как только расстояние гарантированно превысит k. В чистом Python это в несколько раз быстрее
+    обычной ленточной матрицы шириной 2k+1.
+    """
+    la, lb = len(a), len(b)
+    too_far = max_distance + 1
+    if abs(la - lb) > max_distance:
+        return too_far
+    if rapidfuzz_levenshtein is not None:
+        return rapidfuzz_levenshtein.distance(a, b, score_cutoff=max_distance)
+    if la > lb:
+        a, b, la, lb = b, a, lb, la
+    if la == 0:
+        return lb
+    match_masks = {}
+    for i, char in enumerate(a):
+        match_masks[char] = match_masks.get(char, 0) | (1 << i)
+    full = (1 << la) - 1
+    last = 1 << (la - 1)
+    pv, mv, score = full, 0, la
+    remaining = lb
+    for char in b:
+        eq = match_masks.get(char, 0)
+        xv = eq | mv
+        xh = (((eq & pv) + pv) ^ pv) | eq
+        ph = mv | (~(xh | pv) & full)
+        mh = pv & xh
+        if ph & last:
+            score += 1
+        elif mh & last:
+            score -= 1
+        # На каждом оставшемся символе расстояние может уменьшиться не больше чем на 1
+        remaining -= 1
+        if score - remaining > max_distance:
+            return too_far
+        ph = ((ph << 1) | 1) & full
+        mh = (mh << 1) & full
+        pv = mh | (~(xv | ph) & full)
+        mv = ph & xv
+    return score if score <= max_distance else too_far
+
+def similarity(a, b, threshold=FUZZY_THRESHOLD):
+    """Сходство строк (0..1) или 0.0, если оно ниже порога."""
+    longest = max(len(a), len(b))
+    if longest == 0:
+        return 1.0
+    max_distance = int((1.0 - threshold) * longest)
+    distance = bounded_levenshtein(a, b, max_distance)
+    if distance > max_distance:
+        return 0.0
+    return 1.0 - distance / longest
+
+class FuzzyIndex(object):
+    def __init__(self):
+        self.sources = []
+        self.targets = []
+        self.gram_counts = array('I')  # Число разных триграмм каждой строки
+        self.postings = {}             # {триграмма: array номеров строк}
+
+    def __len__(self):
+        return len(self.sources)
+
+    def add(self, source, target):
+        doc = len(self.sources)
+        self.sources.append(source)
+        self.targets.append(target)
+        grams = trigrams(source)
+        self.gram_counts.append(len(grams))
+        for gram in grams:
+            posting = self.postings.get(gram)
+            if posting is None:
+                posting = self.postings[gram] = array('I')
+            posting.append(doc)
+
+    @classmethod
+    def from_pairs(cls, pairs):
+        index = cls()
+        for source, target in pairs:
+            index.add(source, target)
+        return index
+
+    @classmethod
+    def from_xliff_files(cls, xliff_paths):
+        """Индекс по переведенным юнитам XLIFF файлов (одинаковые исходники берутся один раз)."""
+        seen = set()
+        index = cls()
+        for xliff_path in xliff_paths:
+            for unit in iter_trans_units(xliff_path):
+                if not unit.source or not unit.target or not unit.target.strip():
+                    continue
+                source = unit.source.strip()
+                if source in seen:
+                    continue
+                seen.add(source)
+                index.add(source, unit.target.strip())
+        return index
+
+    # Кэш индекса - только данные, без pickle (чтение файла из общей папки не должно исполнять код):
+    # первая строка - JSON {signature, sources, targets, grams, lengths}, дальше массивы uint32 (little-endian):
+    # gram_counts и номера строк всех триграмм подряд, по lengths штук на триграмму в порядке grams.
+    def save_cache(self, cache_path, signature):
+        grams = list(self.postings)
+        header = {"signature": list(signature), "sources": self.sources, "targets": self.targets,
+                  "grams": grams, "lengths": [len(self.postings[gram]) for gram in grams]}
+        gram_counts = array('I', self.gram_counts)
+        docs = array('I')
+        for gram in grams:
+            docs.extend(self.postings[gram])
+        if sys.byteorder == "big":
+            gram_counts.byteswap()
+            docs.byteswap()
+        with open(cache_path, 'wb') as f:
+            f.write(json.dumps(header, ensure_ascii=False, separators=(",", ":")).encode("utf-8") + b"\n")
+            gram_counts.tofile(f)
+            docs.tofile(f)
+
+    @classmethod
+    def load_cache(cls, cache_path, signature):
+        """Индекс из кэша или None, если кэша нет, он от другой базы или поврежден."""
+        with open(cache_path, 'rb') as f:
+            header = json.loads(f.readline())
+            if header["signature"] != list(signature):
+                return None
+            numbers = array('I')
+            numbers.frombytes(f.read())
+        if sys.byteorder == "big":
+            numbers.byteswap()
+        sources, targets, lengths = header["sources"], header["targets"], header["lengths"]
+        if len(targets) != len(sources) or len(numbers) != len(sources) + sum(lengths):
+            return None
+        index = cls()
+        index.sources, index.targets = sources, targets
+        index.gram_counts = numbers[:len(sources)]
+        pos = len(sources)
+        for gram, length in zip(header["grams"], lengths):
+            index.postings[gram] = numbers[pos:pos + length]
+            pos += length
+        return index
+
+    @classmethod
+    def from_translation_memory(cls, tm, use_cache=True):
+        """Индекс по памяти переводов. Построенный индекс кэшируется рядом с базой до следующего импорта."""
+        cache_path = tm.db_path + CACHE_SUFFIX
+        signature = (CACHE_VERSION,) + tm.signature()
+        if use_cache:
+            try:
+                index = cls.load_cache(cache_path, signature)
+                if index is not None:
+                    return index
+            except (OSError, ValueError, KeyError, TypeError):
+                pass
+        index = cls.from_pairs(tm.best_entries())
+        if use_cache:
+            try:
+                index.save_cache(cache_path, signature)
+            except OSError as e:
+                print(f"{Fore.YELLOW}Предупреждение: Не удалось сохранить кэш индекса '{cache_path}': {e}{Style.RESET_ALL}")
+        return index
+
+    def shortlist(self, grams):
+        """Номера строк с наибольшей долей общих редких триграмм (коэффициент Дайса), лучшие первыми."""
+        postings = sorted((self.postings[gram] for gram in grams if gram in self.postings), key=len)
+        if not postings:
+            return []
+        # Самая редкая триграмма берется всегда, остальные - пока не исчерпан бюджет
+        counts = Counter(postings[0])
+        budget = POSTINGS_BUDGET - len(postings[0])
+        for posting in postings[1:]:
+            budget -= len(posting)
+            if budget < 0:
+                break
+            counts.update(posting)
+        query_count = len(grams)
+        gram_counts = self.gram_counts
+        candidates = counts.most_common(SHORTLIST_SIZE * 4)
+        return heapq.nlargest(SHORTLIST_SIZE, (doc for doc, _ in candidates),
+                              key=lambda doc: 2.0 * counts[doc] / (query_count + gram_counts[doc]))
+
+    def search(self, text, threshold=FUZZY_THRESHOLD, limit=MAX_RESULTS):
+        """Похожие исходники: [(сходство, исходник, перевод)], лучшие первыми."""
+        text = text.strip()
+        if not text:
+            return []
+        best = [] # Куча (сходство, номер строки) из limit лучших
+        for doc in self.shortlist(trigrams(text)):
+            # Пока не набрано limit вариантов, нужен порог; дальше - лучше худшего из найденных
+            floor = best[0][0] if len(best) >= limit else threshold
+            score = similarity(text, self.sources[doc], floor)
+            if score < floor or score == 0.0:
+                continue
+            if len(best) < limit:
+                heapq.heappush(best, (score, doc))
+            elif score > best[0][0]:
+                heapq.heapreplace(best, (score, doc))
+        best.sort(reverse=True)
+        return [(score, self.sources[doc], self.targets[doc]) for score, doc in best]
+
+    def best_matches(self, sources, threshold=FUZZY_THRESHOLD):
+        """Лучшее совпадение для каждого исходника: {индекс: (сходство, перевод)}."""
+        matches = {}
+        for idx, source in enumerate(sources):
+            found = self.search(source, threshold, limit=1)
+            if found:
+                matches[idx] = (found[0][0], found[0][2])
+        return matches
+
+def target_attributes(score):
+    """Атрибуты <target> для подставленного варианта: неточные совпадения требуют вычитки."""
+    if score >= 1.0:
+        return {"state-qualifier": "exact-match"}
+    return {"state": "needs-review-translation", "state-qualifier": "fuzzy-match"}
+
+def prefill(index, xliff_path, output_path, threshold=FUZZY_THRESHOLD):
+    """Заполняет пустые <target> лучшими совпадениями не ниже порога. Возвращает (заполнено, пустых)."""
+    def find_translations(sources):
+        return {idx: (translation, target_attributes(score))
+                for idx, (score, translation) in index.best_matches(sources, threshold).items()}
+    return fill_empty_targets(xliff_path, output_path, find_translations)
+
+def load_index(db_path=None, reference_files=None, use_cache=True):
+    start_time = time.time()
+    if reference_files:
+        index = FuzzyIndex.from_xliff_files(reference_files)
+    else:
+        with TranslationMemory(db_path) as tm:
+            index = FuzzyIndex.from_translation_memory(tm, use_cache)
+    print(f"{Fore.CYAN}Индекс: {len(index)} строк, {len(index.postings)} триграмм ({time.time() - start_time:.2f} сек.){Style.RESET_ALL}")
+    return index
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Нечеткий поиск переводов (триграммы + расстояние Левенштейна) по памяти переводов или переведенным XLIFF.")
+    parser.add_argument("--db", default=None, help="Файл базы памяти переводов. По умолчанию: общая база (см. translation_memory.py).")
+    parser.add_argument("-r", "--reference", nargs="+", default=None, metavar="XLIFF",
+                        help="Искать по этим переведенным XLIFF вместо памяти переводов.")
+    parser.add_argument("-t", "--threshold", type=float, default=FUZZY_THRESHOLD,
+                        help=f"Минимальное сходство 0..1. По умолчанию: {FUZZY_THRESHOLD}.")
+    parser.add_argument("--no-cache", action="store_true", help="Не использовать и не сохранять кэш индекса.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    prefill_parser = subparsers.add_parser("prefill", help="Заполнить пустые <target> лучшими совпадениями (с пометкой на вычитку).")
+    prefill_parser.add_argument("xliff_file", help="XLIFF для предзаполнения.")
+    prefill_parser.add_argument("-o", "--output", default=None, help="Выходной файл. По умолчанию входной файл перезаписывается (с копией .bak).")
+
+    search_parser = subparsers.add_parser("search", help="Найти похожие строки.")
+    search_parser.add_argument("text", help="Исходный текст (как в XLIFF, переносы строк как \\n).")
+    search_parser.add_argument("-n", "--limit", type=int, default=MAX_RESULTS, help=f"Сколько вариантов показать. По умолчанию: {MAX_RESULTS}.")
+
+    args = parser.parse_args()
+
+    try:
+        index = load_index(args.db, args.reference, not args.no_cache)
+    except (OSError, ET.ParseError) as e:
+        print(f"{Fore.RED}Ошибка при построении индекса: {e}{Style.RESET_ALL}")
+        sys.exit(1)
+
+    if args.command == "search":
+        start_time = time.time()
+        results = index.search(args.text, args.threshold, args.limit)
+        elapsed_ms = (time.time() - start_time) * 1000
+        if not results:
+            print(f"{Fore.YELLOW}Совпадений не ниже {args.threshold:.0%} нет.{Style.RESET_ALL}")
+        for score, source, target in results:
+            print(f"{Fore.GREEN}{score:.0%}{Style.RESET_ALL}  {source}\n      -> {target}")
+        print(f"{Style.DIM}({elapsed_ms:.1f} мс){Style.RESET_ALL}")
+
+    elif args.command == "prefill":
+        output_path = args.output or args.xliff_file
+        start_time = time.time()
+        try:
+            if output_path == args.xliff_file:
+                shutil.copy2(args.xliff_file, args.xliff_file + ".bak")
+            filled, empty = prefill(index, args.xliff_file, output_path, args.threshold)
+        except (OSError, ET.ParseError) as e:
+            print(f"{Fore.RED}Ошибка при обработке '{args.xliff_file}': {e}{Style.RESET_ALL}")
+            sys.exit(1)
+        print(f"{Fore.GREEN}Заполнено: {filled} из {empty} пустых переводов ({time.time() - start_time:.2f} сек.){Style.RESET_ALL}")
+        print(f"{Fore.CYAN}Результат сохранен в: {Style.BRIGHT}{output_path}{Style.RESET_ALL}")
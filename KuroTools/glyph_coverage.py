@@ -0,0 +1,93 @@
+import sys
+import json
+import time
+import argparse
+import xml.etree.ElementTree as ET
+from collections import Counter
+from lib.xliff_reader import iter_trans_units
+from font.font import load_glyph_index, displayed_text
+try:
+    import colorama
+    colorama.init(autoreset=True)
+    Fore = colorama.Fore
+    Style = colorama.Style
+except ImportError:
+    class DummyStyle:
+        def __getattr__(self, name): return ""
+    Fore = Style = DummyStyle()
+
+# Проверка, что в шрифте игры есть все символы перевода: пустые квадраты вместо букв
+# (например, редкой кириллицы, «ё», типографских кавычек) иначе видны только в игре.
+# Переводы читаются потоково (<target> из XLIFF или значения strings_map.json), за один проход.
+# Проверяется текст в том виде, как он выводится: без управляющих кодов (#K, #E[5]...) и маркеров переноса \n.
+
+# --- Конфигурация ---
+IGNORED_CHARACTERS = "\n\r\t" # Управляющие символы, которых не бывает в шрифте
+EXAMPLES_PER_CHARACTER = 3    # Сколько ID/строк с символом показывать в отчете
+# --------------------
+
+def iter_translations(path):
+    """(ID или исходная строка, перевод) для каждого непустого перевода файла."""
+    if path.lower().endswith(".json"):
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        for original, translation in data.items():
+            if isinstance(translation, str) and translation:
+                yield original, translation
+        return
+    for unit in iter_trans_units(path):
+        if unit.target:
+            yield unit.id, unit.target
+
+def find_missing_glyphs(paths, font_codes):
+    """
+    Возвращает ({символ: кол-во употреблений}, {символ: [примеры ID]}, кол-во проверенных строк)
+    для символов, которых нет в font_codes.
+    """
+    missing_counts = Counter()
+    examples = {}
+    checked = 0
+    ignored = set(IGNORED_CHARACTERS)
+    for path in paths:
+        for key, text in iter_translations(path):
+            checked += 1
+            text = displayed_text(text)
+            # Разность множеств по строке дешевле, чем проверка каждого символа
+            missing = set(text) - font_codes - ignored
+            for char in missing:
+                missing_counts[char] += text.count(char)
+                char_examples = examples.setdefault(char, [])
+                if len(char_examples) < EXAMPLES_PER_CHARACTER:
+                    char_examples.append(key)
+    return missing_counts, examples, checked
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Поиск символов перевода, которых нет в шрифте игры.")
+    parser.add_argument("font", help="Файл шрифта игры (FCV/FLTI).")
+    parser.add_argument("files", nargs="+", help="XLIFF или strings_map.json с переводами.")
+    args = parser.parse_args()
+
+    start_time = time.time()
+    try:
+        glyphs = load_glyph_index(args.font)
+    except (OSError, ValueError) as e:
+        print(f"{Fore.RED}Ошибка при чтении шрифта '{args.font}': {e}{Style.RESET_ALL}")
+        sys.exit(1)
+    # Символы шрифта как строки, чтобы сравнивать с set(text) без перевода в коды
+    font_codes = {chr(code) for code in glyphs if code <= sys.maxunicode}
+
+    try:
+        missing_counts, examples, checked = find_missing_glyphs(args.files, font_codes)
+    except (OSError, ET.ParseError, json.JSONDecodeError) as e:
+        print(f"{Fore.RED}Ошибка при чтении переводов: {e}{Style.RESET_ALL}")
+        sys.exit(1)
+
+    print(f"Символов в шрифте: {len(glyphs)}, проверено строк: {checked} ({time.time() - start_time:.2f} сек.)")
+    if not missing_counts:
+        print(f"{Fore.GREEN}Все символы перевода есть в шрифте.{Style.RESET_ALL}")
+        sys.exit(0)
+    print(f"{Fore.RED}Нет в шрифте: {len(missing_counts)} символов{Style.RESET_ALL}")
+    for char, count in missing_counts.most_common():
+        shown = char if char.isprintable() and not char.isspace() else " "
+        print(f"  {shown}  U+{ord(char):04X}  {count:>7}  {Style.DIM}{', '.join(examples[char])}{Style.RESET_ALL}")
+    sys.exit(1)
@@ -2,6 +2,7 @@ import os
 import xml.etree.ElementTree as ET
 import json
 import sys
+from lib.xliff_reader import iter_trans_units
 try:
     import colorama
     colorama.init(autoreset=True)
@@ -24,41 +25,34 @@ def create_string_map_from_xliff(xliff_filepath, strmap_filepath):
     translation_map_for_json = {}
 
     print(f"{Fore.CYAN}Чтение XLIFF файла: {Style.BRIGHT}{xliff_filepath}{Style.RESET_ALL}...")
-    try:
-        tree = ET.parse(xliff_filepath)
-        root = tree.getroot()
-    except (FileNotFoundError, ET.ParseError) as e:
-        print(f"{Fore.RED}Ошибка при чтении XLIFF файла: {e}{Style.RESET_ALL}")
-        return False
-
-    namespaces = {'xliff': 'urn:oasis:names:tc:xliff:document:1.2'}
     loaded_count = 0
     skipped_no_target = 0
 
-    for trans_unit in root.findall(".//xliff:trans-unit", namespaces):
-        id_attr = trans_unit.get("id")
-        source_element = trans_unit.find("xliff:source", namespaces)
-        target_element = trans_unit.find("xliff:target", namespaces)
-
-        if source_element is None or source_element.text is None:
-            print(f"{Fore.YELLOW}Предупреждение: Пропущен trans-unit с ID '{id_attr}', т.к. отсутствует <source>.{Style.RESET_ALL}")
-            continue
+    try:
+        # XLIFF читается потоково: разобранные trans-unit сразу освобождаются
+        for unit in iter_trans_units(xliff_filepath):
+            if unit.source is None:
+                print(f"{Fore.YELLOW}Предупреждение: Пропущен trans-unit с ID '{unit.id}', т.к. отсутствует <source>.{Style.RESET_ALL}")
+                continue
 
-        # Получаем исходный текст, заменяя \\n на \n
-        source_text = source_element.text.replace("\\n", "\n")
+            # Получаем исходный текст, заменяя \\n на \n
+            source_text = unit.source.replace("\\n", "\n")
 
-        # Получаем текст перевода, если он есть, иначе используем исходный
-        target_text = None
-        if target_element is not None and target_element.text:
-             target_text = target_element.text.replace("\\n", "\n")
-        else:
-             skipped_no_target +=1
+            # Получаем текст перевода, если он есть, иначе используем исходный
+            target_text = None
+            if unit.target:
+                 target_text = unit.target.replace("\\n", "\n")
+            else:
+                 skipped_no_target +=1
 
-        text_to_use = target_text if target_text else source_text
+            text_to_use = target_text if target_text else source_text
 
-        # Добавляем в словарь для JSON
-        translation_map_for_json[source_text] = text_to_use
-        loaded_count += 1
+            # Добавляем в словарь для JSON
+            translation_map_for_json[source_text] = text_to_use
+            loaded_count += 1
+    except (FileNotFoundError, ET.ParseError) as e:
+        print(f"{Fore.RED}Ошибка при чтении XLIFF файла: {e}{Style.RESET_ALL}")
+        return False
 
     print(f"Загружено строк из XLIFF: {loaded_count}")
     if skipped_no_target > 0:
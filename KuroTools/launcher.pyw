@@ -15,10 +15,9 @@ import time
 import platform
 import shutil
 import json           # Added for JSON operations
-import uuid           # Added for generating unique IDs
 import xml.etree.ElementTree as ET # Added for XLIFF operations
-import xml.dom.minidom # Added for pretty printing XLIFF
 import string as string_module # For character checks
+from lib.xliff_writer import ContentIds, XliffWriter # Stable content-hash IDs and streaming output for TBL strings
 
 # --- Configuration ---
 customtkinter.set_appearance_mode("System")
@@ -41,7 +40,6 @@ else:
 PARSER_FOLDER_NAME = "Parser"
 PARSER_FOLDER_PATH = os.path.join(MAIN_PATH, PARSER_FOLDER_NAME)
 DATA_TO_PY_FOLDER = "data_to_py"
-DATA_TO_PY_DECOMPILE_TEMP_FOLDER = "data_to_py_DECOMPILE"
 # --- TBL Constants ---
 TBL_TO_JSON_FOLDER = "tbl_to_json" # Relative to MAIN_PATH (Source for parsing/assembly)
 JSON_TO_TBL_FOLDER = "json_to_tbl" # Relative to MAIN_PATH (Output for assembly)
@@ -857,85 +855,26 @@ class App(customtkinter.CTk):
         thread.start()
 
     def _execute_extract_sequence(self):
-        succ=True
+        # Strings are read straight from the .dat files (py_to_xliff.py --dat-dir), no .py is generated
         err=False
-        opath=os.path.join(MAIN_PATH,DATA_TO_PY_FOLDER)
-        tpath=os.path.join(MAIN_PATH,DATA_TO_PY_DECOMPILE_TEMP_FOLDER)
-        oexists=os.path.isdir(opath)
         if not self.last_dat_input_dir or not os.path.isdir(self.last_dat_input_dir):
             self.message_queue.put({"type":"error","data":"CRIT: DAT input dir missing."})
             self.message_queue.put({"type":"done"})
             return
         try:
-            if oexists:
-                self.message_queue.put({"type":"output","data":self.get_string('log_rename_orig_to_temp',orig=DATA_TO_PY_FOLDER,temp=DATA_TO_PY_DECOMPILE_TEMP_FOLDER)})
-                try:
-                    if os.path.exists(tpath):
-                        shutil.rmtree(tpath)
-                        self.message_queue.put({"type":"output","data":f" (Note: Removed old temp '{DATA_TO_PY_DECOMPILE_TEMP_FOLDER}')","tags":("info_log",)})
-                    shutil.move(opath,tpath)
-                except Exception as e:
-                    self.message_queue.put({"type":"error","data":self.get_string('log_rename_failed',orig=DATA_TO_PY_FOLDER,temp=DATA_TO_PY_DECOMPILE_TEMP_FOLDER,e=e)})
-                    err=True
-                    succ=False
-                    return
-            else:
-                self.message_queue.put({"type":"output","data":self.get_string('error_orig_folder_missing',path=DATA_TO_PY_FOLDER),"tags":("warning_log",)})
-            sdef1=self.script_definitions.get('1_disassemble')
-            spath1=os.path.join(MAIN_PATH,sdef1[0])
-            cmd1=[PYTHON_EXECUTABLE,"-u",spath1,"-i",self.last_dat_input_dir,"--decompile-mode","false"]
-            exit1=self._run_command_and_wait(cmd1,f"{sdef1[0]} (Extract)")
-            if exit1!=0:
-                self.message_queue.put({"type":"error","data":self.get_string('log_run_disasm_extract_fail')})
-                err=True
-                succ=False
-                return
-            if not os.path.isdir(opath):
-                if exit1==0:
-                     self.message_queue.put({"type":"error","data":f"ERR: '{DATA_TO_PY_FOLDER}' not created."})
-                err=True
-                succ=False
-                return
             sdef2=self.script_definitions.get('2_extract')
             spath2=os.path.join(MAIN_PATH,sdef2[0])
-            cmd2=[PYTHON_EXECUTABLE,"-u",spath2]
+            cmd2=[PYTHON_EXECUTABLE,"-u",spath2,"--dat-dir",self.last_dat_input_dir]
             exit2=self._run_command_and_wait(cmd2,sdef2[0])
             if exit2!=0:
                 self.message_queue.put({"type":"error","data":self.get_string('log_run_pytoxliff_fail')})
                 err=True
-                succ=False
         except Exception as e:
             self.message_queue.put({"type":"error","data":f"ERR DAT extract: {e}"})
             err=True
-            succ=False
             import traceback
             traceback.print_exc()
         finally:
-            try:
-                if os.path.isdir(opath):
-                    self.message_queue.put({"type":"output","data":self.get_string('log_delete_temp_py',path=DATA_TO_PY_FOLDER)})
-                    try:
-                        shutil.rmtree(opath)
-                    except Exception as e:
-                        self.message_queue.put({"type":"error","data":self.get_string('log_delete_failed',path=DATA_TO_PY_FOLDER,e=e)})
-                        err=True
-                if oexists:
-                     if os.path.isdir(tpath):
-                        self.message_queue.put({"type":"output","data":self.get_string('log_rename_temp_to_orig',temp=DATA_TO_PY_DECOMPILE_TEMP_FOLDER,orig=DATA_TO_PY_FOLDER)})
-                        try:
-                            if os.path.exists(opath):
-                                shutil.rmtree(opath)
-                                self.message_queue.put({"type":"output","data":f" (Note: Removed target '{DATA_TO_PY_FOLDER}')","tags":("info_log",)})
-                            shutil.move(tpath,opath)
-                        except Exception as e:
-                            self.message_queue.put({"type":"error","data":self.get_string('error_restore_failed',temp=DATA_TO_PY_DECOMPILE_TEMP_FOLDER,orig=DATA_TO_PY_FOLDER,e=e)})
-                            err=True
-                     elif succ:
-                        self.message_queue.put({"type":"error","data":self.get_string('error_temp_folder_missing_restore',path=DATA_TO_PY_DECOMPILE_TEMP_FOLDER)})
-                        err=True
-            except Exception as fe:
-                self.message_queue.put({"type":"error","data":f"CRIT cleanup err: {fe}"})
-                err=True
             flog=self.get_string('log_extract_complete_errors') if err else self.get_string('log_extract_complete')
             fstat=self.get_string('status_error') if err else self.get_string('status_idle')
             self.message_queue.put({"type":"output","data":flog})
@@ -1181,6 +1120,7 @@ class App(customtkinter.CTk):
     def _execute_json_to_xliff(self):
         xliff_data={}
         id_map={}
+        self.tbl_ids=ContentIds(prefix="tbl_",length=10) # Same text -> same ID on every run
         total_strings=0
         files_processed=0
         json_files=[]
@@ -1231,7 +1171,7 @@ class App(customtkinter.CTk):
                         if value in id_map:
                             obj[key] = id_map[value]
                         else:
-                            tid = f"tbl_{uuid.uuid4().hex[:10]}"
+                            tid = self.tbl_ids.get(value)
                             id_map[value] = tid
                             xliff_data[tid] = {"source": value, "file": filename}
                             obj[key] = tid
@@ -1245,7 +1185,7 @@ class App(customtkinter.CTk):
                         if item in id_map:
                             obj[i] = id_map[item]
                         else:
-                            tid = f"tbl_{uuid.uuid4().hex[:10]}"
+                            tid = self.tbl_ids.get(item)
                             id_map[item] = tid
                             xliff_data[tid] = {"source": item, "file": filename}
                             obj[i] = tid
@@ -1256,21 +1196,10 @@ class App(customtkinter.CTk):
 
     def _create_combined_xliff(self, xliff_data, xliff_filepath):
         try:
-            root=ET.Element("xliff",version="1.2",xmlns="urn:oasis:names:tc:xliff:document:1.2")
-            fe=ET.SubElement(root,"file",original="combined_tbl_json",datatype="plaintext",source_language="en",target_language="ru")
-            body=ET.SubElement(fe,"body")
-            for tid in sorted(xliff_data.keys()):
-                data=xliff_data[tid]
-                tu=ET.SubElement(body,"trans-unit",id=tid)
-                ET.SubElement(tu,"note").text=f"File: {data['file']}"
-                src=ET.SubElement(tu,"source")
-                src.text=data["source"].replace("\n","\\n")
-                tgt=ET.SubElement(tu,"target")
-            xml_str=ET.tostring(root,encoding='utf-8')
-            dom=xml.dom.minidom.parseString(xml_str)
-            pretty_xml=dom.toprettyxml(indent="  ",encoding='utf-8')
-            with open(xliff_filepath,"wb") as f:
-                f.write(pretty_xml) # Corrected: Added closing parenthesis
+            with XliffWriter(xliff_filepath,original="combined_tbl_json",datatype="plaintext") as writer:
+                for tid in sorted(xliff_data.keys()):
+                    data=xliff_data[tid]
+                    writer.write_unit(tid,data["source"].replace("\n","\\n"),note=f"File: {data['file']}")
             return True
         except Exception as e:
             self.message_queue.put({"type":"error","data":self.get_string('error_tbl_parse_write_xliff',filename=xliff_filepath,e=e)})
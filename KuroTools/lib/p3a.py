@@ -0,0 +1,280 @@
+import io
+import os
+import mmap
+import struct
+from collections import namedtuple
+
+#Falcom P3A archives (Kuro no Kiseki and later), read without unpacking everything to disk:
+#the archive is mmapped, the entry table is parsed once into an index and each entry is
+#decompressed only when it is requested.
+#
+#    with P3AArchive("script_en.p3a") as archive:
+#        data = archive.read("scena/c0000.dat")
+#
+#Layout (little-endian):
+#    header      "PH3ARCV\0", u32 flags, u32 version, u32 entry count, u64 archive hash
+#    v1200+      u32 extended header size, u32 entry size
+#    entries     char name[256], u32 compression, u64 compressed size, u64 size, u64 offset,
+#                u64 xxh64 of the compressed data (v1200 entries may carry extra fields after these)
+#    flags & 1   "P3ADICT\0", u64 size, zstd dictionary used by COMPRESSION_ZSTD_DICT entries
+#
+#Written archives are version 1100 without a dictionary. The archive hash is written as 0;
+#entry hashes are filled in when the xxhash module is available.
+#zstandard, lz4 and xxhash are optional and imported on first use, so reading a plain file
+#with dat2py/tbl2json does not pay for them.
+
+P3A_MAGIC = b"PH3ARCV\0"
+DICT_MAGIC = b"P3ADICT\0"
+FLAG_ZSTD_DICT = 1
+VERSION_1100 = 1100
+VERSION_1200 = 1200
+
+COMPRESSION_NONE = 0
+COMPRESSION_LZ4 = 1
+COMPRESSION_ZSTD = 2
+COMPRESSION_ZSTD_DICT = 3
+
+HEADER = struct.Struct("<8sIIIQ")
+EXTENDED_HEADER = struct.Struct("<II")
+ENTRY = struct.Struct("<256sIQQQQ")
+DICT_HEADER = struct.Struct("<8sQ")
+NAME_SIZE = 256
+
+ZSTD_LEVEL = 9 #Compression level of written entries
+
+P3AEntry = namedtuple("P3AEntry", ["name", "compression", "compressed_size", "size", "offset", "compressed_hash"])
+
+def get_zstandard():
+    try:
+        import zstandard
+    except ImportError:
+        raise ValueError("zstd entries need the zstandard module (pip install zstandard)")
+    return zstandard
+
+def get_lz4_block():
+    try:
+        import lz4.block
+    except ImportError:
+        raise ValueError("LZ4 entries need the lz4 module (pip install lz4)")
+    return lz4.block
+
+def get_xxhash():
+    #None when xxhash is not installed: entry hashes are then written as 0
+    try:
+        import xxhash
+    except ImportError:
+        return None
+    return xxhash
+
+def normalize_name(name):
+    #Entry names are compared case-insensitively with forward slashes
+    return name.replace("\\", "/").lower()
+
+class P3AArchive(object):
+    def __init__(self, path):
+        self.path = path
+        self.file = open(path, "rb")
+        try:
+            self.data = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            #mmap of an empty file
+            self.file.close()
+            raise ValueError(f"{path}: not a P3A archive")
+        self.zstd_dict = None
+        self.entries = []
+        self.index = {}
+        try:
+            self.read_index()
+        except Exception:
+            self.close()
+            raise
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
+
+    def close(self):
+        if self.data is not None:
+            self.data.close()
+            self.data = None
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
+    def read_index(self):
+        if len(self.data) < HEADER.size:
+            raise ValueError(f"{self.path}: not a P3A archive")
+        magic, flags, self.version, count, self.archive_hash = HEADER.unpack_from(self.data, 0)
+        if magic != P3A_MAGIC:
+            raise ValueError(f"{self.path}: not a P3A archive (magic {magic!r})")
+        pos = HEADER.size
+        entry_size = ENTRY.size
+        if self.version >= VERSION_1200:
+            extended_size, entry_size = EXTENDED_HEADER.unpack_from(self.data, pos)
+            pos += extended_size
+            if entry_size < ENTRY.size:
+                raise ValueError(f"{self.path}: unsupported entry size {entry_size}")
+        if pos + count * entry_size > len(self.data):
+            raise ValueError(f"{self.path}: entry table is truncated")
+
+        for _ in range(count):
+            raw_name, compression, compressed_size, size, offset, compressed_hash = ENTRY.unpack_from(self.data, pos)
+            pos += entry_size
+            name = raw_name.split(b"\0", 1)[0].decode("utf-8")
+            entry = P3AEntry(name, compression, compressed_size, size, offset, compressed_hash)
+            self.entries.append(entry)
+            self.index[normalize_name(name)] = entry
+
+        if flags & FLAG_ZSTD_DICT:
+            magic, dict_size = DICT_HEADER.unpack_from(self.data, pos)
+            if magic != DICT_MAGIC:
+                raise ValueError(f"{self.path}: zstd dictionary is missing")
+            pos += DICT_HEADER.size
+            self.zstd_dict = bytes(self.data[pos:pos + dict_size])
+
+    def names(self):
+        return [entry.name for entry in self.entries]
+
+    def __contains__(self, name):
+        return normalize_name(name) in self.index
+
+    def __len__(self):
+        return len(self.entries)
+
+    def get_entry(self, name):
+        entry = self.index.get(normalize_name(name))
+        if entry is None:
+            raise KeyError(f"{name} is not in {self.path}")
+        return entry
+
+    def read(self, name):
+        """Decompressed content of one entry."""
+        entry = self.get_entry(name) if isinstance(name, str) else name
+        raw = self.data[entry.offset:entry.offset + entry.compressed_size]
+        if entry.compression == COMPRESSION_NONE:
+            return raw
+        if entry.compression == COMPRESSION_LZ4:
+            return get_lz4_block().decompress(raw, uncompressed_size=entry.size)
+        if entry.compression in (COMPRESSION_ZSTD, COMPRESSION_ZSTD_DICT):
+            zstandard = get_zstandard()
+            if entry.compression == COMPRESSION_ZSTD_DICT:
+                if self.zstd_dict is None:
+                    raise ValueError(f"{entry.name}: the archive has no zstd dictionary")
+                decompressor = zstandard.ZstdDecompressor(dict_data=zstandard.ZstdCompressionDict(self.zstd_dict))
+            else:
+                decompressor = zstandard.ZstdDecompressor()
+            return decompressor.decompress(raw, max_output_size=entry.size)
+        raise ValueError(f"{entry.name}: unknown compression type {entry.compression}")
+
+    def open(self, name):
+        """Entry content as a binary stream, for readers that expect a file."""
+        return io.BytesIO(self.read(name))
+
+#Archive opened once per worker process of extract_all
+_worker_archive = None
+
+def _init_worker(archive_path):
+    global _worker_archive
+    _worker_archive = P3AArchive(archive_path)
+
+def _extract_task(task):
+    name, output_dir = task
+    try:
+        #Entry names come from the archive, so keep them inside output_dir
+        output_path = os.path.normpath(os.path.join(output_dir, name.replace("\\", "/").lstrip("/")))
+        if os.path.commonpath([os.path.abspath(output_path), os.path.abspath(output_dir)]) != os.path.abspath(output_dir):
+            raise ValueError("entry path leaves the output folder")
+        content = _worker_archive.read(name)
+        os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
+        with open(output_path, "wb") as output_file:
+            output_file.write(content)
+        return name, len(content), None
+    except Exception as e:
+        #OSError, ValueError, but also zstandard.ZstdError / lz4 errors for corrupted entries:
+        #one bad entry must not stop the pool
+        return name, 0, f"{type(e).__name__}: {e}"
+
+def extract_all(archive_path, output_dir, names=None, max_workers=None):
+    """
+    Extracts entries (all by default) into output_dir, in parallel.
+    Yields (name, size, error or None) in the order of names.
+    """
+    if names is None:
+        with P3AArchive(archive_path) as archive:
+            names = archive.names()
+    tasks = [(name, output_dir) for name in names]
+    if max_workers == 1 or len(tasks) < 2:
+        _init_worker(archive_path)
+        try:
+            for task in tasks:
+                yield _extract_task(task)
+        finally:
+            _worker_archive.close()
+        return
+    from concurrent.futures import ProcessPoolExecutor
+    with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker, initargs=(archive_path,)) as executor:
+        yield from executor.map(_extract_task, tasks, chunksize=64)
+
+def compress_entry(content, compression, level=ZSTD_LEVEL):
+    if compression == COMPRESSION_NONE:
+        return content
+    if compression == COMPRESSION_ZSTD:
+        return get_zstandard().ZstdCompressor(level=level).compress(content)
+    if compression == COMPRESSION_LZ4:
+        return get_lz4_block().compress(content, store_size=False)
+    raise ValueError(f"unsupported compression type {compression} for writing")
+
+def write_archive(output_path, files, compression=COMPRESSION_ZSTD, level=ZSTD_LEVEL):
+    """
+    Writes a version 1100 archive. files: [(name in the archive, content bytes or path on disk)].
+    Entries are compressed one at a time and streamed to the file, so only one is in memory.
+    """
+    names = set()
+    for name, _ in files:
+        encoded = name.replace("\\", "/").encode("utf-8")
+        if len(encoded) >= NAME_SIZE:
+            raise ValueError(f"entry name is longer than {NAME_SIZE - 1} bytes: {name}")
+        if normalize_name(name) in names:
+            raise ValueError(f"duplicate entry: {name}")
+        names.add(normalize_name(name))
+
+    xxhash = get_xxhash()
+    entries = []
+    with open(output_path, "wb") as output_file:
+        #Header and entry table are written last, once the offsets are known
+        output_file.write(b"\0" * (HEADER.size + ENTRY.size * len(files)))
+        for name, content in files:
+            if not isinstance(content, (bytes, bytearray)):
+                with open(content, "rb") as input_file:
+                    content = input_file.read()
+            stored = compress_entry(content, compression, level)
+            #Do not keep entries that compression made larger
+            entry_compression = compression
+            if compression != COMPRESSION_NONE and len(stored) >= len(content):
+                stored, entry_compression = content, COMPRESSION_NONE
+            compressed_hash = xxhash.xxh64_intdigest(stored) if xxhash is not None else 0
+            entries.append(P3AEntry(name.replace("\\", "/"), entry_compression, len(stored), len(content),
+                                    output_file.tell(), compressed_hash))
+            output_file.write(stored)
+
+        output_file.seek(0)
+        output_file.write(HEADER.pack(P3A_MAGIC, 0, VERSION_1100, len(entries), 0))
+        for entry in entries:
+            output_file.write(ENTRY.pack(entry.name.encode("utf-8"), entry.compression, entry.compressed_size,
+                                         entry.size, entry.offset, entry.compressed_hash))
+    return entries
+
+def collect_patch_files(input_dir, prefix=""):
+    """[(name in the archive, path)] for every file under input_dir (e.g. py_to_data), names prefixed with prefix/."""
+    files = []
+    prefix = prefix.replace("\\", "/").strip("/")
+    for root, dirs, filenames in os.walk(input_dir):
+        dirs.sort()
+        for filename in sorted(filenames):
+            path = os.path.join(root, filename)
+            relative = os.path.relpath(path, input_dir).replace(os.sep, "/")
+            files.append((f"{prefix}/{relative}" if prefix else relative, path))
+    return files
@@ -0,0 +1,64 @@
+import xml.etree.ElementTree as ET
+from collections import namedtuple
+
+#Streaming XLIFF 1.2 reader: trans-units are parsed one at a time with iterparse and
+#dropped from the tree once yielded, so memory does not grow with the size of the file.
+#
+#    for unit in iter_trans_units(path):
+#        print(unit.id, unit.source, unit.target)
+#
+#Texts are returned as stored (\\n is not unescaped), None when the element is missing or empty.
+#attributes/target_attributes keep the other attributes of <trans-unit>/<target> (approved, resname, state...),
+#so a unit can be written back with XliffWriter without losing them.
+#A malformed file raises ET.ParseError from the loop, after the units before the error were yielded.
+
+XLIFF_NAMESPACE = "urn:oasis:names:tc:xliff:document:1.2"
+
+TransUnit = namedtuple("TransUnit", ["id", "source", "target", "note", "resname", "approved", "attributes", "target_attributes"])
+
+def local_name(tag):
+    #"{urn:...}trans-unit" -> "trans-unit"; files without the namespace are accepted as well
+    return tag.rsplit("}", 1)[-1]
+
+def iter_trans_units(path):
+    parents = []
+    for event, elem in ET.iterparse(path, events=("start", "end")):
+        if event == "start":
+            parents.append(elem)
+            continue
+        parents.pop()
+        if local_name(elem.tag) != "trans-unit":
+            continue
+        source = target = note = None
+        target_attributes = {}
+        approved = elem.get("approved") == "yes"
+        for child in elem:
+            name = local_name(child.tag)
+            if name == "source":
+                source = child.text
+            elif name == "target":
+                target = child.text
+                target_attributes = dict(child.attrib)
+                #The XLIFF editor marks approval on <target> rather than on <trans-unit>
+                approved = approved or child.get("approved") == "yes"
+            elif name == "note" and note is None:
+                note = child.text
+        attributes = {name: value for name, value in elem.attrib.items() if name != "id"}
+        unit = TransUnit(elem.get("id"), source, target, note, elem.get("resname"), approved, attributes, target_attributes)
+        elem.clear()
+        #The unit is always the last child of its parent here, so remove() is O(1)
+        if parents:
+            parents[-1].remove(elem)
+        yield unit
+
+def read_file_attributes(path):
+    """Attributes of the first <file> element (original, languages...); only the start of the file is parsed."""
+    with open(path, "rb") as xliff_file:
+        for event, elem in ET.iterparse(xliff_file, events=("start",)):
+            if local_name(elem.tag) == "file":
+                return dict(elem.attrib)
+    return {}
+
+def load_trans_units(path):
+    """All units of a file as {id: TransUnit}, e.g. the previous export for XliffWriter(previous_units=...)."""
+    return {unit.id: unit for unit in iter_trans_units(path)}
@@ -0,0 +1,146 @@
+import os
+import hashlib
+from xml.sax.saxutils import escape, quoteattr
+from lib.xliff_reader import load_trans_units
+
+#Streaming XLIFF 1.2 writer: trans-units are written to disk as they are produced,
+#so no ElementTree (or minidom copy) of the whole document is kept in memory.
+#
+#    with XliffWriter(path, original="file.json") as writer:
+#        writer.write_unit("id1", "Source text", note="File: a.py")
+#
+#With previous_units (trans-units of the previous translated export, see load_previous_xliff)
+#the writer works in merge mode: a unit whose id (or, failing that, source text) matches a previous unit
+#gets its target and note carried over, so only new strings come out untranslated. The attributes of the
+#previous <target> (approved, state) go with the translation: the XLIFF editor reads approval from <target>.
+
+XLIFF_NAMESPACE = "urn:oasis:names:tc:xliff:document:1.2"
+
+def format_attributes(attributes):
+    return "".join(f" {name}={quoteattr(str(value))}" for name, value in attributes.items() if value is not None)
+
+def content_hash(text):
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+def load_previous_xliff(path, on_error = None, generated_note_prefix = None):
+    """
+    {id: TransUnit} of the previous export for merge mode; None when there is no such file (first export)
+    or it cannot be read, which is passed to on_error(exception) so the export still runs.
+    Notes starting with generated_note_prefix are written anew on every export and are not carried over.
+    """
+    if not path or not os.path.exists(path):
+        return None
+    try:
+        previous_units = load_trans_units(path)
+    except Exception as e:
+        if on_error is not None:
+            on_error(e)
+        return None
+    if generated_note_prefix:
+        for unit_id, unit in previous_units.items():
+            if unit.note and unit.note.startswith(generated_note_prefix):
+                previous_units[unit_id] = unit._replace(note=None)
+    return previous_units
+
+class ContentIds(object):
+    """Stable trans-unit IDs derived from the source text instead of random ones, so a re-export keeps its IDs.
+    Repeated texts (and the rare hash prefix collision) get _2, _3... in the order they are requested."""
+    def __init__(self, prefix = "", length = 12):
+        self.prefix = prefix
+        self.length = length
+        self.used = set()
+
+    def get(self, text, context = ""):
+        base = self.prefix + content_hash(context + text)[:self.length]
+        text_id = base
+        n = 1
+        while text_id in self.used:
+            n += 1
+            text_id = f"{base}_{n}"
+        self.used.add(text_id)
+        return text_id
+
+class XliffWriter(object):
+    def __init__(self, path, original, source_language = "en", target_language = "ru", datatype = None, indent = "  ", previous_units = None):
+        self.path = path
+        self.file_attributes = {"original": original, "datatype": datatype,
+                                "source_language": source_language, "target_language": target_language}
+        self.indent = indent
+        self.file = None
+        self.count = 0
+        self.carried = 0
+        #previous_units: {id: TransUnit}
+        self.previous_by_id = previous_units or {}
+        self.previous_by_source = {}
+        for unit in self.previous_by_id.values():
+            if unit.source is not None and unit.target:
+                self.previous_by_source.setdefault(unit.source, unit)
+
+    def __enter__(self):
+        self.open()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        #On error the document is left unterminated, so a partial file is not mistaken for a complete one
+        self.close(complete = exc_type is None)
+        return False
+
+    def open(self):
+        self.file = open(self.path, "w", encoding="utf-8", newline="\n")
+        self.file.write('<?xml version="1.0" encoding="utf-8"?>\n')
+        self.file.write(f'<xliff version="1.2" xmlns="{XLIFF_NAMESPACE}">\n')
+        self.file.write(f"{self.indent}<file{format_attributes(self.file_attributes)}>\n")
+        self.file.write(f"{self.indent * 2}<body>\n")
+
+    def write_unit(self, unit_id, source, target = "", note = None, attributes = None, target_attributes = None):
+        """Writes one trans-unit. Texts are written as given (callers escape \\n themselves, as before)."""
+        i3, i4 = self.indent * 3, self.indent * 4
+        unit_attributes = {"id": unit_id}
+        if attributes:
+            unit_attributes.update(attributes)
+        previous = self.find_previous(unit_id, source)
+        if previous is not None:
+            if not target and previous.target:
+                target = previous.target
+                self.carried += 1
+                carried_attributes = dict(previous.target_attributes)
+                #Approval of older files may be on <trans-unit>; it is moved to <target>
+                if previous.approved:
+                    carried_attributes["approved"] = "yes"
+                target_attributes = {**carried_attributes, **(target_attributes or {})}
+            if previous.note:
+                note = previous.note
+        parts = [f"{i3}<trans-unit{format_attributes(unit_attributes)}>\n"]
+        if note is not None:
+            parts.append(f"{i4}<note>{escape(note)}</note>\n")
+        parts.append(f"{i4}<source>{escape(source)}</source>\n")
+        target_attrs = format_attributes(target_attributes or {})
+        if target:
+            parts.append(f"{i4}<target{target_attrs}>{escape(target)}</target>\n")
+        else:
+            parts.append(f"{i4}<target{target_attrs}/>\n")
+        parts.append(f"{i3}</trans-unit>\n")
+        self.file.write("".join(parts))
+        self.count += 1
+
+    def find_previous(self, unit_id, source):
+        """Previous unit with the same id and source; if it is untranslated (or the ID comes from an older
+        export), a translated unit with the same source."""
+        previous = self.previous_by_id.get(unit_id)
+        if previous is not None and previous.source != source:
+            previous = None
+        if previous is not None and previous.target:
+            return previous
+        return self.previous_by_source.get(source, previous)
+
+    def close(self, complete = True):
+        if self.file is None:
+            return
+        try:
+            if complete:
+                self.file.write(f"{self.indent * 2}</body>\n")
+                self.file.write(f"{self.indent}</file>\n")
+                self.file.write("</xliff>\n")
+        finally:
+            self.file.close()
+            self.file = None
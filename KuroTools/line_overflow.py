@@ -0,0 +1,150 @@
+import os
+import sys
+import json
+import time
+import hashlib
+import argparse
+import xml.etree.ElementTree as ET
+from lib.xliff_reader import iter_trans_units
+from font.font import load_glyph_index, WidthTable, split_lines
+try:
+    import colorama
+    colorama.init(autoreset=True)
+    Fore = colorama.Fore
+    Style = colorama.Style
+except ImportError:
+    class DummyStyle:
+        def __getattr__(self, name): return ""
+    Fore = Style = DummyStyle()
+
+# Поиск строк перевода, которые не помещаются в окно сообщения: каждая строка <target> (между переносами \n)
+# измеряется по ширинам символов из шрифта игры и сравнивается с допустимой шириной.
+# Ширины строк кэшируются рядом с XLIFF, повторный запуск измеряет только измененные юниты.
+
+# --- Конфигурация ---
+MAX_LINE_WIDTH = None           # Допустимая ширина строки в единицах шрифта (None = самая широкая строка оригинала)
+CACHE_SUFFIX = ".overflow.json" # Кэш ширин рядом с XLIFF
+CACHE_VERSION = 2
+TEXT_PREVIEW_LENGTH = 60        # Сколько символов строки показывать в отчете
+# --------------------
+
+def file_signature(path):
+    """Хеш файла шрифта: при замене шрифта кэш ширин сбрасывается."""
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+def unit_key(source, target):
+    return hashlib.sha1(f"{source}\0{target}".encode("utf-8")).hexdigest()
+
+def load_cache(cache_path, signature):
+    """
+    {ID: [ключ юнита, ширина самой широкой строки оригинала, [ширины строк перевода]]} из прошлого запуска.
+    JSON, а не pickle: поврежденный или подмененный кэш дает только пересчет ширин.
+    """
+    try:
+        with open(cache_path, "r", encoding="utf-8") as f:
+            cache = json.load(f)
+        if cache.get("signature") == list(signature) and isinstance(cache.get("units"), dict):
+            return cache["units"]
+    except (OSError, ValueError, AttributeError):
+        pass
+    return {}
+
+def save_cache(cache_path, signature, units):
+    try:
+        with open(cache_path, "w", encoding="utf-8") as f:
+            json.dump({"signature": list(signature), "units": units}, f, ensure_ascii=False, separators=(",", ":"))
+    except OSError as e:
+        print(f"{Fore.YELLOW}Предупреждение: Не удалось сохранить кэш '{cache_path}': {e}{Style.RESET_ALL}")
+
+def measure_file(xliff_path, widths, font_signature, use_cache=True):
+    """
+    Измеряет переводы файла. Возвращает ([(ID, ширина оригинала, [ширины строк перевода], перевод)],
+    кол-во измеренных юнитов, кол-во взятых из кэша).
+    """
+    cache_path = xliff_path + CACHE_SUFFIX
+    # Кэш действителен только для того же шрифта
+    signature = (CACHE_VERSION, font_signature)
+    cached_units = load_cache(cache_path, signature) if use_cache else {}
+    units = {}
+    results = []
+    measured = reused = 0
+    for unit in iter_trans_units(xliff_path):
+        if not unit.target or not unit.target.strip():
+            continue
+        source = unit.source or ""
+        key = unit_key(source, unit.target)
+        entry = cached_units.get(unit.id)
+        if isinstance(entry, list) and len(entry) == 3 and entry[0] == key:
+            reused += 1
+        else:
+            source_width = max(map(widths.line_width, split_lines(source)))
+            entry = [key, source_width, list(map(widths.line_width, split_lines(unit.target)))]
+            measured += 1
+        units[unit.id] = entry
+        results.append((unit.id, entry[1], entry[2], unit.target))
+    # Без изменений кэш не перезаписывается
+    if use_cache and (measured or len(units) != len(cached_units)):
+        save_cache(cache_path, signature, units)
+    return results, measured, reused
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Поиск строк перевода шире окна сообщения (по ширинам символов шрифта игры).")
+    parser.add_argument("font", help="Файл шрифта игры (FCV/FLTI).")
+    parser.add_argument("xliff_files", nargs="+", help="Переведенные XLIFF.")
+    parser.add_argument("-w", "--max-width", type=int, default=MAX_LINE_WIDTH,
+                        help="Допустимая ширина строки. По умолчанию - ширина самой широкой строки оригинала.")
+    parser.add_argument("--full", action="store_true", help="Измерить все строки заново, не используя кэш.")
+    args = parser.parse_args()
+
+    start_time = time.time()
+    try:
+        glyphs = load_glyph_index(args.font)
+        font_signature = file_signature(args.font)
+    except (OSError, ValueError) as e:
+        print(f"{Fore.RED}Ошибка при чтении шрифта '{args.font}': {e}{Style.RESET_ALL}")
+        sys.exit(1)
+    widths = WidthTable(glyphs.values())
+
+    all_results = []
+    measured_total = reused_total = 0
+    for xliff_path in args.xliff_files:
+        try:
+            results, measured, reused = measure_file(xliff_path, widths, font_signature, use_cache=not args.full)
+        except (OSError, ET.ParseError) as e:
+            print(f"{Fore.RED}Ошибка при чтении '{xliff_path}': {e}{Style.RESET_ALL}")
+            sys.exit(1)
+        all_results.extend((xliff_path, *result) for result in results)
+        measured_total += measured
+        reused_total += reused
+
+    max_width = args.max_width
+    if max_width is None:
+        max_width = max((source_width for _, _, source_width, _, _ in all_results), default=0)
+        print(f"Допустимая ширина по самой широкой строке оригинала: {max_width}")
+
+    overflow_count = 0
+    line_count = 0
+    for xliff_path, unit_id, _, line_widths, target in all_results:
+        line_count += len(line_widths)
+        lines = None
+        for line_number, line_width in enumerate(line_widths, 1):
+            if line_width <= max_width:
+                continue
+            if lines is None:
+                lines = split_lines(target)
+            overflow_count += 1
+            text = lines[line_number - 1]
+            preview = text if len(text) <= TEXT_PREVIEW_LENGTH else text[:TEXT_PREVIEW_LENGTH] + "..."
+            print(f"{Fore.RED}{unit_id}{Style.RESET_ALL} строка {line_number}: {line_width} > {max_width}  "
+                  f"{Style.DIM}{preview}{Style.RESET_ALL}  ({os.path.basename(xliff_path)})")
+
+    print(f"Строк проверено: {line_count} (юнитов измерено: {measured_total}, из кэша: {reused_total}), "
+          f"{time.time() - start_time:.2f} сек.")
+    if overflow_count:
+        print(f"{Fore.RED}Строк шире окна: {overflow_count}{Style.RESET_ALL}")
+        sys.exit(1)
+    print(f"{Fore.GREEN}Все строки помещаются.{Style.RESET_ALL}")
@@ -0,0 +1,100 @@
+import os
+import sys
+import time
+import argparse
+from lib.p3a import (P3AArchive, extract_all, write_archive, collect_patch_files,
+                     COMPRESSION_NONE, COMPRESSION_ZSTD, get_xxhash)
+try:
+    import colorama
+    colorama.init(autoreset=True)
+    Fore = colorama.Fore
+    Style = colorama.Style
+except ImportError:
+    class DummyStyle:
+        def __getattr__(self, name): return ""
+    Fore = Style = DummyStyle()
+
+# Работа с архивами P3A без p3a_tool.exe: список файлов, параллельная распаковка и сборка патч-архива
+# из собранных скриптов (py_to_data). Чтение отдельных файлов из архива - lib/p3a.py (P3AArchive).
+
+# --- Конфигурация ---
+MAX_WORKERS = None # Процессов для распаковки (None = по числу ядер, 1 = без пула)
+# --------------------
+
+COMPRESSION_NAMES = {0: "none", 1: "lz4", 2: "zstd", 3: "zstd+dict"}
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Архивы P3A (Kuro no Kiseki): просмотр, распаковка, сборка патча.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    list_parser = subparsers.add_parser("list", help="Список файлов архива.")
+    list_parser.add_argument("archive", help="Файл .p3a.")
+
+    extract_parser = subparsers.add_parser("extract", help="Распаковать архив (целиком или выбранные файлы).")
+    extract_parser.add_argument("archive", help="Файл .p3a.")
+    extract_parser.add_argument("names", nargs="*", help="Файлы внутри архива. По умолчанию все.")
+    extract_parser.add_argument("-o", "--output", default=None, help="Папка для файлов. По умолчанию: имя архива без расширения.")
+    extract_parser.add_argument("-j", "--jobs", type=int, default=MAX_WORKERS, help="Число процессов (1 = без пула).")
+
+    pack_parser = subparsers.add_parser("pack", help="Собрать архив из папки (например, py_to_data).")
+    pack_parser.add_argument("input_dir", help="Папка с файлами для архива.")
+    pack_parser.add_argument("output", help="Выходной файл .p3a.")
+    pack_parser.add_argument("--prefix", default="", help="Папка внутри архива, в которую кладутся файлы (например, путь к скриптам в архиве игры).")
+    pack_parser.add_argument("--no-compress", action="store_true", help="Не сжимать файлы (zstd по умолчанию).")
+
+    args = parser.parse_args()
+
+    if args.command == "list":
+        try:
+            with P3AArchive(args.archive) as archive:
+                print(f"Версия: {archive.version}, файлов: {len(archive)}")
+                for entry in archive.entries:
+                    print(f"{entry.size:>12} {entry.compressed_size:>12} {COMPRESSION_NAMES.get(entry.compression, entry.compression):<9} {entry.name}")
+        except (OSError, ValueError) as e:
+            print(f"{Fore.RED}Ошибка при чтении '{args.archive}': {e}{Style.RESET_ALL}")
+            sys.exit(1)
+
+    elif args.command == "extract":
+        output_dir = args.output or os.path.splitext(args.archive)[0]
+        start_time = time.time()
+        failed = 0
+        extracted = 0
+        try:
+            names = args.names or None
+            if names:
+                with P3AArchive(args.archive) as archive:
+                    missing = [name for name in names if name not in archive]
+                for name in missing:
+                    print(f"{Fore.RED}Нет в архиве: {name}{Style.RESET_ALL}")
+                failed += len(missing)
+                names = [name for name in names if name not in missing]
+            for name, size, error in extract_all(args.archive, output_dir, names, args.jobs):
+                if error:
+                    print(f"{Fore.RED}Ошибка при распаковке '{name}': {error}{Style.RESET_ALL}")
+                    failed += 1
+                else:
+                    extracted += 1
+        except (OSError, ValueError) as e:
+            print(f"{Fore.RED}Ошибка при чтении '{args.archive}': {e}{Style.RESET_ALL}")
+            sys.exit(1)
+        print(f"{Fore.GREEN}Распаковано файлов: {extracted}, ошибок: {failed} ({time.time() - start_time:.2f} сек.){Style.RESET_ALL}")
+        print(f"{Fore.CYAN}Папка: {Style.BRIGHT}{output_dir}{Style.RESET_ALL}")
+        sys.exit(1 if failed else 0)
+
+    elif args.command == "pack":
+        files = collect_patch_files(args.input_dir, args.prefix)
+        if not files:
+            print(f"{Fore.YELLOW}В папке '{args.input_dir}' нет файлов.{Style.RESET_ALL}")
+            sys.exit(1)
+        if get_xxhash() is None:
+            print(f"{Fore.YELLOW}Модуль xxhash не установлен: хеши файлов в архиве будут нулевыми (pip install xxhash).{Style.RESET_ALL}")
+        start_time = time.time()
+        try:
+            entries = write_archive(args.output, files, COMPRESSION_NONE if args.no_compress else COMPRESSION_ZSTD)
+        except (OSError, ValueError) as e:
+            print(f"{Fore.RED}Ошибка при сборке архива: {e}{Style.RESET_ALL}")
+            sys.exit(1)
+        size = sum(entry.size for entry in entries)
+        stored = sum(entry.compressed_size for entry in entries)
+        print(f"{Fore.GREEN}В архив добавлено файлов: {len(entries)} ({size} -> {stored} байт, {time.time() - start_time:.2f} сек.){Style.RESET_ALL}")
+        print(f"{Fore.CYAN}Архив сохранен в: {Style.BRIGHT}{args.output}{Style.RESET_ALL}")
@@ -8,6 +8,8 @@ import json # Для чтения карты строк
 import uuid # Для временных файлов
 import argparse # Для аргументов командной строки
 import ast # <-- ДОБАВИТЬ ИМПОРТ AST
+import hashlib # Для хешей скриптов и .dat (инкрементальная сборка)
+from disasm.ED9IR import IR_EXTENSION, load_ir, iter_pushstrings, find_script_sources, lookup_translation, normalize_string_key
 
 # Попытка импортировать astunparse (для Python 3.9+) или astor (для < 3.9)
 try:
@@ -41,6 +43,8 @@ INPUT_PY_SUBDIR = "data_to_py"
 OUTPUT_DAT_SUBDIR = "py_to_data"
 STRMAP_FILE = "strings_map.json" # Файл с картой переводов
 TEMP_PY_PREFIX = "_temp_compile_" # Префикс для временных .py файлов
+BUILD_STATE_FILE = "py2dat_state.json" # Состояние прошлой сборки: карта строк, индекс строка->скрипты, хеши
+BUILD_STATE_VERSION = 1
 # --------------------
 
 # Глобальный словарь для карты строк {"source": "target"}
@@ -86,12 +90,14 @@ class StringInjector(ast.NodeTransformer):
         super().__init__()
         self.translation_map = translation_map
         self.replacements_done = 0
+        self.seen_strings = set() # Все строковые константы скрипта (для индекса строка->скрипты)
 
     # Для Python 3.8+ используем visit_Constant
     def visit_Constant(self, node):
         # Проверяем, что это строковая константа
         if isinstance(node.value, str):
             original_string = node.value
+            self.seen_strings.add(original_string)
             # Ищем перевод
             if original_string in self.translation_map:
                 translated_string = self.translation_map[original_string]
@@ -123,7 +129,7 @@ class StringInjector(ast.NodeTransformer):
 def inject_strings_and_create_temp_ast(original_py_path, temp_py_path):
     """
     Читает оригинальный .py, парсит AST, заменяет строки и пишет во временный файл.
-    Возвращает (True, кол-во_замен) или (False, 0) при ошибке.
+    Возвращает (True, кол-во_замен, строки_скрипта) или (False, 0, пустое_множество) при ошибке.
     """
     global string_translation_map
     try:
@@ -148,19 +154,150 @@ def inject_strings_and_create_temp_ast(original_py_path, temp_py_path):
         with open(temp_py_path, 'w', encoding='utf-8') as f_out:
             f_out.write(modified_code)
 
-        return True, replacements
+        return True, replacements, injector.seen_strings
 
     except SyntaxError as se:
         print(f"{Fore.RED}    ОШИБКА СИНТАКСИСА при парсинге {os.path.basename(original_py_path)}:{se.lineno}: {se.text.strip()} -> {se.msg}{Style.RESET_ALL}")
-        return False, 0
+        return False, 0, set()
     except Exception as e:
         print(f"{Fore.RED}    ОШИБКА при обработке AST или записи временного файла {os.path.basename(temp_py_path)}: {e}{Style.RESET_ALL}")
         traceback.print_exc() # Печатаем traceback для детальной диагностики
-        return False, 0
+        return False, 0, set()
 # --- КОНЕЦ НОВОЙ ФУНКЦИИ ---
 
 
-def compile_py_scripts(py_dir_path, dat_dir_path, only_translated):
+# --- СБОРКА ИЗ КОМПАКТНОГО IR ---
+def script_base_name(filename):
+    """Имя скрипта без расширения (.py или .ir.json)."""
+    if filename.lower().endswith(IR_EXTENSION):
+        return filename[:-len(IR_EXTENSION)]
+    return os.path.splitext(filename)[0]
+
+def compile_ir_script(ir_path, dest_dat_path, only_translated):
+    """
+    Собирает .dat из .ir.json прямо в этом процессе (без AST и подпроцесса).
+    Возвращает ("compiled" | "skipped" | "failed", кол-во_замен, строки_скрипта).
+    """
+    global string_translation_map
+    try:
+        ir = load_ir(ir_path)
+    except (OSError, ValueError) as e:
+        print(f"{Fore.RED}    ОШИБКА чтения IR {os.path.basename(ir_path)}: {e}{Style.RESET_ALL}")
+        return "failed", 0, set()
+    strings = ir["strings"]
+    # В индекс попадают и нормализованные ключи (" -> '), как они записаны в strings_map.json
+    script_strings = set(strings) | {normalize_string_key(s) for s in strings}
+    replacements = 0
+    for string_id in iter_pushstrings(ir):
+        if lookup_translation(string_translation_map, strings[string_id]) is not None:
+            replacements += 1
+    if only_translated and replacements == 0:
+        return "skipped", 0, script_strings
+    try:
+        # Ассемблер нужен только для IR, обычная сборка .py идет в подпроцессах
+        from disasm.ED9Assembler import assemble_ir
+        bin_file = assemble_ir(ir, string_translation_map)
+        with open(dest_dat_path, 'wb') as f_out:
+            f_out.write(bin_file)
+    except Exception as e:
+        print(f"{Fore.RED}    ОШИБКА сборки IR {os.path.basename(ir_path)}: {e}{Style.RESET_ALL}")
+        traceback.print_exc()
+        return "failed", replacements, set()
+    return "compiled", replacements, script_strings
+# --- КОНЕЦ СБОРКИ ИЗ IR ---
+
+
+# --- ИНКРЕМЕНТАЛЬНАЯ СБОРКА ---
+def compute_file_hash(filepath):
+    """Возвращает sha256 содержимого файла или None, если файла нет."""
+    if not os.path.isfile(filepath):
+        return None
+    h = hashlib.sha256()
+    with open(filepath, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            h.update(chunk)
+    return h.hexdigest()
+
+def load_build_state(state_filepath):
+    """Загружает состояние прошлой сборки. Возвращает dict или None."""
+    if not os.path.exists(state_filepath):
+        return None
+    try:
+        with open(state_filepath, 'r', encoding='utf-8') as f:
+            state = json.load(f)
+    except (OSError, json.JSONDecodeError) as e:
+        print(f"{Fore.YELLOW}Предупреждение: Не удалось прочитать состояние сборки '{state_filepath}': {e}. Будет выполнена полная сборка.{Style.RESET_ALL}")
+        return None
+    if not isinstance(state, dict) or state.get("version") != BUILD_STATE_VERSION:
+        print(f"{Fore.YELLOW}Предупреждение: Неподдерживаемая версия состояния сборки. Будет выполнена полная сборка.{Style.RESET_ALL}")
+        return None
+    return state
+
+def save_build_state(state_filepath, translation_map, only_translated, scripts, script_strings):
+    """Сохраняет карту строк, по которой собирали, хеши скриптов/.dat и индекс строка -> скрипты."""
+    string_index = {}
+    for filename in sorted(script_strings):
+        for s in script_strings[filename]:
+            string_index.setdefault(s, []).append(filename)
+    state = {
+        "version": BUILD_STATE_VERSION,
+        "only_translated": only_translated,
+        "strings_map": translation_map,
+        "scripts": scripts,
+        "string_index": string_index,
+    }
+    try:
+        with open(state_filepath, 'w', encoding='utf-8') as f:
+            json.dump(state, f, ensure_ascii=False)
+        print(f"Состояние сборки сохранено: {os.path.basename(state_filepath)}")
+    except OSError as e:
+        print(f"{Fore.RED}Ошибка при записи состояния сборки '{state_filepath}': {e}{Style.RESET_ALL}")
+
+def diff_string_maps(old_map, new_map):
+    """Возвращает множество исходных строк, чей итоговый перевод изменился."""
+    changed = set()
+    for key in set(old_map) | set(new_map):
+        # Отсутствующий ключ эквивалентен "перевод = оригинал"
+        if old_map.get(key, key) != new_map.get(key, key):
+            changed.add(key)
+    return changed
+
+def select_scripts_to_rebuild(all_py_files, py_dir_path, dat_dir_path, state, only_translated, py_hashes):
+    """
+    Определяет, какие скрипты нужно пересобрать по сравнению с прошлой сборкой.
+    Возвращает (множество_имен_файлов, кол-во_измененных_строк) или (None, 0) для полной сборки.
+    """
+    global string_translation_map
+    if state is None:
+        return None, 0
+    if state.get("only_translated") != only_translated:
+        print(f"{Fore.YELLOW}Режим --only-translated изменился с прошлой сборки. Будет выполнена полная сборка.{Style.RESET_ALL}")
+        return None, 0
+
+    changed_strings = diff_string_maps(state.get("strings_map", {}), string_translation_map)
+    string_index = state.get("string_index", {})
+    affected = set()
+    for s in changed_strings:
+        affected.update(string_index.get(s, ()))
+
+    old_scripts = state.get("scripts", {})
+    to_build = set()
+    for filename in all_py_files:
+        entry = old_scripts.get(filename)
+        if entry is None or entry.get("py_hash") != py_hashes[filename]:
+            to_build.add(filename) # Новый или измененный скрипт
+            continue
+        if filename in affected:
+            to_build.add(filename) # Изменился перевод одной из строк скрипта
+            continue
+        dest_dat_path = os.path.join(dat_dir_path, f"{script_base_name(filename)}.dat")
+        if entry.get("dat_hash") is not None and compute_file_hash(dest_dat_path) != entry["dat_hash"]:
+            to_build.add(filename) # Выходной .dat удален или изменен вручную
+    return to_build, len(changed_strings)
+# --- КОНЕЦ ИНКРЕМЕНТАЛЬНОЙ СБОРКИ ---
+
+
+def compile_py_scripts(py_dir_path, dat_dir_path, only_translated, incremental=False, state_filepath=None):
     """
     Компилирует .py скрипты, предварительно заменяя строки через AST.
 
@@ -168,6 +305,9 @@ def compile_py_scripts(py_dir_path, dat_dir_path, only_translated):
         py_dir_path (str): Полный путь к директории с .py файлами.
         dat_dir_path (str): Полный путь к директории для выходных .dat файлов.
         only_translated (bool): Компилировать только файлы с измененными строками.
+        incremental (bool): Пересобирать только скрипты, затронутые изменениями карты строк
+                            или самих .py/.dat с прошлой сборки (см. BUILD_STATE_FILE).
+        state_filepath (str): Полный путь к файлу состояния сборки.
     """
     if not os.path.isdir(py_dir_path):
         print(f"{Fore.RED}Ошибка: Директория с .py файлами '{py_dir_path}' не найдена.{Style.RESET_ALL}")
@@ -184,6 +324,7 @@ def compile_py_scripts(py_dir_path, dat_dir_path, only_translated):
     compiled_count = 0
     failed_files = []
     skipped_files = 0 # Счетчик пропущенных файлов
+    unchanged_files = 0 # Счетчик файлов, не требующих пересборки (инкрементальный режим)
     total_replacements = 0
     start_time = time.time()
 
@@ -197,13 +338,40 @@ def compile_py_scripts(py_dir_path, dat_dir_path, only_translated):
 
     original_cwd = os.getcwd()
 
-    all_py_files = sorted([f for f in os.listdir(py_dir_path) if f.lower().endswith(".py") and not f.startswith(TEMP_PY_PREFIX)])
+    # Для каждого скрипта берем .ir.json (сборка без AST и подпроцесса) или .py, если он правился вручную
+    sources = find_script_sources(py_dir_path)
+    all_py_files = sorted(os.path.basename(path) for base, path in sources.items() if not base.startswith(TEMP_PY_PREFIX))
     total_files_to_process = len(all_py_files)
-    print(f"Найдено .py файлов для обработки: {total_files_to_process}")
+    print(f"Найдено скриптов для обработки: {total_files_to_process}")
+
+    # Хеши скриптов и индекс строк нужны для состояния сборки в любом режиме
+    py_hashes = {f: compute_file_hash(os.path.join(py_dir_path, f)) for f in all_py_files} if state_filepath else {}
+    old_state = load_build_state(state_filepath) if state_filepath else None
+    new_scripts = {}        # {имя.py: {"py_hash": ..., "dat_hash": ...}}
+    new_script_strings = {} # {имя.py: множество строк скрипта}
+    to_build = None         # None = собирать все
+    if incremental and state_filepath:
+        to_build, changed_strings = select_scripts_to_rebuild(all_py_files, py_dir_path, dat_dir_path, old_state, only_translated, py_hashes)
+        if to_build is None:
+            print(f"{Fore.YELLOW}Инкрементальный режим: состояние прошлой сборки отсутствует, выполняется полная сборка.{Style.RESET_ALL}")
+        else:
+            print(f"{Fore.CYAN}Инкрементальный режим: изменено строк в карте: {changed_strings}, скриптов к пересборке: {len(to_build)}{Style.RESET_ALL}")
+            # Для неизменных скриптов переносим записи и строки из прошлого состояния
+            old_scripts = old_state.get("scripts", {})
+            for f in all_py_files:
+                if f not in to_build:
+                    new_scripts[f] = old_scripts[f]
+            for s, files in old_state.get("string_index", {}).items():
+                for f in files:
+                    if f in new_scripts:
+                        new_script_strings.setdefault(f, set()).add(s)
 
     for i, filename in enumerate(all_py_files):
+        if to_build is not None and filename not in to_build:
+            unchanged_files += 1
+            continue
         full_py_path = os.path.join(py_dir_path, filename)
-        base_name = os.path.splitext(filename)[0]
+        base_name = script_base_name(filename)
         expected_dat_filename = f"{base_name}.dat"
         # Генерируем уникальное, но предсказуемое временное имя для отладки
         # temp_py_filename = f"{TEMP_PY_PREFIX}{base_name}.py"
@@ -223,10 +391,28 @@ def compile_py_scripts(py_dir_path, dat_dir_path, only_translated):
             try: os.remove(source_dat_path)
             except Exception as e: print(f"  Предупреждение: Не удалось удалить {source_dat_path}: {e}")
 
+        if filename.lower().endswith(IR_EXTENSION):
+            status, replacements, script_strings = compile_ir_script(full_py_path, dest_dat_path, only_translated)
+            total_replacements += replacements
+            print(f"  Выполнено замен строк: {replacements}")
+            if status == "failed":
+                failed_files.append(f"{filename} (ошибка сборки IR)")
+                continue
+            if status == "skipped":
+                print(f"{Fore.YELLOW}  Пропуск компиляции: строки не были переведены.{Style.RESET_ALL}")
+                skipped_files += 1
+                new_scripts[filename] = {"py_hash": py_hashes.get(filename), "dat_hash": None}
+            else:
+                print(f"{Fore.GREEN}  Файл {expected_dat_filename} собран из IR в {OUTPUT_DAT_SUBDIR}{Style.RESET_ALL}")
+                compiled_count += 1
+                new_scripts[filename] = {"py_hash": py_hashes.get(filename), "dat_hash": compute_file_hash(dest_dat_path)}
+            new_script_strings[filename] = script_strings
+            continue
+
         # 1. Создаем временный файл с заменами строк (используем новую функцию)
         print(f"  Создание временного файла с переводами (AST): {temp_py_filename}...")
         # ---- ИЗМЕНЕНИЕ ЗДЕСЬ: вызываем новую функцию ----
-        success_create_temp, replacements = inject_strings_and_create_temp_ast(full_py_path, temp_py_path)
+        success_create_temp, replacements, script_strings = inject_strings_and_create_temp_ast(full_py_path, temp_py_path)
         # ----------------------------------------------
         if not success_create_temp:
             failed_files.append(f"{filename} (ошибка создания временного файла/парсинга AST)")
@@ -240,6 +426,8 @@ def compile_py_scripts(py_dir_path, dat_dir_path, only_translated):
         if only_translated and replacements == 0:
             print(f"{Fore.YELLOW}  Пропуск компиляции: строки не были переведены.{Style.RESET_ALL}")
             skipped_files += 1
+            new_scripts[filename] = {"py_hash": py_hashes.get(filename), "dat_hash": None}
+            new_script_strings[filename] = script_strings
             # Удаляем временный .py файл
             if os.path.exists(temp_py_path):
                 try: os.remove(temp_py_path)
@@ -275,6 +463,8 @@ def compile_py_scripts(py_dir_path, dat_dir_path, only_translated):
                         shutil.move(source_dat_path, dest_dat_path)
                         print(f"{Fore.GREEN}  Файл {expected_dat_filename} перемещен в {OUTPUT_DAT_SUBDIR}{Style.RESET_ALL}")
                         compiled_count += 1
+                        new_scripts[filename] = {"py_hash": py_hashes.get(filename), "dat_hash": compute_file_hash(dest_dat_path)}
+                        new_script_strings[filename] = script_strings
                     except Exception as move_e:
                         print(f"{Fore.RED}  ОШИБКА ПЕРЕМЕЩЕНИЯ {expected_dat_filename}: {move_e}{Style.RESET_ALL}")
                         failed_files.append(f"{filename} (ошибка перемещения .dat)")
@@ -284,6 +474,8 @@ def compile_py_scripts(py_dir_path, dat_dir_path, only_translated):
                     if os.path.exists(dest_dat_path):
                         print(f"{Fore.YELLOW}  Примечание: {expected_dat_filename} найден в папке назначения {OUTPUT_DAT_SUBDIR}. Перемещение не требуется.{Style.RESET_ALL}")
                         compiled_count += 1 # Считаем успешным, если он там
+                        new_scripts[filename] = {"py_hash": py_hashes.get(filename), "dat_hash": compute_file_hash(dest_dat_path)}
+                        new_script_strings[filename] = script_strings
                     else:
                         failed_files.append(f"{filename} (.dat не создан)")
 
@@ -305,6 +497,10 @@ def compile_py_scripts(py_dir_path, dat_dir_path, only_translated):
                 except Exception as remove_e:
                     print(f"{Fore.YELLOW}  Предупреждение: Не удалось удалить временный файл {temp_py_filename}: {remove_e}{Style.RESET_ALL}")
 
+    # Файлы с ошибками не попадают в состояние и будут пересобраны при следующем запуске
+    if state_filepath:
+        save_build_state(state_filepath, string_translation_map, only_translated, new_scripts, new_script_strings)
+
     # --- Итоги ---
     end_time = time.time()
     total_time = end_time - start_time
@@ -313,6 +509,8 @@ def compile_py_scripts(py_dir_path, dat_dir_path, only_translated):
     print(f"{Fore.GREEN}Успешно скомпилировано: {compiled_count}{Style.RESET_ALL}")
     if only_translated:
         print(f"{Fore.YELLOW}Пропущено (без перевода): {skipped_files}{Style.RESET_ALL}")
+    if to_build is not None:
+        print(f"{Fore.CYAN}Без изменений (инкрементально): {unchanged_files}{Style.RESET_ALL}")
     if failed_files:
         print(f"{Fore.RED}Файлов с ошибками:       {len(failed_files)}{Style.RESET_ALL}")
     else:
@@ -348,21 +546,30 @@ if __name__ == "__main__":
         default=True, # По умолчанию компилируем только измененные
         help="Компилировать только те .py файлы, в которых были найдены и заменены строки перевода (yes/no, true/false, 1/0). По умолчанию: true."
     )
+    parser.add_argument(
+        '--incremental',
+        type=str_to_bool,
+        nargs='?',
+        const=True,
+        default=True,
+        help=f"Пересобирать только .dat, затронутые изменениями в карте строк или в .py с прошлой сборки (состояние в {BUILD_STATE_FILE}). По умолчанию: true."
+    )
     args = parser.parse_args()
     # --- Конец парсера аргументов ---
 
     script_location = os.path.dirname(os.path.abspath(__file__))
     py_directory = os.path.join(script_location, INPUT_PY_SUBDIR)
     dat_directory = os.path.join(script_location, OUTPUT_DAT_SUBDIR)
+    state_path = os.path.join(script_location, BUILD_STATE_FILE)
 
     # Загружаем карту строк ПЕРЕД компиляцией
     if load_string_map(STRMAP_FILE):
-        compile_py_scripts(py_directory, dat_directory, args.only_translated) # Передаем параметр only_translated
+        compile_py_scripts(py_directory, dat_directory, args.only_translated, args.incremental, state_path) # Передаем параметр only_translated
     else:
         print(f"{Fore.YELLOW}Карта строк не загружена или пуста. Запуск компиляции без замены строк...{Style.RESET_ALL}")
         # Даже если карта не загружена, пытаемся скомпилировать, но замены не произойдут
         # Установим only_translated в False, чтобы точно попытаться скомпилировать все
-        compile_py_scripts(py_directory, dat_directory, False)
+        compile_py_scripts(py_directory, dat_directory, False, args.incremental, state_path)
 
 
     # input("Нажмите Enter для выхода...") # Раскомментируйте, если нужно
\ No newline at end of file
@@ -1,12 +1,15 @@
 import os
 import ast
+import argparse
 import traceback
-import uuid
-import xml.etree.ElementTree as ET
 import shutil
 import sys
 import time
 import json # Для карты строк
+import re
+from concurrent.futures import ProcessPoolExecutor
+from lib.xliff_writer import XliffWriter, ContentIds, load_previous_xliff
+from disasm.ED9IR import IR_EXTENSION, load_ir, iter_pushstrings, find_script_sources, normalize_string_key
 try:
     import colorama
     colorama.init(autoreset=True)
@@ -25,14 +28,21 @@ MIN_STRING_LENGTH = 3               # Минимальная длина стро
 REQUIRE_SPACE = True                # Требовать ли наличие пробела в строке
 IGNORE_UNDERSCORE_ONLY = True       # Игнорировать строки только с '_' и буквами/цифрами
 IGNORE_NUMERIC_PUNCT = True         # Игнорировать строки только из цифр/пунктуации
+MAX_WORKERS = None                  # Процессов для сканирования файлов (None = по числу ядер, 1 = без пула)
+SCAN_CHUNKSIZE = 8                  # Файлов на одну задачу пула
 SOURCE_LANGUAGE = "en"              # Исходный язык
 TARGET_LANGUAGE = "ru"              # Целевой язык
 # --------------------
 
+# Строка сгенерированного .py с одним PUSHSTRING("...") (быстрый путь без ast)
+PUSHSTRING_LINE_RE = re.compile(r'^\s*PUSHSTRING\(("(?:[^"\\\n]|\\.)*")\)\s*$')
+
 # { original_string: text_id } - для проверки уникальности и связи с ID
 string_to_id_map = {}
 # { text_id: {"source": original_string, "file": filename} } - для записи в XLIFF
 xliff_data = {}
+# ID строится из хеша текста, поэтому при повторном извлечении у строки тот же ID
+string_ids = ContentIds(prefix="py_")
 
 def is_translatable_string(s):
     """Применяет фильтры для определения переводимой строки."""
@@ -64,11 +74,42 @@ def is_translatable_string(s):
     # Считаем строку переводимой, если она прошла все проверки
     return True
 
+def register_string(original_string, filename):
+    """Добавляет строку в карту, если она переводимая и новая. Возвращает True для новой строки."""
+    if not is_translatable_string(original_string) or original_string in string_to_id_map:
+        return False
+    text_id = string_ids.get(original_string)
+    string_to_id_map[original_string] = text_id
+    xliff_data[text_id] = {"source": original_string, "file": filename}
+    return True
+
+def scan_ir_strings(filepath):
+    """Строки PUSHSTRING из компактного IR (без разбора Python), по порядку."""
+    ir = load_ir(filepath)
+    # Ключи как в .py (" -> '), чтобы карта подходила для любого способа сборки
+    return [normalize_string_key(ir["strings"][string_id]) for string_id in iter_pushstrings(ir)]
+
+def scan_dat_strings(filepath):
+    """
+    Строки PUSHSTRING прямо из .dat: декодируется только поток инструкций, .py не создается.
+    """
+    # Импорт здесь, чтобы обычный режим (.py/.ir.json) не тянул разбор .dat
+    from disasm.script import ScriptFile
+    from lib.parser import readtextoffset, remove2MSB
+
+    scp = ScriptFile(filepath).load_all()
+    strings = []
+    # Порядок функций как в дизассемблированном .py (по адресу)
+    for function in scp.functions_by_start:
+        for instruction in function.instructions:
+            if instruction.op_code == 0 and instruction.name == "PUSHSTRING":
+                strings.append(normalize_string_key(readtextoffset(scp.stream, remove2MSB(instruction.operands[0].value))))
+    return strings
+
 class PushStringVisitor(ast.NodeVisitor):
     """Обходит AST и извлекает строки из PUSHSTRING."""
-    def __init__(self, filename):
-        self.filename = filename
-        self.count = 0
+    def __init__(self):
+        self.strings = []
 
     def visit_Call(self, node):
         func_name = ""
@@ -77,69 +118,118 @@ class PushStringVisitor(ast.NodeVisitor):
 
         if func_name == "PUSHSTRING":
             if node.args and isinstance(node.args[0], ast.Constant) and isinstance(node.args[0].value, str):
-                original_string = node.args[0].value
-                if is_translatable_string(original_string):
-                    if original_string not in string_to_id_map:
-                        text_id = f"py_{uuid.uuid4().hex[:12]}"
-                        string_to_id_map[original_string] = text_id
-                        xliff_data[text_id] = {"source": original_string, "file": self.filename}
-                        self.count += 1
-                    # else: ID уже есть для этой строки
+                self.strings.append(node.args[0].value)
             elif node.args and isinstance(node.args[0], ast.Str): # Совместимость с Python < 3.8
-                 original_string = node.args[0].s
-                 if is_translatable_string(original_string):
-                    if original_string not in string_to_id_map:
-                        text_id = f"py_{uuid.uuid4().hex[:12]}"
-                        string_to_id_map[original_string] = text_id
-                        xliff_data[text_id] = {"source": original_string, "file": self.filename}
-                        self.count += 1
+                self.strings.append(node.args[0].s)
 
         # Продолжаем обход дерева, чтобы найти все вызовы PUSHSTRING
         self.generic_visit(node)
 
-def create_xliff_and_map(xliff_filepath, strmap_filepath):
-    """Создает XLIFF и пустой JSON для карты строк."""
+def scan_py_strings(filepath):
+    """
+    Строки PUSHSTRING из .py. Сгенерированные файлы содержат по одному PUSHSTRING("...") в строке,
+    такие строки разбираются регулярным выражением; если хотя бы одна строка с PUSHSTRING
+    не подходит под шаблон (файл правили вручную), весь файл разбирается через ast.
+    """
+    with open(filepath, 'r', encoding='utf-8') as f_read:
+        source_code = f_read.read()
+    strings = []
+    for line in source_code.splitlines():
+        if "PUSHSTRING" not in line:
+            continue
+        match = PUSHSTRING_LINE_RE.match(line)
+        if match is None:
+            break
+        strings.append(ast.literal_eval(match.group(1)))
+    else:
+        return strings
+    tree = ast.parse(source_code, filename=os.path.basename(filepath))
+    visitor = PushStringVisitor()
+    visitor.visit(tree)
+    return visitor.strings
+
+def scan_source_file(filepath):
+    """
+    Выполняется в процессе пула. Возвращает (статус, строки или текст ошибки):
+    "ok" - список строк по порядку, "syntax" - синтаксическая ошибка, "error" - прочая ошибка.
+    """
+    try:
+        lower_path = filepath.lower()
+        if lower_path.endswith(IR_EXTENSION):
+            return "ok", scan_ir_strings(filepath)
+        if lower_path.endswith(".dat"):
+            return "ok", scan_dat_strings(filepath)
+        return "ok", scan_py_strings(filepath)
+    except SyntaxError as e:
+        return "syntax", str(e)
+    except Exception as e:
+        return "error", f"{e}\n{traceback.format_exc()}"
+
+def scan_files(filepaths, max_workers=MAX_WORKERS):
+    """
+    Сканирует файлы параллельно. Результаты выдаются в порядке filepaths, поэтому
+    регистрация строк (и файл, к которому привязана строка) не зависит от числа процессов.
+    """
+    if max_workers == 1 or len(filepaths) < 2:
+        for filepath in filepaths:
+            yield scan_source_file(filepath)
+        return
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        yield from executor.map(scan_source_file, filepaths, chunksize=SCAN_CHUNKSIZE)
+
+def register_strings(strings, filename):
+    """Регистрирует строки одного файла. Возвращает кол-во новых."""
+    return sum(1 for s in strings if register_string(s, filename))
+
+def load_previous_units(previous_xliff):
+    """Загружает предыдущий переведенный XLIFF для режима слияния. None, если файла нет или он не читается."""
+    if not previous_xliff:
+        return None
+    if not os.path.exists(previous_xliff):
+        print(f"{Fore.YELLOW}Предыдущий XLIFF '{previous_xliff}' не найден, слияние не выполняется.{Style.RESET_ALL}")
+        return None
+    previous_units = load_previous_xliff(
+        previous_xliff,
+        on_error=lambda e: print(f"{Fore.RED}Ошибка при чтении предыдущего XLIFF '{previous_xliff}': {e}{Style.RESET_ALL}"))
+    if previous_units is not None:
+        print(f"{Fore.CYAN}Слияние с предыдущим XLIFF: {previous_xliff} ({len(previous_units)} строк){Style.RESET_ALL}")
+    return previous_units
+
+def create_xliff_and_map(xliff_filepath, strmap_filepath, previous_xliff=None):
+    """
+    Создает XLIFF и пустой JSON для карты строк.
+    previous_xliff - предыдущий переведенный XLIFF: переводы, отметки approved и примечания
+    переносятся по ID (или по исходному тексту), непереведенными остаются только новые строки.
+    """
     global xliff_data
     if not xliff_data:
         print(f"{Fore.YELLOW}Не найдено строк для перевода, файлы не созданы.{Style.RESET_ALL}")
         return False, 0
 
-    xliff_root = ET.Element("xliff", version="1.2", xmlns="urn:oasis:names:tc:xliff:document:1.2")
-    file_element = ET.SubElement(xliff_root, "file",
-                                 original="combined_python_scripts",
-                                 datatype="plaintext", # Используем plaintext, т.к. строки из разных файлов
-                                 source_language=SOURCE_LANGUAGE,
-                                 target_language=TARGET_LANGUAGE)
-    body_element = ET.SubElement(file_element, "body")
+    # Читается до записи: выходной файл может совпадать с предыдущим
+    previous_units = load_previous_units(previous_xliff)
 
     sorted_ids = sorted(xliff_data.keys())
     string_map_data = {} # Для JSON
 
-    for text_id in sorted_ids:
-        data = xliff_data[text_id]
-        original_string = data["source"]
-        filename = data["file"]
-
-        trans_unit = ET.SubElement(body_element, "trans-unit", id=text_id)
-        # Добавляем имя файла как примечание (note)
-        ET.SubElement(trans_unit, "note").text = f"File: {filename}"
-        source = ET.SubElement(trans_unit, "source")
-        source.text = original_string.replace("\n", "\\n")
-        target = ET.SubElement(trans_unit, "target")
-        # target.text = "" # Пустой таргет
-
-        # Добавляем в карту строк для JSON (ключ - оригинал, значение - пока тоже оригинал)
-        string_map_data[original_string] = original_string
-
-    # Запись XLIFF
+    # Запись XLIFF (потоково, по одному trans-unit)
     try:
-        xliff_tree = ET.ElementTree(xliff_root)
-        import xml.dom.minidom
-        xml_str = ET.tostring(xliff_root, encoding='utf-8')
-        dom = xml.dom.minidom.parseString(xml_str)
-        pretty_xml_as_string = dom.toprettyxml(indent="  ", encoding='utf-8')
-        with open(xliff_filepath, "wb") as f: f.write(pretty_xml_as_string)
+        with XliffWriter(xliff_filepath,
+                         original="combined_python_scripts",
+                         datatype="plaintext", # Используем plaintext, т.к. строки из разных файлов
+                         source_language=SOURCE_LANGUAGE,
+                         target_language=TARGET_LANGUAGE,
+                         previous_units=previous_units) as writer:
+            for text_id in sorted_ids:
+                data = xliff_data[text_id]
+                original_string = data["source"]
+                # Имя файла записывается как примечание (note), target пустой
+                writer.write_unit(text_id, original_string.replace("\n", "\\n"), note=f"File: {data['file']}")
+                # Добавляем в карту строк для JSON (ключ - оригинал, значение - пока тоже оригинал)
+                string_map_data[original_string] = original_string
         print(f"{Fore.GREEN}XLIFF файл успешно создан: {xliff_filepath}{Style.RESET_ALL}")
+        if previous_units is not None:
+            print(f"{Fore.GREEN}Перенесено переводов: {writer.carried}, без перевода: {writer.count - writer.carried}{Style.RESET_ALL}")
     except Exception as e:
         print(f"{Fore.RED}Ошибка при записи XLIFF файла '{xliff_filepath}': {e}{Style.RESET_ALL}")
         return False, len(xliff_data)
@@ -155,7 +245,47 @@ def create_xliff_and_map(xliff_filepath, strmap_filepath):
 
     return True, len(xliff_data)
 
-def process_py_files(py_dir):
+def process_dat_files(dat_dir_path, max_workers=MAX_WORKERS, previous_xliff=None):
+    """Быстрый режим: строки из .dat сразу в XLIFF и карту строк, без дизассемблирования в .py."""
+    script_location = os.path.dirname(os.path.abspath(__file__))
+    if not os.path.isdir(dat_dir_path):
+        print(f"{Fore.RED}Ошибка: Директория '{dat_dir_path}' не найдена.{Style.RESET_ALL}")
+        return False
+
+    processed_files = 0
+    failed_files = []
+    start_time = time.time()
+    print(f"{Fore.CYAN}Поиск строк для перевода напрямую в файлах *.dat в '{dat_dir_path}'...{Style.RESET_ALL}")
+
+    all_dat_files = sorted([f for f in os.listdir(dat_dir_path) if f.lower().endswith(".dat")])
+    total_files_to_process = len(all_dat_files)
+    filepaths = [os.path.join(dat_dir_path, filename) for filename in all_dat_files]
+    for i, (filename, (status, result)) in enumerate(zip(all_dat_files, scan_files(filepaths, max_workers))):
+        percent_complete = int(((i + 1) / total_files_to_process) * 100)
+        print(f"\r[{Style.BRIGHT}Обработка {filename}{Style.RESET_ALL}] | Прогресс: {percent_complete}% ({i+1}/{total_files_to_process})", end="")
+        if status == "ok":
+            register_strings(result, filename)
+            processed_files += 1
+        else:
+            print(f"\n    {Fore.RED}Ошибка при обработке файла {filename}: {result.splitlines()[0] if result else ''}{Style.RESET_ALL}")
+            failed_files.append(filename)
+    print()
+
+    total_time = time.time() - start_time
+    print(f"\n--- {Style.BRIGHT}Обработка файлов завершена{Style.RESET_ALL} ---")
+    print(f"Обработано файлов: {processed_files} / {total_files_to_process}")
+    if failed_files:
+        print(f"{Fore.RED}Файлов с ошибками: {len(failed_files)}{Style.RESET_ALL}")
+        for fname in failed_files: print(f"- {fname}")
+    print(f"Найдено уникальных строк для перевода (всего): {len(xliff_data)}")
+    print(f"Затраченное время: {total_time:.2f} сек.")
+
+    output_xliff_path = os.path.join(script_location, OUTPUT_XLIFF_FILE)
+    output_strmap_path = os.path.join(script_location, OUTPUT_STRMAP_FILE)
+    created, _ = create_xliff_and_map(output_xliff_path, output_strmap_path, previous_xliff)
+    return created and not failed_files
+
+def process_py_files(py_dir, max_workers=MAX_WORKERS, previous_xliff=None):
     """Основная функция обработки."""
     script_location = os.path.dirname(os.path.abspath(__file__))
     py_dir_path = os.path.join(script_location, py_dir)
@@ -170,29 +300,24 @@ def process_py_files(py_dir):
 
     print(f"{Fore.CYAN}Поиск строк для перевода в файлах *.py в '{py_dir_path}'...{Style.RESET_ALL}")
 
-    all_py_files = sorted([f for f in os.listdir(py_dir_path) if f.lower().endswith(".py")])
-    total_files_to_process = len(all_py_files)
+    # Для каждого скрипта берем .ir.json (быстро, без ast.parse) или .py, если он правился вручную
+    sources = find_script_sources(py_dir_path)
+    all_source_files = sorted(os.path.basename(sources[base]) for base in sources)
+    total_files_to_process = len(all_source_files)
 
-    for i, filename in enumerate(all_py_files):
-        filepath = os.path.join(py_dir_path, filename)
+    filepaths = [os.path.join(py_dir_path, filename) for filename in all_source_files]
+    for i, (filename, (status, result)) in enumerate(zip(all_source_files, scan_files(filepaths, max_workers))):
         print(f"--- [{i+1}/{total_files_to_process}] Обработка файла: {Style.BRIGHT}{filename}{Style.RESET_ALL} ---")
-        try:
-            with open(filepath, 'r', encoding='utf-8') as f_read:
-                source_code = f_read.read()
-
-            tree = ast.parse(source_code, filename=filename)
-            visitor = PushStringVisitor(filename)
-            visitor.visit(tree)
-            if visitor.count > 0:
-                 print(f"  Найдено новых уникальных строк: {visitor.count}")
+        if status == "ok":
+            count = register_strings(result, filename)
+            if count > 0:
+                 print(f"  Найдено новых уникальных строк: {count}")
             processed_files += 1
-            total_strings_found_in_files += visitor.count
-
-        except SyntaxError as e:
-            print(f"    {Fore.RED}СИНТАКСИЧЕСКАЯ ОШИБКА в файле {filename}: {e}. Файл пропущен.{Style.RESET_ALL}")
-        except Exception as e:
-            print(f"    {Fore.RED}Неожиданная ошибка при обработке файла {filename}: {e}{Style.RESET_ALL}")
-            print(traceback.format_exc())
+            total_strings_found_in_files += count
+        elif status == "syntax":
+            print(f"    {Fore.RED}СИНТАКСИЧЕСКАЯ ОШИБКА в файле {filename}: {result}. Файл пропущен.{Style.RESET_ALL}")
+        else:
+            print(f"    {Fore.RED}Неожиданная ошибка при обработке файла {filename}: {result}{Style.RESET_ALL}")
 
     end_time = time.time()
     total_time = end_time - start_time
@@ -205,9 +330,26 @@ def process_py_files(py_dir):
     # Создаем XLIFF и JSON карту
     output_xliff_path = os.path.join(script_location, OUTPUT_XLIFF_FILE)
     output_strmap_path = os.path.join(script_location, OUTPUT_STRMAP_FILE)
-    create_xliff_and_map(output_xliff_path, output_strmap_path)
+    create_xliff_and_map(output_xliff_path, output_strmap_path, previous_xliff)
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Извлекает строки для перевода в XLIFF и карту строк.")
+    parser.add_argument("--dat-dir", default=None,
+                        help=f"Извлекать строки напрямую из .dat файлов этой папки (без .py). По умолчанию читается папка {PY_FILES_DIR}.")
+    parser.add_argument("-j", "--jobs", type=int, default=MAX_WORKERS,
+                        help="Число процессов для сканирования файлов. По умолчанию: по числу ядер.")
+    parser.add_argument("--merge", nargs="?", const=OUTPUT_XLIFF_FILE, default=None, metavar="XLIFF",
+                        help=f"Перенести переводы из предыдущего XLIFF (по умолчанию {OUTPUT_XLIFF_FILE}), новыми останутся только новые строки.")
+    args = parser.parse_args()
+    previous_xliff = None
+    if args.merge:
+        previous_xliff = args.merge if os.path.isabs(args.merge) or os.path.exists(args.merge) else \
+                         os.path.join(os.path.dirname(os.path.abspath(__file__)), args.merge)
+
     # --- Резервное копирование НЕ ТРЕБУЕТСЯ, т.к. файлы не изменяются ---
-    process_py_files(PY_FILES_DIR)
+    if args.dat_dir:
+        if not process_dat_files(args.dat_dir, args.jobs, previous_xliff):
+            sys.exit(1)
+    else:
+        process_py_files(PY_FILES_DIR, args.jobs, previous_xliff)
     print("\nГотово.")
\ No newline at end of file
@@ -0,0 +1,228 @@
+import sys
+import os
+import json
+import time
+import argparse
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+try:
+    import colorama
+    colorama.init(autoreset=True)
+    Fore = colorama.Fore
+    Style = colorama.Style
+except ImportError:
+    print("Предупреждение: Библиотека colorama не найдена (pip install colorama). Цветной вывод будет отключен.")
+    class DummyStyle:
+        def __getattr__(self, name): return ""
+    Fore = DummyStyle(); Style = DummyStyle()
+
+# --- Конфигурация ---
+INDEX_FILE = "script_index.json"  # Индекс вызовов и строк по всем .dat
+INDEX_VERSION = 1
+MAX_WORKERS = None                # None = по числу ядер
+# --------------------
+
+# Формат индекса:
+# {
+#   "version": 1,
+#   "scripts": {"имя.dat": {"mtime", "size", "functions": {функция: {"calls": [[скрипт, функция], ...],
+#                                                                    "local_calls": [функция, ...],
+#                                                                    "strings": [строка, ...]}}}},
+#   "callers": {"скрипт:функция": [[скрипт, функция], ...]},   обратные ребра (вызовы из других скриптов и свои CALL)
+#   "strings": {строка: [[скрипт, функция], ...]}
+# }
+# Строки хранятся в нормализованном виде (как ключи strings_map.json).
+
+def call_target_str(stream, value):
+    """Имя скрипта/функции из операнда CALLFROMANOTHERSCRIPT (обычно строка)."""
+    from lib.parser import identifytype, remove2MSB, readtextoffset, get_actual_value_str
+    if identifytype(value) == "string":
+        return readtextoffset(stream, remove2MSB(value))
+    return get_actual_value_str(stream, value)
+
+def index_script(dat_path):
+    """Разбирает один .dat и возвращает {функция: {"calls", "local_calls", "strings"}}. Выполняется в отдельном процессе."""
+    from disasm.script import ScriptFile
+    from disasm.ED9IR import normalize_string_key
+    from lib.parser import readtextoffset, remove2MSB
+
+    scp = ScriptFile(dat_path).load_all()
+    functions = {}
+    for fun in scp.functions_by_start:
+        calls, local_calls, strings = [], [], []
+        for instruction in fun.instructions:
+            op_code = instruction.op_code
+            if op_code == 0 and instruction.name == "PUSHSTRING":
+                strings.append(normalize_string_key(readtextoffset(scp.stream, remove2MSB(instruction.operands[0].value))))
+            elif op_code in (0x22, 0x23):
+                target = [call_target_str(scp.stream, instruction.operands[0].value),
+                          call_target_str(scp.stream, instruction.operands[1].value)]
+                if target not in calls:
+                    calls.append(target)
+            elif op_code == 0x0C:
+                fun_id = instruction.operands[0].value
+                name = scp.functions[fun_id].name if fun_id < len(scp.functions) else str(fun_id)
+                if name not in local_calls:
+                    local_calls.append(name)
+        functions[fun.name] = {"calls": calls, "local_calls": local_calls, "strings": list(dict.fromkeys(strings))}
+    return functions
+
+def load_index(index_path):
+    try:
+        with open(index_path, 'r', encoding='utf-8') as f:
+            index = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return None
+    if index.get("version") != INDEX_VERSION:
+        return None
+    return index
+
+def build_reverse_maps(scripts):
+    """Строит обратные ребра вызовов и карту строк по данным всех скриптов."""
+    callers = {}
+    strings = {}
+    for dat_name, entry in scripts.items():
+        script_name = os.path.splitext(dat_name)[0]
+        for fun_name, fun in entry["functions"].items():
+            source = [script_name, fun_name]
+            for target_script, target_fun in fun["calls"]:
+                callers.setdefault(f"{target_script}:{target_fun}", []).append(source)
+            for target_fun in fun["local_calls"]:
+                callers.setdefault(f"{script_name}:{target_fun}", []).append(source)
+            for text in fun["strings"]:
+                strings.setdefault(text, []).append(source)
+    return callers, strings
+
+def build_index(input_dir, index_path, force=False, max_workers=MAX_WORKERS):
+    """Индексирует все .dat папки параллельно. Неизмененные (mtime/размер) файлы берутся из старого индекса."""
+    start_time = time.time()
+    old_index = None if force else load_index(index_path)
+    old_scripts = old_index["scripts"] if old_index else {}
+
+    dat_files = sorted(f for f in os.listdir(input_dir) if f.lower().endswith(".dat"))
+    scripts = {}
+    to_index = []
+    for filename in dat_files:
+        stat = os.stat(os.path.join(input_dir, filename))
+        old = old_scripts.get(filename)
+        if old and old["mtime"] == stat.st_mtime and old["size"] == stat.st_size:
+            scripts[filename] = old
+        else:
+            to_index.append((filename, stat))
+    print(f"{Fore.CYAN}Всего .dat файлов: {len(dat_files)}, к индексации: {len(to_index)}{Style.RESET_ALL}")
+
+    failed_files = []
+    if to_index:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = {executor.submit(index_script, os.path.join(input_dir, filename)): (filename, stat) for filename, stat in to_index}
+            for done, future in enumerate(as_completed(futures)):
+                filename, stat = futures[future]
+                try:
+                    functions = future.result()
+                except Exception as e:
+                    print(f"\n{Fore.RED}Ошибка при индексации {filename}: {e}{Style.RESET_ALL}")
+                    failed_files.append(filename)
+                    continue
+                # Индекс пишется после os.stat, поэтому файл, измененный во время индексации, будет переиндексирован
+                scripts[filename] = {"mtime": stat.st_mtime, "size": stat.st_size, "functions": functions}
+                print(f"\r[{Style.BRIGHT}Индексация{Style.RESET_ALL}] {done + 1}/{len(to_index)}", end="")
+        print()
+
+    callers, strings = build_reverse_maps(scripts)
+    index = {"version": INDEX_VERSION, "scripts": scripts, "callers": callers, "strings": strings}
+    with open(index_path, 'w', encoding='utf-8') as f:
+        json.dump(index, f, ensure_ascii=False, separators=(",", ":"))
+
+    print(f"\n--- {Style.BRIGHT}Индексация завершена{Style.RESET_ALL} ---")
+    print(f"{Fore.GREEN}Скриптов в индексе:  {len(scripts)}{Style.RESET_ALL}")
+    print(f"{Fore.GREEN}Ребер вызовов:       {sum(len(v) for v in callers.values())}{Style.RESET_ALL}")
+    print(f"{Fore.GREEN}Уникальных строк:    {len(strings)}{Style.RESET_ALL}")
+    print(f"{(Fore.RED if failed_files else Fore.GREEN)}Файлов с ошибками:   {len(failed_files)}{Style.RESET_ALL}")
+    print(f"{Fore.CYAN}Затраченное время:   {time.time() - start_time:.2f} сек.{Style.RESET_ALL}")
+    print(f"{Fore.CYAN}Индекс сохранен в:   {Style.BRIGHT}{index_path}{Style.RESET_ALL}")
+    for fname in failed_files:
+        print(f"- {fname}")
+    return not failed_files
+
+def print_locations(locations):
+    for script_name, fun_name in sorted(map(tuple, locations)):
+        print(f"  {script_name}:{fun_name}")
+
+def query_callers(index, script_name, fun_name):
+    locations = index["callers"].get(f"{script_name}:{fun_name}", [])
+    print(f"{Fore.CYAN}Вызывают {script_name}:{fun_name} ({len(locations)}):{Style.RESET_ALL}")
+    print_locations(locations)
+
+def query_callees(index, script_name, fun_name=None):
+    entry = index["scripts"].get(script_name + ".dat")
+    if entry is None:
+        print(f"{Fore.RED}Скрипт '{script_name}' не найден в индексе.{Style.RESET_ALL}")
+        return
+    for name, fun in entry["functions"].items():
+        if fun_name is not None and name != fun_name:
+            continue
+        targets = [tuple(t) for t in fun["calls"]] + [(script_name, t) for t in fun["local_calls"]]
+        print(f"{Fore.CYAN}{script_name}:{name} вызывает ({len(targets)}):{Style.RESET_ALL}")
+        print_locations(targets)
+
+def query_string(index, text, substring=False):
+    from disasm.ED9IR import normalize_string_key
+    text = normalize_string_key(text)
+    if substring:
+        matches = {s: locations for s, locations in index["strings"].items() if text in s}
+    else:
+        matches = {text: index["strings"][text]} if text in index["strings"] else {}
+    if not matches:
+        print(f"{Fore.YELLOW}Строка не найдена.{Style.RESET_ALL}")
+    for s, locations in matches.items():
+        print(f"{Fore.CYAN}{s!r} ({len(locations)}):{Style.RESET_ALL}")
+        print_locations(locations)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Индекс вызовов между скриптами (CALLFROMANOTHERSCRIPT, CALL) и использования строк по всем .dat.")
+    parser.add_argument("--index", default=None, help=f"Файл индекса. По умолчанию: {INDEX_FILE} рядом со скриптом.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    build_parser = subparsers.add_parser("build", help="Построить/обновить индекс.")
+    build_parser.add_argument("-i", "--input", dest="input_dir", required=True, help="Папка с .dat файлами.")
+    build_parser.add_argument("--force", action="store_true", help="Переиндексировать все файлы.")
+    build_parser.add_argument("-j", "--jobs", type=int, default=MAX_WORKERS, help="Число процессов. По умолчанию: по числу ядер.")
+
+    callers_parser = subparsers.add_parser("callers", help="Кто вызывает функцию.")
+    callers_parser.add_argument("script", help="Имя скрипта (без .dat).")
+    callers_parser.add_argument("function", help="Имя функции.")
+
+    callees_parser = subparsers.add_parser("callees", help="Что вызывает скрипт/функция.")
+    callees_parser.add_argument("script", help="Имя скрипта (без .dat).")
+    callees_parser.add_argument("function", nargs="?", default=None, help="Имя функции (по умолчанию все).")
+
+    string_parser = subparsers.add_parser("string", help="Где используется строка.")
+    string_parser.add_argument("text", help="Текст строки.")
+    string_parser.add_argument("--substring", action="store_true", help="Искать по подстроке.")
+
+    args = parser.parse_args()
+    index_path = args.index or os.path.join(os.path.dirname(os.path.abspath(__file__)), INDEX_FILE)
+
+    if args.command == "build":
+        if not os.path.isdir(args.input_dir):
+            print(f"{Fore.RED}Ошибка: Папка '{args.input_dir}' не найдена.{Style.RESET_ALL}")
+            sys.exit(1)
+        try:
+            success = build_index(args.input_dir, index_path, args.force, args.jobs)
+        except Exception as e:
+            print(f"{Fore.RED}Критическая ошибка: {e}{Style.RESET_ALL}")
+            traceback.print_exc()
+            success = False
+        sys.exit(0 if success else 1)
+
+    index = load_index(index_path)
+    if index is None:
+        print(f"{Fore.RED}Ошибка: Индекс '{index_path}' не найден или устарел. Сначала выполните команду build.{Style.RESET_ALL}")
+        sys.exit(1)
+    if args.command == "callers":
+        query_callers(index, args.script, args.function)
+    elif args.command == "callees":
+        query_callees(index, args.script, args.function)
+    elif args.command == "string":
+        query_string(index, args.text, args.substring)
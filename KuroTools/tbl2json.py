@@ -1,3 +1,4 @@
+import io
 import json
 import os
 from pathlib import Path
@@ -17,25 +18,38 @@ def init_argparse() -> argparse.ArgumentParser:
         "-v", "--version", action="version",
         version = f"{parser.prog} version 0.0"
     )
+    parser.add_argument('--p3a', default=None,
+                        help="read FILE from this P3A archive instead of the disk")
     parser.add_argument('file')
     return parser
 
-def parse(name: Union[str, bytes, os.PathLike]) -> None:
+def open_tbl(name, archive = None):
+    #Returns (stream positioned after the magic, size). Encrypted tables on disk are decrypted in place;
+    #tables read from an archive are decrypted in memory, the archive is never modified.
+    if archive is not None:
+        content = archive.read(name)
+        if content[:4] != b"#TBL":
+            content = processCLE(content)
+        tbl_file = io.BytesIO(content)
+        tbl_file.seek(4)
+        return tbl_file, len(content)
+    tbl_file = open(name, "rb")
+    magic = tbl_file.read(4)
+    if magic != b"#TBL":
+        tbl_file.close()
+        with open(name, mode='rb') as encrypted_file: 
+            fileContent = encrypted_file.read()
+        decrypted_file = processCLE(fileContent)
+        with open(name, "w+b") as outputfile:
+            outputfile.write(decrypted_file)
+        tbl_file = open(name, "rb")
+        tbl_file.seek(4)
+    return tbl_file, os.path.getsize(name)
+
+def parse(name: Union[str, bytes, os.PathLike], archive: "P3AArchive" = None) -> None:
     filename = Path(name).stem
-    filesize = os.path.getsize(name)
-    with open(name, "rb") as tbl_file:
-        magic = tbl_file.read(4)
-        if magic != b"#TBL":
-            with open(name, mode='rb') as encrypted_file: 
-                fileContent = encrypted_file.read()
-            decrypted_file = processCLE(fileContent)
-            with open(name, "w+b") as outputfile:
-                outputfile.write(decrypted_file)
-            filesize = os.path.getsize(name)
-            tbl_file = open(name, "rb")
-            tbl_file.seek(4)
-
-        
+    tbl_file, filesize = open_tbl(name, archive)
+    with tbl_file:
         header_count = readint(tbl_file, 4)
         headers = []
         tbl_data = []
@@ -147,6 +161,10 @@ def main() -> None:
     args = parser.parse_args()
     if not args.file:
         raise Exception("tbl2json needs a table to decompile!")
+    elif args.p3a:
+        from lib.p3a import P3AArchive
+        with P3AArchive(args.p3a) as archive:
+            parse(args.file, archive)
     else:
         parse(args.file)
 
@@ -0,0 +1,64 @@
+import os
+import sys
+import json
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from lib.xliff_writer import XliffWriter
+from translation_memory import TranslationMemory
+from fuzzy_match import FuzzyIndex, CACHE_SUFFIX as FUZZY_CACHE_SUFFIX
+from line_overflow import measure_file, CACHE_SUFFIX as OVERFLOW_CACHE_SUFFIX
+from font.font import WidthTable, Glyph
+
+# Кэши лежат рядом с XLIFF/базой (часто в общей папке), поэтому читаются без pickle
+
+def write_xliff(path, units):
+    with XliffWriter(str(path), original="test") as writer:
+        for unit_id, source, target in units:
+            writer.write_unit(unit_id, source, target)
+
+def test_fuzzy_index_cache_round_trip(tmp_path):
+    xliff = tmp_path / "done.xliff"
+    write_xliff(xliff, [("1", "Open the door", "Открыть дверь"), ("2", "Close the door", "Закрыть дверь"),
+                        ("3", "Save the game", "Сохранить игру")])
+    with TranslationMemory(str(tmp_path / "tm.db")) as tm:
+        tm.import_xliff(str(xliff))
+        built = FuzzyIndex.from_translation_memory(tm)
+        cache_path = tm.db_path + FUZZY_CACHE_SUFFIX
+        assert os.path.exists(cache_path)
+        with open(cache_path, "rb") as f:
+            header = json.loads(f.readline())
+        assert sorted(header["sources"]) == sorted(built.sources)
+
+        cached = FuzzyIndex.from_translation_memory(tm)
+        assert cached.sources == built.sources
+        assert cached.targets == built.targets
+        assert cached.gram_counts == built.gram_counts
+        assert cached.postings == built.postings
+        assert cached.search("Open the doors") == built.search("Open the doors")
+
+        # Поврежденный кэш не ломает поиск, индекс строится заново
+        with open(cache_path, "wb") as f:
+            f.write(b"\x80\x04garbage")
+        rebuilt = FuzzyIndex.from_translation_memory(tm)
+        assert rebuilt.sources == built.sources
+
+def test_line_widths_cache_is_json(tmp_path):
+    xliff = tmp_path / "done.xliff"
+    write_xliff(xliff, [("1", "ab", "aaa\\nb"), ("2", "b", "bb")])
+    widths = WidthTable([Glyph(0, ord("a"), 0, 0, 0, 3, 0, 0, 0, 0, 0), Glyph(0, ord("b"), 0, 0, 0, 5, 0, 0, 0, 0, 0)])
+
+    results, measured, reused = measure_file(str(xliff), widths, "font-hash")
+    assert (measured, reused) == (2, 0)
+    assert [(unit_id, source_width, list(line_widths)) for unit_id, source_width, line_widths, _ in results] == \
+           [("1", 8, [9, 5]), ("2", 5, [10])]
+    with open(str(xliff) + OVERFLOW_CACHE_SUFFIX, "r", encoding="utf-8") as f:
+        assert set(json.load(f)["units"]) == {"1", "2"}
+
+    results_again, measured, reused = measure_file(str(xliff), widths, "font-hash")
+    assert (measured, reused) == (0, 2)
+    assert results_again == results
+
+    # Другой шрифт - кэш не используется
+    _, measured, reused = measure_file(str(xliff), widths, "other-font")
+    assert (measured, reused) == (2, 0)
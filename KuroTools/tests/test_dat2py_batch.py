@@ -0,0 +1,33 @@
+import os
+import sys
+import subprocess
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dat2py_batch import TOOL_SOURCES
+
+KUROTOOLS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Модули из дерева KuroTools, которые загружаются при дизассемблировании
+LOADED_SOURCES_CODE = """
+import os, sys
+import disasm.ED9Disassembler
+from disasm.ED9InstructionsSet import get_commands_dict
+get_commands_dict()
+for module in list(sys.modules.values()):
+    path = getattr(module, "__file__", None)
+    if path and os.path.abspath(path).startswith(os.getcwd() + os.sep) and os.path.basename(path) != "__init__.py":
+        print("SOURCE", os.path.relpath(path).replace(os.sep, "/"))
+"""
+
+# processcle только распаковывает входной файл и на текст .py не влияет
+NOT_TOOL_SOURCES = {"processcle.py"}
+
+def test_tool_version_covers_disassembler_sources():
+    # Если модуля дизассемблера нет в TOOL_SOURCES, его правки не сбрасывают dat2py_manifest.json
+    result = subprocess.run([sys.executable, "-c", LOADED_SOURCES_CODE], cwd=KUROTOOLS_DIR,
+                            capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
+    loaded = {line.split(" ", 1)[1] for line in result.stdout.splitlines() if line.startswith("SOURCE ")}
+    assert "disasm/ED9Commands.py" in loaded
+    assert loaded - NOT_TOOL_SOURCES <= set(TOOL_SOURCES)
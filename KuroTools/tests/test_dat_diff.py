@@ -0,0 +1,50 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from disasm.ED9Assembler import assemble_ir
+from dat_diff import load_functions, diff_scripts
+
+def make_function(name):
+    return {"name": name, "hash": 0, "input_args": [], "output_args": [], "b0": 0, "b1": 0, "structs": []}
+
+def call(name, label):
+    # Как в скриптах игры: индекс вызывающей функции и адрес возврата кладутся на стек перед CALL
+    return [[0, "F"], [0, "L", label], [0x0C, name], label]
+
+def write_dat(path, function_names, code):
+    """Скрипт из IR (см. disasm/ED9IR.py): функции в порядке function_names, code - {функция: инструкции}."""
+    ir = {"name": "test", "varin": [], "varout": [], "strings": ["Hello", "Bye"],
+          "functions": [make_function(name) for name in function_names],
+          "code": [{"function": name, "instructions": code[name]} for name in function_names]}
+    path.write_bytes(assemble_ir(ir))
+    return str(path)
+
+def test_inserted_function_does_not_change_callers(tmp_path):
+    code = {
+        "main": [[0, "S", 0], *call("helper", "Loc_0"), [0x0D]],
+        "helper": [[0, "S", 1], [0x0D]],
+        "extra": [[0x0D]],
+    }
+    old_path = write_dat(tmp_path / "old.dat", ["main", "helper"], code)
+    # Новая функция перед вызываемой: индекс helper сдвигается с 1 на 2
+    new_path = write_dat(tmp_path / "new.dat", ["main", "extra", "helper"], code)
+
+    result = diff_scripts(load_functions(old_path), load_functions(new_path))
+    assert result["added"] == ["extra"]
+    assert result["changed"] == []
+    assert sorted(result["unchanged"]) == ["helper", "main"]
+
+def test_call_to_another_function_is_a_change(tmp_path):
+    code = {
+        "main": [*call("helper", "Loc_0"), [0x0D]],
+        "helper": [[0x0D]],
+        "other": [[0x0D]],
+    }
+    old_path = write_dat(tmp_path / "old.dat", ["main", "helper", "other"], code)
+    code["main"] = [*call("other", "Loc_0"), [0x0D]]
+    new_path = write_dat(tmp_path / "new.dat", ["main", "helper", "other"], code)
+
+    result = diff_scripts(load_functions(old_path), load_functions(new_path))
+    assert result["changed"] == ["main"]
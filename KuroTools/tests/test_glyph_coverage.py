@@ -0,0 +1,33 @@
+import os
+import sys
+import json
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from font.font import FONT_HEADER, GLYPH, FONT_MAGIC, GLYPH_TABLE_MAGIC, load_glyph_index, WidthTable, split_lines
+from glyph_coverage import find_missing_glyphs
+
+def write_font(path, characters, width=10):
+    table = b"".join(GLYPH.pack(ord(char), 0, 0, 0, width, 0, 0, 0, 0, 0) for char in characters)
+    header = FONT_HEADER.pack(FONT_MAGIC, 0, 0, len(characters), 0, 0, 0, 0, 0, 0, 0, GLYPH_TABLE_MAGIC, len(table))
+    path.write_bytes(header + table)
+
+def test_markup_is_not_reported_as_missing(tmp_path):
+    font_path = tmp_path / "font.fnt"
+    write_font(font_path, "Привет мир")
+    strings_map = tmp_path / "strings_map.json"
+    strings_map.write_text(json.dumps({"a": "#K#0TПривет\\nмир#E[5]#M_0", "b": "Привет, мир"}), encoding="utf-8")
+
+    font_codes = {chr(code) for code in load_glyph_index(str(font_path))}
+    missing_counts, examples, checked = find_missing_glyphs([str(strings_map)], font_codes)
+    assert checked == 2
+    assert dict(missing_counts) == {",": 1}
+    assert examples == {",": ["b"]}
+
+def test_lines_are_measured_without_markup(tmp_path):
+    font_path = tmp_path / "font.fnt"
+    write_font(font_path, "abc")
+    widths = WidthTable(load_glyph_index(str(font_path)).values())
+    lines = split_lines("#3Cab#E[5]\\nabc#K")
+    assert lines == ["ab", "abc"]
+    assert [widths.line_width(line) for line in lines] == [20, 30]
@@ -0,0 +1,51 @@
+import os
+import sys
+import subprocess
+
+import pytest
+
+#Every CLI run and every py2dat subprocess starts a fresh interpreter, so heavy modules
+#(cipher, zstd, command tables) must only be loaded by the code paths that use them.
+#Each check imports a module in a clean "python -X importtime" process and looks at what got loaded.
+
+KUROTOOLS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+CLI_MODULES = [
+    "dat2py",
+    "tbl2json",
+    "dat2py_batch",
+    "py2dat_batch",
+    "dat_patch_batch",
+]
+
+def imported_modules(module):
+    """{module name: cumulative import time in us} of everything "import module" loads."""
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                            cwd=KUROTOOLS_DIR, capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
+    modules = {}
+    #Format: "import time: self [us] | cumulative | imported package"
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        modules[name.strip()] = int(cumulative)
+    return modules
+
+def test_processcle_does_not_load_cipher_or_zstandard():
+    modules = imported_modules("processcle")
+    assert "processcle" in modules
+    assert "lib.blowfish" not in modules
+    assert "zstandard" not in modules
+
+def test_instruction_set_does_not_load_command_tables():
+    modules = imported_modules("disasm.ED9InstructionsSet")
+    assert "disasm.ED9InstructionsSet" in modules
+    assert "disasm.ED9Commands" not in modules
+
+@pytest.mark.parametrize("module", CLI_MODULES)
+def test_cli_does_not_load_zstandard(module):
+    modules = imported_modules(module)
+    assert module in modules
+    assert "zstandard" not in modules
+    assert "lib.p3a" not in modules
@@ -0,0 +1,67 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from lib.xliff_reader import load_trans_units, read_file_attributes
+from lib.xliff_writer import XliffWriter
+import translation_memory
+from translation_memory import TranslationMemory, fill_empty_targets
+
+def write_xliff(path, units):
+    with XliffWriter(str(path), original="t_text.json", datatype="plaintext") as writer:
+        for unit_id, source, target, target_attributes in units:
+            writer.write_unit(unit_id, source, target, note=f"File: {unit_id}.json", target_attributes=target_attributes)
+
+def test_default_db_path_is_shared(monkeypatch, tmp_path):
+    monkeypatch.delenv(translation_memory.TM_DB_ENV, raising=False)
+    assert translation_memory.default_db_path() == os.path.expanduser(translation_memory.TM_DB_FILE)
+    db_path = str(tmp_path / "shared" / "tm.db")
+    monkeypatch.setenv(translation_memory.TM_DB_ENV, db_path)
+    assert translation_memory.default_db_path() == db_path
+    with TranslationMemory() as tm:
+        assert tm.db_path == db_path
+    assert os.path.exists(db_path)
+
+def test_pretranslate_fills_only_empty_targets_in_place(tmp_path):
+    translated = tmp_path / "old.xliff"
+    write_xliff(translated, [("a", "Yes", "Да", None), ("b", "Close", "Закрыть", None)])
+    xliff = tmp_path / "new.xliff"
+    write_xliff(xliff, [
+        ("1", "Yes", "", None),
+        ("2", "Close", "Закрыть окно", {"state": "translated"}),
+        ("3", "Unknown text", "", None),
+        ("4", "Close", "", None),
+    ])
+
+    with TranslationMemory(str(tmp_path / "tm.db")) as tm:
+        tm.import_xliff(str(translated))
+        filled, empty = tm.pretranslate(str(xliff), str(xliff))
+
+    assert (filled, empty) == (2, 3)
+    assert not os.path.exists(str(xliff) + ".tmp")
+    assert read_file_attributes(str(xliff))["original"] == "t_text.json"
+    units = load_trans_units(str(xliff))
+    assert list(units) == ["1", "2", "3", "4"]
+    assert units["1"].target == "Да"
+    assert units["1"].target_attributes == {"state-qualifier": "exact-match"}
+    assert units["2"].target == "Закрыть окно"
+    assert units["2"].target_attributes == {"state": "translated"}
+    assert units["3"].target is None
+    assert units["4"].target == "Закрыть"
+    assert all(unit.note == f"File: {unit_id}.json" for unit_id, unit in units.items())
+
+def test_fill_keeps_source_file_on_error(tmp_path):
+    xliff = tmp_path / "new.xliff"
+    write_xliff(xliff, [("1", "Yes", "", None)])
+    before = xliff.read_bytes()
+
+    def find_translations(sources):
+        raise RuntimeError("lookup failed")
+
+    with pytest.raises(RuntimeError):
+        fill_empty_targets(str(xliff), str(xliff), find_translations)
+    assert xliff.read_bytes() == before
+    assert not os.path.exists(str(xliff) + ".tmp")
@@ -0,0 +1,62 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from lib.xliff_reader import load_trans_units
+from lib.xliff_writer import XliffWriter, load_previous_xliff
+
+PREVIOUS_XLIFF = """<?xml version="1.0" encoding="utf-8"?>
+<xliff version="1.2" xmlns="urn:oasis:names:tc:xliff:document:1.2">
+  <file original="t.json" source_language="en" target_language="ru">
+    <body>
+      <trans-unit id="a">
+        <note>Повторов: 3</note>
+        <source>Hello</source>
+        <target approved="yes" state="signed-off">Привет</target>
+      </trans-unit>
+      <trans-unit id="b" approved="yes">
+        <note>Комментарий переводчика</note>
+        <source>Bye</source>
+        <target>Пока</target>
+      </trans-unit>
+      <trans-unit id="c">
+        <source>New</source>
+        <target/>
+      </trans-unit>
+    </body>
+  </file>
+</xliff>
+"""
+
+def test_merge_keeps_target_attributes(tmp_path):
+    previous_path = tmp_path / "old.xliff"
+    previous_path.write_text(PREVIOUS_XLIFF, encoding="utf-8")
+    previous_units = load_previous_xliff(str(previous_path), generated_note_prefix="Повторов:")
+
+    output_path = tmp_path / "new.xliff"
+    with XliffWriter(str(output_path), original="t.json", previous_units=previous_units) as writer:
+        writer.write_unit("a", "Hello", note="Повторов: 2")
+        writer.write_unit("b", "Bye", target_attributes={"state-qualifier": "exact-match"})
+        writer.write_unit("c", "New")
+    assert writer.carried == 2
+
+    units = load_trans_units(str(output_path))
+    assert units["a"].target == "Привет"
+    assert units["a"].target_attributes == {"approved": "yes", "state": "signed-off"}
+    assert units["a"].attributes == {}
+    assert units["a"].note == "Повторов: 2"
+    # Отметка на <trans-unit> из старых файлов переносится на <target>, где ее читает редактор
+    assert units["b"].target_attributes == {"approved": "yes", "state-qualifier": "exact-match"}
+    assert units["b"].attributes == {}
+    assert units["b"].note == "Комментарий переводчика"
+    assert units["c"].target is None
+    assert units["c"].target_attributes == {}
+
+def test_unreadable_previous_xliff_is_reported(tmp_path):
+    assert load_previous_xliff(str(tmp_path / "missing.xliff")) is None
+    broken = tmp_path / "broken.xliff"
+    broken.write_text("<xliff><file>", encoding="utf-8")
+    errors = []
+    assert load_previous_xliff(str(broken), on_error=errors.append) is None
+    assert len(errors) == 1
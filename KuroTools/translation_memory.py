@@ -0,0 +1,246 @@
+import os
+import sys
+import time
+import shutil
+import sqlite3
+import argparse
+import xml.etree.ElementTree as ET
+from lib.xliff_reader import iter_trans_units, read_file_attributes
+from lib.xliff_writer import XliffWriter, content_hash
+try:
+    import colorama
+    colorama.init(autoreset=True)
+    Fore = colorama.Fore
+    Style = colorama.Style
+except ImportError:
+    class DummyStyle:
+        def __getattr__(self, name): return ""
+    Fore = Style = DummyStyle()
+
+# Память переводов (TM) на SQLite: общие строки интерфейса и имена повторяются между играми (Kuro, Cold Steel 2),
+# поэтому переводы из любого переведенного XLIFF складываются в одну базу и подставляются в новые файлы.
+
+# --- Конфигурация ---
+TM_DB_ENV = "KUROTRANSLATE_TM_DB"    # Переменная окружения с путем к базе (если задана)
+TM_DB_FILE = os.path.join("~", ".kurotranslate", "translation_memory.db") # База по умолчанию: одна на пользователя, общая для Kuro и Cold Steel
+INSERT_BATCH_SIZE = 5000             # Строк на один executemany при импорте
+# --------------------
+
+# Одна запись на пару (исходник, перевод): у одного исходника может быть несколько вариантов перевода.
+# Первичный ключ (source_hash, target) - это и индекс поиска по хешу исходника.
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS tm (
+    source_hash TEXT NOT NULL,
+    source TEXT NOT NULL,
+    target TEXT NOT NULL,
+    approved INTEGER NOT NULL DEFAULT 0,
+    origin TEXT,
+    updated REAL NOT NULL,
+    PRIMARY KEY (source_hash, target)
+) WITHOUT ROWID;
+"""
+
+# Лучший вариант: подтвержденный, затем самый свежий
+BEST_MATCH_ORDER = "t.approved DESC, t.updated DESC"
+
+def source_key(source):
+    """Хеш исходного текста в том виде, как он записан в XLIFF (\\n не раскрывается, пробелы по краям не учитываются)."""
+    return content_hash(source.strip())
+
+def default_db_path():
+    """Путь к общей базе: из переменной TM_DB_ENV, иначе TM_DB_FILE в папке пользователя."""
+    return os.path.expanduser(os.environ.get(TM_DB_ENV) or TM_DB_FILE)
+
+def is_empty_target(unit):
+    return bool(unit.source and unit.source.strip()) and not (unit.target and unit.target.strip())
+
+def fill_empty_targets(xliff_path, output_path, find_translations):
+    """
+    Заполняет пустые <target> XLIFF. find_translations(sources) получает исходники всех пустых юнитов
+    одним списком и возвращает {индекс: (перевод, атрибуты <target>)}.
+    Файл читается потоково в два прохода: в памяти только исходники пустых юнитов, а не дерево документа.
+    Возвращает (кол-во заполненных, кол-во пустых).
+    """
+    sources = [unit.source for unit in iter_trans_units(xliff_path) if is_empty_target(unit)]
+    translations = find_translations(sources)
+
+    # Запись во временный файл: output_path может совпадать с xliff_path, который еще читается
+    file_attributes = read_file_attributes(xliff_path)
+    temp_path = output_path + ".tmp"
+    try:
+        with XliffWriter(temp_path, original=file_attributes.get("original"),
+                         source_language=file_attributes.get("source_language", "en"),
+                         target_language=file_attributes.get("target_language", "ru"),
+                         datatype=file_attributes.get("datatype")) as writer:
+            idx = 0
+            for unit in iter_trans_units(xliff_path):
+                target, target_attributes = unit.target, unit.target_attributes
+                if is_empty_target(unit):
+                    if idx in translations:
+                        target, attributes = translations[idx]
+                        target_attributes = {**target_attributes, **attributes}
+                    idx += 1
+                writer.write_unit(unit.id, unit.source or "", target or "", unit.note,
+                                  unit.attributes, target_attributes)
+        os.replace(temp_path, output_path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+    return len(translations), len(sources)
+
+class TranslationMemory(object):
+    def __init__(self, db_path = None):
+        self.db_path = db_path or default_db_path()
+        os.makedirs(os.path.dirname(os.path.abspath(self.db_path)), exist_ok=True)
+        self.conn = sqlite3.connect(self.db_path)
+        self.conn.executescript(SCHEMA)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
+
+    def close(self):
+        if self.conn is not None:
+            self.conn.close()
+            self.conn = None
+
+    def import_xliff(self, xliff_path):
+        """Добавляет в память все переведенные юниты XLIFF (потоково). Возвращает кол-во прочитанных переводов."""
+        origin = os.path.basename(xliff_path)
+        now = time.time()
+        sql = ("INSERT INTO tm (source_hash, source, target, approved, origin, updated) VALUES (?, ?, ?, ?, ?, ?) "
+               "ON CONFLICT (source_hash, target) DO UPDATE SET approved = max(approved, excluded.approved), "
+               "origin = excluded.origin, updated = excluded.updated")
+        count = 0
+        batch = []
+        with self.conn:
+            for unit in iter_trans_units(xliff_path):
+                if not unit.source or not unit.source.strip() or not unit.target or not unit.target.strip():
+                    continue
+                batch.append((source_key(unit.source), unit.source.strip(), unit.target.strip(), int(unit.approved), origin, now))
+                if len(batch) >= INSERT_BATCH_SIZE:
+                    self.conn.executemany(sql, batch)
+                    count += len(batch)
+                    batch.clear()
+            if batch:
+                self.conn.executemany(sql, batch)
+                count += len(batch)
+        return count
+
+    def lookup(self, source):
+        """Точные совпадения для одного исходника: [(перевод, approved, файл-источник)], лучший первым."""
+        if not source or not source.strip():
+            return []
+        rows = self.conn.execute(f"SELECT t.target, t.approved, t.origin FROM tm t WHERE t.source_hash = ? ORDER BY {BEST_MATCH_ORDER}",
+                                 (source_key(source),))
+        return [(target, bool(approved), origin) for target, approved, origin in rows]
+
+    def best_matches(self, sources):
+        """
+        Лучший точный перевод для каждого исходника из списка: {индекс: перевод}.
+        Все исходники проверяются одним JOIN по индексу хешей, а не отдельным запросом на строку.
+        """
+        self.conn.execute("CREATE TEMP TABLE IF NOT EXISTS pending (idx INTEGER PRIMARY KEY, source_hash TEXT NOT NULL)")
+        self.conn.execute("DELETE FROM pending")
+        self.conn.executemany("INSERT INTO pending (idx, source_hash) VALUES (?, ?)",
+                              ((i, source_key(source)) for i, source in enumerate(sources)))
+        matches = {}
+        rows = self.conn.execute("SELECT p.idx, t.target FROM pending p JOIN tm t ON t.source_hash = p.source_hash "
+                                 f"ORDER BY p.idx, {BEST_MATCH_ORDER}")
+        for idx, target in rows:
+            matches.setdefault(idx, target)
+        self.conn.execute("DELETE FROM pending")
+        return matches
+
+    def pretranslate(self, xliff_path, output_path):
+        """
+        Заполняет пустые <target> точными совпадениями из памяти. Подставленные переводы помечаются
+        state-qualifier="exact-match", чтобы их можно было отличить при вычитке.
+        Возвращает (кол-во заполненных, кол-во пустых).
+        """
+        def find_translations(sources):
+            return {idx: (translation, {"state-qualifier": "exact-match"})
+                    for idx, translation in self.best_matches(sources).items()}
+        return fill_empty_targets(xliff_path, output_path, find_translations)
+
+    def best_entries(self):
+        """(исходник, лучший перевод) для каждого исходника памяти."""
+        last_hash = None
+        rows = self.conn.execute(f"SELECT t.source_hash, t.source, t.target FROM tm t ORDER BY t.source_hash, {BEST_MATCH_ORDER}")
+        for source_hash, source, target in rows:
+            if source_hash != last_hash:
+                last_hash = source_hash
+                yield source, target
+
+    def signature(self):
+        """Меняется при каждом импорте: по ней проверяются построенные из памяти кэши."""
+        return tuple(self.conn.execute("SELECT count(*), max(updated) FROM tm").fetchone())
+
+    def stats(self):
+        entries, sources, approved = self.conn.execute(
+            "SELECT count(*), count(DISTINCT source_hash), coalesce(sum(approved), 0) FROM tm").fetchone()
+        origins = self.conn.execute("SELECT origin, count(*) FROM tm GROUP BY origin ORDER BY count(*) DESC").fetchall()
+        return {"entries": entries, "sources": sources, "approved": approved, "origins": origins}
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Память переводов (SQLite): импорт переведенных XLIFF, поиск и предзаполнение пустых переводов.")
+    parser.add_argument("--db", default=None, help=f"Файл базы. По умолчанию: переменная {TM_DB_ENV} или {TM_DB_FILE}.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    import_parser = subparsers.add_parser("import", help="Добавить переводы из XLIFF в память.")
+    import_parser.add_argument("xliff_files", nargs="+", help="Переведенные XLIFF файлы.")
+
+    pretranslate_parser = subparsers.add_parser("pretranslate", help="Заполнить пустые <target> точными совпадениями.")
+    pretranslate_parser.add_argument("xliff_file", help="XLIFF для предзаполнения.")
+    pretranslate_parser.add_argument("-o", "--output", default=None, help="Выходной файл. По умолчанию входной файл перезаписывается (с копией .bak).")
+
+    lookup_parser = subparsers.add_parser("lookup", help="Найти переводы строки.")
+    lookup_parser.add_argument("text", help="Исходный текст (как в XLIFF, переносы строк как \\n).")
+
+    subparsers.add_parser("stats", help="Статистика памяти.")
+
+    args = parser.parse_args()
+
+    with TranslationMemory(args.db) as tm:
+        if args.command == "import":
+            failed = False
+            for xliff_file in args.xliff_files:
+                start_time = time.time()
+                try:
+                    count = tm.import_xliff(xliff_file)
+                except (OSError, ET.ParseError) as e:
+                    print(f"{Fore.RED}Ошибка при чтении '{xliff_file}': {e}{Style.RESET_ALL}")
+                    failed = True
+                    continue
+                print(f"{Fore.GREEN}{xliff_file}: импортировано переводов: {count} ({time.time() - start_time:.2f} сек.){Style.RESET_ALL}")
+            sys.exit(1 if failed else 0)
+
+        elif args.command == "pretranslate":
+            output_path = args.output or args.xliff_file
+            start_time = time.time()
+            try:
+                if output_path == args.xliff_file:
+                    shutil.copy2(args.xliff_file, args.xliff_file + ".bak")
+                filled, empty = tm.pretranslate(args.xliff_file, output_path)
+            except (OSError, ET.ParseError) as e:
+                print(f"{Fore.RED}Ошибка при обработке '{args.xliff_file}': {e}{Style.RESET_ALL}")
+                sys.exit(1)
+            print(f"{Fore.GREEN}Заполнено из памяти: {filled} из {empty} пустых переводов ({time.time() - start_time:.2f} сек.){Style.RESET_ALL}")
+            print(f"{Fore.CYAN}Результат сохранен в: {Style.BRIGHT}{output_path}{Style.RESET_ALL}")
+
+        elif args.command == "lookup":
+            matches = tm.lookup(args.text)
+            if not matches:
+                print(f"{Fore.YELLOW}Совпадений нет.{Style.RESET_ALL}")
+            for target, approved, origin in matches:
+                print(f"{'[approved] ' if approved else ''}{target}  {Style.DIM}({origin}){Style.RESET_ALL}")
+
+        elif args.command == "stats":
+            stats = tm.stats()
+            print(f"Записей: {stats['entries']}, уникальных исходников: {stats['sources']}, подтвержденных: {stats['approved']}")
+            for origin, count in stats["origins"]:
+                print(f"  {origin}: {count}")